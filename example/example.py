@@ -26,6 +26,7 @@ from bashi.utils import (
 )
 from bashi.printer import add_print_row_nice_version_alias
 from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.scheduler import get_runner_tags
 from bashi.types import (
     ParameterValue,
     ParameterValuePair,
@@ -360,14 +361,8 @@ def create_yaml(combination_list: CombinationList):
         job_yaml += "  script:\n"
         job_yaml += "    - ./run_tests.sh\n"
         job_yaml += "  tags:\n"
-        if comb[ALPAKA_ACC_ONEAPI_GPU_ENABLE].version == ON_VER:
-            job_yaml += "    - intel-gpu-runner\n"
-        elif comb[ALPAKA_ACC_GPU_HIP_ENABLE].version == ON_VER:
-            job_yaml += "    - amd-gpu-runner\n"
-        elif comb[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER:
-            job_yaml += "    - nvidia-gpu-runner\n"
-        else:
-            job_yaml += "    - cpu-runner\n"
+        for tag in get_runner_tags(comb):
+            job_yaml += f"    - {tag}\n"
 
         job_yaml += "\n"
 
@@ -0,0 +1,95 @@
+"""Measures the import time of bashi and bashi-validate with `python -X importtime`.
+
+Usage: python example/import_time.py [-n REPETITIONS] [-t TOP] [MODULE ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class ImportTime:
+    """Import time of a single module in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_time(output: str) -> List[ImportTime]:
+    """Parse the output of `python -X importtime`.
+
+    Args:
+        output (str): stderr of the python interpreter
+
+    Returns:
+        List[ImportTime]: import time of each module in order of the output
+    """
+    import_times: List[ImportTime] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        # skip header line
+        if not fields[0].strip().isdigit():
+            continue
+        import_times.append(
+            ImportTime(
+                name=fields[2].strip(),
+                self_us=int(fields[0].strip()),
+                cumulative_us=int(fields[1].strip()),
+            )
+        )
+    return import_times
+
+
+def measure_import(module: str) -> List[ImportTime]:
+    """Import a module in a new interpreter and returns the import time of all loaded modules.
+
+    Args:
+        module (str): name of the module
+
+    Returns:
+        List[ImportTime]: import time of each module
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_time(process.stderr)
+
+
+def main():
+    """Entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description="Measures the import time of python modules.")
+    parser.add_argument("modules", nargs="*", default=["bashi", "bashiValidate"])
+    parser.add_argument("-n", "--repetitions", type=int, default=5)
+    parser.add_argument("-t", "--top", type=int, default=10, help="show the slowest modules")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        totals: List[int] = []
+        import_times: Dict[str, ImportTime] = {}
+        for _ in range(args.repetitions):
+            measured = measure_import(module)
+            import_times = {import_time.name: import_time for import_time in measured}
+            totals.append(import_times[module].cumulative_us)
+
+        print(
+            f"{module}: median {statistics.median(totals) / 1000:.1f} ms, "
+            f"min {min(totals) / 1000:.1f} ms ({len(import_times)} modules loaded)"
+        )
+        for import_time in sorted(
+            import_times.values(), key=lambda import_time: import_time.self_us, reverse=True
+        )[: args.top]:
+            print(f"  {import_time.self_us / 1000:8.1f} ms  {import_time.name}")
+
+
+if __name__ == "__main__":
+    main()
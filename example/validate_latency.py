@@ -0,0 +1,116 @@
+"""Measures the end-to-end latency of `bashi-validate` for a typical row. Each repetition starts a
+new interpreter, like a user or a script calling the tool. The start-up time of an empty
+interpreter is measured too, because it is the lower limit for the latency.
+
+Usage: python example/validate_latency.py [-n REPETITIONS] [--target MS] [-- ARGS ...]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+TYPICAL_ROW: List[str] = [
+    "--host-compiler",
+    "gcc@12",
+    "--device-compiler",
+    "nvcc@12.4",
+    "--alpaka_ACC_GPU_CUDA_ENABLE",
+    "12.4",
+    "--alpaka_ACC_CPU_B_SEQ_T_SEQ_ENABLE",
+    "ON",
+    "--ubuntu",
+    "22.04",
+    "--cxx",
+    "17",
+]
+
+# prints the time of the phases of bashi-validate in seconds as JSON
+PHASES_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import bashiValidate
+from bashi import VersionRelation
+validator_class = bashiValidate.Validator
+imported = time.perf_counter()
+validator = validator_class(VersionRelation(), args=sys.argv[1:], silent=True)
+constructed = time.perf_counter()
+validator.validate()
+validated = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "construct": constructed - imported,
+    "validate": validated - constructed,
+}))
+"""
+
+
+def measure_process(command: List[str]) -> float:
+    """Run a command and returns the wall time in seconds.
+
+    Args:
+        command (List[str]): command
+
+    Returns:
+        float: wall time
+    """
+    start = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - start
+
+
+def measure_phases(row: List[str]) -> Dict[str, float]:
+    """Measure the time of the import, the construction of the validator and the validation of the
+    row in a new interpreter.
+
+    Args:
+        row (List[str]): arguments of bashi-validate
+
+    Returns:
+        Dict[str, float]: time of each phase in seconds
+    """
+    process = subprocess.run(
+        [sys.executable, "-c", PHASES_SCRIPT, *row], capture_output=True, text=True, check=True
+    )
+    return json.loads(process.stdout)
+
+
+def main():
+    """Entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description="Measures the latency of bashi-validate.")
+    parser.add_argument("-n", "--repetitions", type=int, default=10)
+    parser.add_argument(
+        "--target", type=float, default=100.0, help="target latency in ms. Default: 100 ms."
+    )
+    parser.add_argument("row", nargs="*", default=TYPICAL_ROW, help="arguments of bashi-validate")
+    args = parser.parse_args()
+
+    interpreter: List[float] = []
+    end_to_end: List[float] = []
+    phases: Dict[str, List[float]] = {}
+    for _ in range(args.repetitions):
+        interpreter.append(measure_process([sys.executable, "-c", "pass"]))
+        end_to_end.append(
+            measure_process([sys.executable, "-m", "bashiValidate.validate", *args.row])
+        )
+        for phase, duration in measure_phases(args.row).items():
+            phases.setdefault(phase, []).append(duration)
+
+    latency = statistics.median(end_to_end) * 1000
+    startup = statistics.median(interpreter) * 1000
+    print(f"bashi-validate {' '.join(args.row)}")
+    print(f"  end-to-end:        median {latency:7.1f} ms, min {min(end_to_end) * 1000:7.1f} ms")
+    print(f"  empty interpreter: median {startup:7.1f} ms")
+    for phase, durations in phases.items():
+        print(f"  {phase + ':':18} median {statistics.median(durations) * 1000:7.1f} ms")
+    print(
+        f"  target {args.target:.0f} ms: {'PASS' if latency <= args.target else 'FAIL'} "
+        f"({latency - startup:.1f} ms above the empty interpreter)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
-"""The bashi module."""
+"""The bashi module.
+
+The types and global constants are imported directly. All other exports are loaded on first
+access via the module level `__getattr__`, because the generator, the filters and the result
+modules pull in heavy dependencies like `covertable`, `typeguard` and `termcolor`. Therefore,
+`import bashi` is cheap and tools like bashi-validate pay only for the parts they use.
+"""
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List
+
 
 from bashi.types import (
     Parameter,
@@ -11,6 +22,9 @@ from bashi.types import (
     ParameterValueTuple,
     Combination,
     CombinationList,
+    CostModel,
+    DurationModel,
+    PairPriority,
     ParsableValueVersion,
     RegularParsableParameterSingle,
     CompilerParsableParameterSingle,
@@ -54,36 +68,150 @@ from bashi.globals import (
     PARAMETERS,
     RT_AVAILABLE_HIP_SDK_UBUNTU_VER,
     RT_AVAILABLE_CUDA_SDK_UBUNTU_VER,
+    RT_UBUNTU_HIP_SDK_SUPPORT,
+    RT_UBUNTU_CUDA_SDK_SUPPORT,
     FilterDebugMode,
 )
-from bashi.version.utils import get_parameter_value_matrix
-from bashi.version.relation import VersionRelation
-from bashi.generator import get_runtime_infos, generate_combination_list
-from bashi.utils import (
-    check_parameter_value_pair_in_combination_list,
-    check_unexpected_parameter_value_pair_in_combination_list,
-    remove_parameter_value_pairs,
-    remove_parameter_value_pairs_ranges,
-    parse_value_version,
-    parse_parameter_single,
-    parse_combination,
-)
-from bashi.printer import (
-    get_str_row_nice,
-    print_row_nice,
-    add_print_row_nice_parameter_alias,
-    add_print_row_nice_version_alias,
-    ubuntu_version_to_string,
-    on_off_ver_to_str,
-)
-from bashi.filter_base import FilterBase
-from bashi.results import get_expected_bashi_parameter_value_pairs
-from bashi.row import BashiRow
-from bashi.filter_utils import all_backends_fine, get_valid_compiler_backend_combinations
-from bashi.result_modules.custom_verifier import (
-    remove_unsupported_compiler_backend_combinations,
-    remove_unsupported_backend_combinations,
-)
+
+if TYPE_CHECKING:
+    from bashi.version.utils import get_parameter_value_matrix, get_frozen_parameter_value_matrix
+    from bashi.frozen_matrix import FrozenParameterValueMatrix
+    from bashi.value_registry import ParameterValueRegistry, CompactRow
+    from bashi.columnar import ColumnarCombinationList
+    from bashi.serialization import write_combination_list, read_combination_list
+    from bashi.version.relation import VersionRelation
+    from bashi.generator import (
+        get_runtime_infos,
+        generate_combination_list,
+        generate_combination_list_with_deadline,
+        prune_parameter_value_matrix,
+        get_parameter_rejection_rates,
+        order_parameters_by_constraint,
+        AnytimeResult,
+    )
+    from bashi.forbidden_pairs import ForbiddenPairFilter, LookaheadFilter
+    from bashi.counting import count_valid_combinations
+    from bashi.minimize import minimize_combination_list
+    from bashi.decomposition import generate_decomposed_combination_list, get_parameter_groups
+    from bashi.strength import (
+        generate_mixed_strength_combination_list,
+        get_missing_parameter_value_tuples,
+    )
+    from bashi.local_search import optimize_combination_list
+    from bashi.priority import (
+        generate_priority_ordered_combination_list,
+        get_coverage_curve,
+        get_newest_version_weights,
+        get_pair_priority,
+        order_by_priority,
+    )
+    from bashi.scheduler import (
+        RunnerPool,
+        get_makespan,
+        get_runner_tags,
+        learn_duration_model,
+        schedule_combination_list,
+    )
+    from bashi.ordering import (
+        DEFAULT_LOCALITY_KEYS,
+        get_locality_switches,
+        order_combination_list,
+    )
+    from bashi.cost import (
+        generate_cost_weighted_combination_list,
+        get_gpu_runner_cost_model,
+        get_combination_list_cost,
+    )
+    from bashi.utils import (
+        check_parameter_value_pair_in_combination_list,
+        check_unexpected_parameter_value_pair_in_combination_list,
+        remove_parameter_value_pairs,
+        remove_parameter_value_pairs_ranges,
+        parse_value_version,
+        parse_parameter_single,
+        parse_combination,
+    )
+    from bashi.printer import (
+        get_str_row_nice,
+        print_row_nice,
+        add_print_row_nice_parameter_alias,
+        add_print_row_nice_version_alias,
+        ubuntu_version_to_string,
+        on_off_ver_to_str,
+    )
+    from bashi.filter_base import FilterBase
+    from bashi.results import get_expected_bashi_parameter_value_pairs
+    from bashi.row import BashiRow
+    from bashi.filter_utils import all_backends_fine, get_valid_compiler_backend_combinations
+    from bashi.result_modules.custom_verifier import (
+        remove_unsupported_compiler_backend_combinations,
+        remove_unsupported_backend_combinations,
+    )
+
+# maps the lazy loaded exports to the module, which contains it
+_LAZY_EXPORTS: Dict[str, str] = {
+    "get_parameter_value_matrix": "bashi.version.utils",
+    "get_frozen_parameter_value_matrix": "bashi.version.utils",
+    "FrozenParameterValueMatrix": "bashi.frozen_matrix",
+    "ParameterValueRegistry": "bashi.value_registry",
+    "CompactRow": "bashi.value_registry",
+    "ColumnarCombinationList": "bashi.columnar",
+    "write_combination_list": "bashi.serialization",
+    "read_combination_list": "bashi.serialization",
+    "VersionRelation": "bashi.version.relation",
+    "get_runtime_infos": "bashi.generator",
+    "generate_combination_list": "bashi.generator",
+    "generate_combination_list_with_deadline": "bashi.generator",
+    "prune_parameter_value_matrix": "bashi.generator",
+    "get_parameter_rejection_rates": "bashi.generator",
+    "order_parameters_by_constraint": "bashi.generator",
+    "AnytimeResult": "bashi.generator",
+    "ForbiddenPairFilter": "bashi.forbidden_pairs",
+    "LookaheadFilter": "bashi.forbidden_pairs",
+    "count_valid_combinations": "bashi.counting",
+    "minimize_combination_list": "bashi.minimize",
+    "generate_decomposed_combination_list": "bashi.decomposition",
+    "get_parameter_groups": "bashi.decomposition",
+    "generate_mixed_strength_combination_list": "bashi.strength",
+    "get_missing_parameter_value_tuples": "bashi.strength",
+    "optimize_combination_list": "bashi.local_search",
+    "DEFAULT_LOCALITY_KEYS": "bashi.ordering",
+    "generate_priority_ordered_combination_list": "bashi.priority",
+    "get_coverage_curve": "bashi.priority",
+    "get_newest_version_weights": "bashi.priority",
+    "get_pair_priority": "bashi.priority",
+    "order_by_priority": "bashi.priority",
+    "RunnerPool": "bashi.scheduler",
+    "get_makespan": "bashi.scheduler",
+    "get_runner_tags": "bashi.scheduler",
+    "learn_duration_model": "bashi.scheduler",
+    "schedule_combination_list": "bashi.scheduler",
+    "get_locality_switches": "bashi.ordering",
+    "order_combination_list": "bashi.ordering",
+    "generate_cost_weighted_combination_list": "bashi.cost",
+    "get_gpu_runner_cost_model": "bashi.cost",
+    "get_combination_list_cost": "bashi.cost",
+    "check_parameter_value_pair_in_combination_list": "bashi.utils",
+    "check_unexpected_parameter_value_pair_in_combination_list": "bashi.utils",
+    "remove_parameter_value_pairs": "bashi.utils",
+    "remove_parameter_value_pairs_ranges": "bashi.utils",
+    "parse_value_version": "bashi.utils",
+    "parse_parameter_single": "bashi.utils",
+    "parse_combination": "bashi.utils",
+    "get_str_row_nice": "bashi.printer",
+    "print_row_nice": "bashi.printer",
+    "add_print_row_nice_parameter_alias": "bashi.printer",
+    "add_print_row_nice_version_alias": "bashi.printer",
+    "ubuntu_version_to_string": "bashi.printer",
+    "on_off_ver_to_str": "bashi.printer",
+    "FilterBase": "bashi.filter_base",
+    "get_expected_bashi_parameter_value_pairs": "bashi.results",
+    "BashiRow": "bashi.row",
+    "all_backends_fine": "bashi.filter_utils",
+    "get_valid_compiler_backend_combinations": "bashi.filter_utils",
+    "remove_unsupported_compiler_backend_combinations": "bashi.result_modules.custom_verifier",
+    "remove_unsupported_backend_combinations": "bashi.result_modules.custom_verifier",
+}
 
 __all__ = [
     "Parameter",
@@ -96,6 +224,9 @@ __all__ = [
     "ParameterValueTuple",
     "Combination",
     "CombinationList",
+    "CostModel",
+    "DurationModel",
+    "PairPriority",
     "ParsableValueVersion",
     "RegularParsableParameterSingle",
     "CompilerParsableParameterSingle",
@@ -137,10 +268,49 @@ __all__ = [
     "PARAMETERS",
     "RT_AVAILABLE_HIP_SDK_UBUNTU_VER",
     "RT_AVAILABLE_CUDA_SDK_UBUNTU_VER",
+    "RT_UBUNTU_HIP_SDK_SUPPORT",
+    "RT_UBUNTU_CUDA_SDK_SUPPORT",
     "get_parameter_value_matrix",
+    "get_frozen_parameter_value_matrix",
+    "FrozenParameterValueMatrix",
+    "ParameterValueRegistry",
+    "CompactRow",
+    "ColumnarCombinationList",
+    "write_combination_list",
+    "read_combination_list",
     "VersionRelation",
     "get_runtime_infos",
     "generate_combination_list",
+    "generate_combination_list_with_deadline",
+    "prune_parameter_value_matrix",
+    "get_parameter_rejection_rates",
+    "order_parameters_by_constraint",
+    "AnytimeResult",
+    "ForbiddenPairFilter",
+    "LookaheadFilter",
+    "count_valid_combinations",
+    "minimize_combination_list",
+    "generate_decomposed_combination_list",
+    "get_parameter_groups",
+    "generate_mixed_strength_combination_list",
+    "get_missing_parameter_value_tuples",
+    "optimize_combination_list",
+    "DEFAULT_LOCALITY_KEYS",
+    "generate_priority_ordered_combination_list",
+    "get_coverage_curve",
+    "get_newest_version_weights",
+    "get_pair_priority",
+    "order_by_priority",
+    "RunnerPool",
+    "get_makespan",
+    "get_runner_tags",
+    "learn_duration_model",
+    "schedule_combination_list",
+    "get_locality_switches",
+    "order_combination_list",
+    "generate_cost_weighted_combination_list",
+    "get_gpu_runner_cost_model",
+    "get_combination_list_cost",
     "check_parameter_value_pair_in_combination_list",
     "check_unexpected_parameter_value_pair_in_combination_list",
     "remove_parameter_value_pairs",
@@ -163,3 +333,17 @@ __all__ = [
     "remove_unsupported_compiler_backend_combinations",
     "remove_unsupported_backend_combinations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        # cache the value, so that __getattr__ is called only once per name
+        # globals() cannot be used, because the submodule bashi.globals shadows the builtin
+        setattr(sys.modules[__name__], name, value)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(vars(sys.modules[__name__]).keys()) | set(__all__))
@@ -0,0 +1,301 @@
+"""Column oriented container for combination-lists."""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    overload,
+)
+from bashi.types import Parameter, ParameterValue, Combination, CombinationList
+from bashi.value_registry import ParameterValueRegistry, CompactRow
+
+
+class ColumnarCombinationList(Sequence[Combination]):
+    """Stores a combination-list as one integer column per parameter. The integers are the ids of
+    a `ParameterValueRegistry`. All combinations need to contain the same parameters.
+
+    The container behaves like a read-only `CombinationList` plus `append()` and `extend()`.
+    Accessing a single row decodes it to a `Combination`. Selection, group-by and projection work
+    on the columns and the loops over the rows are done by the C implementation of `array`, `map`
+    and `Counter`.
+    """
+
+    def __init__(
+        self,
+        combination_list: Iterable[Mapping[Parameter, ParameterValue]] | None = None,
+        parameters: Iterable[Parameter] | None = None,
+        registry: ParameterValueRegistry | None = None,
+    ):
+        """Construct new ColumnarCombinationList.
+
+        Args:
+            combination_list (Iterable[Mapping[Parameter, ParameterValue]] | None, optional):
+                Combinations to add. Defaults to None.
+            parameters (Iterable[Parameter] | None, optional): Parameters of the columns. If None,
+                the parameters of the first added combination are used. Defaults to None.
+            registry (ParameterValueRegistry | None, optional): Registry to encode the
+                parameter-values. Can be shared between several containers. If None, a new
+                registry is created. Defaults to None.
+        """
+        self._registry = registry if registry is not None else ParameterValueRegistry()
+        self._columns: Dict[Parameter, array] = {}
+        self._size = 0
+        if parameters is not None:
+            self._init_columns(parameters)
+
+        if combination_list is not None:
+            self.extend(combination_list)
+
+    def _init_columns(self, parameters: Iterable[Parameter]):
+        self._columns = {param: array(self._registry.typecode) for param in parameters}
+
+    @property
+    def registry(self) -> ParameterValueRegistry:
+        """Returns the registry, which is used to encode the parameter-values.
+
+        Returns:
+            ParameterValueRegistry: registry
+        """
+        return self._registry
+
+    @property
+    def parameters(self) -> List[Parameter]:
+        """Returns the parameters in column order.
+
+        Returns:
+            List[Parameter]: list of parameters
+        """
+        return list(self._columns.keys())
+
+    def column(self, parameter: Parameter) -> array:
+        """Returns the column of ids of a parameter. The column must not be modified.
+
+        Args:
+            parameter (Parameter): name of the parameter
+
+        Returns:
+            array: ids of the parameter-values
+        """
+        return self._columns[parameter]
+
+    def append(self, combination: Mapping[Parameter, ParameterValue]):
+        """Append a combination.
+
+        Args:
+            combination (Mapping[Parameter, ParameterValue]): combination to add
+
+        Raises:
+            ValueError: if the combination does not contain the same parameters as the container
+        """
+        if not self._columns and self._size == 0:
+            self._init_columns(combination.keys())
+
+        if len(combination) != len(self._columns) or any(
+            param not in combination for param in self._columns
+        ):
+            raise ValueError(
+                f"Parameters of the combination {list(combination.keys())} does not match the "
+                f"parameters of the ColumnarCombinationList {self.parameters}"
+            )
+
+        for param, column in self._columns.items():
+            value_id = self._registry.register(param, combination[param])
+            if column.typecode != self._registry.typecode:
+                # the registry became too large for the short integer typecode
+                column = array(self._registry.typecode, column)
+                self._columns[param] = column
+            column.append(value_id)
+        self._size += 1
+
+    def extend(self, combination_list: Iterable[Mapping[Parameter, ParameterValue]]):
+        """Append several combinations.
+
+        Args:
+            combination_list (Iterable[Mapping[Parameter, ParameterValue]]): combinations to add
+        """
+        for comb in combination_list:
+            self.append(comb)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> Combination: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ColumnarCombinationList": ...
+
+    def __getitem__(self, index: int | slice) -> "Combination | ColumnarCombinationList":
+        if isinstance(index, slice):
+            return self.take(range(self._size)[index])
+        return self._registry.decode_combination(self.row_ids(index))
+
+    def __iter__(self) -> Iterator[Combination]:
+        decode = self._registry.decode_combination
+        return (decode(row_ids) for row_ids in zip(*self._columns.values()))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_combination_list()})"
+
+    def row_ids(self, index: int) -> Tuple[int, ...]:
+        """Returns the ids of the parameter-values of a single row.
+
+        Args:
+            index (int): index of the row
+
+        Returns:
+            Tuple[int, ...]: ids in column order
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ColumnarCombinationList index out of range")
+        return tuple(column[index] for column in self._columns.values())
+
+    def view(self, index: int) -> CompactRow:
+        """Returns a read-only dict-like view of a single row without decoding the row.
+
+        Args:
+            index (int): index of the row
+
+        Returns:
+            CompactRow: view of the row
+        """
+        return self._registry.view(self.row_ids(index))
+
+    def to_combination_list(self) -> CombinationList:
+        """Returns the content as `CombinationList`.
+
+        Returns:
+            CombinationList: decoded combination-list
+        """
+        return list(self)
+
+    def _new_like(self, columns: Dict[Parameter, array], size: int) -> "ColumnarCombinationList":
+        new_list = ColumnarCombinationList(registry=self._registry)
+        new_list._columns = columns  # pylint: disable=protected-access
+        new_list._size = size  # pylint: disable=protected-access
+        return new_list
+
+    def take(self, indices: Iterable[int]) -> "ColumnarCombinationList":
+        """Returns a new container with the given rows. The registry is shared.
+
+        Args:
+            indices (Iterable[int]): indices of the rows
+
+        Returns:
+            ColumnarCombinationList: new container
+        """
+        indices = list(indices)
+        return self._new_like(
+            {
+                param: array(column.typecode, map(column.__getitem__, indices))
+                for param, column in self._columns.items()
+            },
+            len(indices),
+        )
+
+    def select_indices(
+        self,
+        parameter: Parameter,
+        condition: ParameterValue | Callable[[ParameterValue], bool],
+    ) -> List[int]:
+        """Returns the indices of all rows, where the parameter-value of the parameter fulfills
+        the condition. The condition is evaluated only once per distinct parameter-value.
+
+        Args:
+            parameter (Parameter): name of the parameter
+            condition (ParameterValue | Callable[[ParameterValue], bool]): Either a
+                parameter-value, which needs to be equal or a function, which returns True for
+                the searched parameter-values.
+
+        Returns:
+            List[int]: indices of the matching rows
+        """
+        column = self._columns[parameter]
+        check: Callable[[ParameterValue], bool] = (
+            condition.__eq__ if isinstance(condition, ParameterValue) else condition
+        )
+        matching_ids = {
+            value_id
+            for value_id in set(column)
+            if check(self._registry.get_value(value_id).parameterValue)
+        }
+        return list(compress(range(self._size), map(matching_ids.__contains__, column)))
+
+    def select(
+        self,
+        parameter: Parameter,
+        condition: ParameterValue | Callable[[ParameterValue], bool],
+    ) -> "ColumnarCombinationList":
+        """Returns a new container with all rows, where the parameter-value of the parameter
+        fulfills the condition. The registry is shared.
+
+        Args:
+            parameter (Parameter): name of the parameter
+            condition (ParameterValue | Callable[[ParameterValue], bool]): Either a
+                parameter-value, which needs to be equal or a function, which returns True for
+                the searched parameter-values.
+
+        Returns:
+            ColumnarCombinationList: new container with the matching rows
+        """
+        return self.take(self.select_indices(parameter, condition))
+
+    def count_by(self, parameter: Parameter) -> Dict[ParameterValue, int]:
+        """Count the rows per parameter-value of a parameter.
+
+        Args:
+            parameter (Parameter): name of the parameter
+
+        Returns:
+            Dict[ParameterValue, int]: number of rows per parameter-value
+        """
+        return {
+            self._registry.get_value(value_id).parameterValue: number
+            for value_id, number in Counter(self._columns[parameter]).items()
+        }
+
+    def group_by(self, parameter: Parameter) -> Dict[ParameterValue, "ColumnarCombinationList"]:
+        """Split the rows by the parameter-value of a parameter. The ordering of the rows is kept
+        within each group. The registry is shared.
+
+        Args:
+            parameter (Parameter): name of the parameter
+
+        Returns:
+            Dict[ParameterValue, ColumnarCombinationList]: rows per parameter-value
+        """
+        groups: Dict[int, List[int]] = {}
+        for index, value_id in enumerate(self._columns[parameter]):
+            groups.setdefault(value_id, []).append(index)
+        return {
+            self._registry.get_value(value_id).parameterValue: self.take(indices)
+            for value_id, indices in groups.items()
+        }
+
+    def project(self, parameters: Iterable[Parameter]) -> "ColumnarCombinationList":
+        """Returns a new container, which contains only the given parameters in the given order.
+        The registry is shared.
+
+        Args:
+            parameters (Iterable[Parameter]): parameters to keep
+
+        Returns:
+            ColumnarCombinationList: new container
+        """
+        return self._new_like(
+            {
+                param: array(self._columns[param].typecode, self._columns[param])
+                for param in parameters
+            },
+            self._size,
+        )
@@ -0,0 +1,267 @@
+"""Generation of a combination-list, which minimises the total cost of the rows instead of the
+number of rows.
+
+Not all rows of a CI are equally expensive. For example, a row with an enabled GPU backend requires
+a scarce GPU runner, whereas a CPU only row can run on any runner. A cost model maps a combination
+to a weight. `generate_cost_weighted_combination_list()` covers all valid parameter-value-pairs
+and tries to minimise the sum of the weights. Therefore, as many parameter-value-pairs as possible
+are put on cheap rows and expensive rows are only used for the parameter-value-pairs, which
+require them.
+"""
+
+import itertools
+from typing import Callable, Dict, List, Mapping, Set, Tuple
+from covertable.exceptions import InvalidCondition  # type: ignore
+from bashi.types import (
+    CombinationList,
+    CostModel,
+    Parameter,
+    ParameterValue,
+    ParameterValueMatrix,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.filter_base import FilterBase
+from bashi.filter_chain import FilterChain
+from bashi.generator import (
+    SkipCoveredPairsSorter,
+    get_generator_filter_chain,
+    make_combination_list,
+    prune_parameter_value_matrix,
+)
+from bashi.row import BashiRow
+from bashi.minimize import select_greedy_set_cover
+from bashi.value_registry import ParameterValueRegistry
+from bashi.version.relation import VersionRelation
+
+
+def get_gpu_runner_cost_model(gpu_weight: float = 10.0, cpu_weight: float = 1.0) -> CostModel:
+    """Returns a cost model, which assigns `gpu_weight` to each row with an enabled CUDA or HIP
+    backend and `cpu_weight` to all other rows.
+
+    Args:
+        gpu_weight (float, optional): Weight of a row, which requires a GPU runner. Defaults to
+            10.0.
+        cpu_weight (float, optional): Weight of a row, which runs on a CPU runner. Defaults to 1.0.
+
+    Returns:
+        CostModel: cost model
+    """
+
+    def gpu_runner_cost_model(row: Mapping[Parameter, ParameterValue]) -> float:
+        for backend in (ALPAKA_ACC_GPU_CUDA_ENABLE, ALPAKA_ACC_GPU_HIP_ENABLE):
+            if backend in row and row[backend].version != OFF_VER:
+                return gpu_weight
+        return cpu_weight
+
+    return gpu_runner_cost_model
+
+
+def get_combination_list_cost(combination_list: CombinationList, cost_model: CostModel) -> float:
+    """Returns the sum of the weights of all combinations.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        cost_model (CostModel): cost model
+
+    Returns:
+        float: total cost
+    """
+    return sum(cost_model(comb) for comb in combination_list)
+
+
+# pylint: disable=too-few-public-methods
+class CostBoundFilter:
+    """Filter function for covertable, which rejects all (incomplete) rows whose weight is higher
+    than the bound. Afterwards, the filter chain is applied.
+    """
+
+    def __init__(self, filter_chain: FilterChain, cost_model: CostModel, bound: float):
+        """Create the filter.
+
+        Args:
+            filter_chain (FilterChain): bashi filter chain
+            cost_model (CostModel): cost model, which is also called with incomplete rows
+            bound (float): maximum weight of a row
+        """
+        self.filter_chain = filter_chain
+        self.cost_model = cost_model
+        self.bound = bound
+
+    def __call__(self, row: Dict[Parameter, ParameterValue]) -> bool:
+        return self.cost_model(BashiRow(row)) <= self.bound and self.filter_chain(row)
+
+
+def _get_cost_bounds(
+    parameter_value_matrix: ParameterValueMatrix, cost_model: CostModel
+) -> List[float]:
+    """Returns the weights of all single parameter-values in ascending order without the highest
+    weight. Each weight is used as bound for a generation pass, which only creates rows up to this
+    weight.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        cost_model (CostModel): cost model
+
+    Returns:
+        List[float]: cost bounds
+    """
+    weights: Set[float] = set()
+    for parameter, parameter_values in parameter_value_matrix.items():
+        for param_val in parameter_values:
+            weights.add(cost_model(BashiRow({parameter: param_val})))
+    return sorted(weights)[:-1]
+
+
+def _get_bounded_parameter_value_matrix(
+    parameter_value_matrix: ParameterValueMatrix, row_filter: CostBoundFilter
+) -> ParameterValueMatrix | None:
+    """Remove all parameter-values, which cannot be part of a row passing the filter, with
+    `prune_parameter_value_matrix()`. Without removing them, covertable starts rows which cannot
+    be completed.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (CostBoundFilter): filter including the cost bound
+
+    Returns:
+        ParameterValueMatrix | None: reduced parameter-value-matrix or None, if a parameter has no
+            parameter-value left
+    """
+    matrix = prune_parameter_value_matrix(parameter_value_matrix, row_filter)
+    if any(len(parameter_values) == 0 for parameter_values in matrix.values()):
+        return None
+    return matrix
+
+
+def _get_pairs(encoded_comb: List[int]) -> Set[Tuple[int, int]]:
+    """Returns all id pairs of an encoded combination.
+
+    Args:
+        encoded_comb (List[int]): combination encoded by a ParameterValueRegistry
+
+    Returns:
+        Set[Tuple[int, int]]: id pairs
+    """
+    return set(itertools.combinations(sorted(encoded_comb), 2))
+
+
+def select_cheapest_cover(candidates: CombinationList, cost_model: CostModel) -> CombinationList:
+    """Select a subset of the candidates, which covers the same parameter-value-pairs as all
+    candidates together, with a small total weight. The selection uses the greedy algorithm for the
+    weighted set cover problem: the candidate with the most uncovered parameter-value-pairs per
+    weight is selected until all parameter-value-pairs are covered. Afterwards, redundant
+    combinations are removed, starting with the most expensive one.
+
+    Args:
+        candidates (CombinationList): candidates
+        cost_model (CostModel): cost model
+
+    Raises:
+        ValueError: if the weight of a candidate is not positive
+
+    Returns:
+        CombinationList: selected combinations in the order of selection
+    """
+    registry = ParameterValueRegistry()
+    candidate_pairs: List[Set[Tuple[int, int]]] = []
+    weights: List[float] = []
+    for comb in candidates:
+        weight = cost_model(comb)
+        if weight <= 0:
+            raise ValueError(f"the weight of a combination needs to be positive: {weight}")
+        weights.append(weight)
+        candidate_pairs.append(_get_pairs(list(registry.encode_combination(comb))))
+
+    return [candidates[index] for index in select_greedy_set_cover(candidate_pairs, weights)]
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def generate_cost_weighted_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    cost_model: CostModel,
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+) -> CombinationList:
+    """Generate a combination-list from the parameter-value-matrix, which contains all valid
+    parameter-value-pairs at least one time and has a small total weight instead of a small number
+    of combinations.
+
+    Each cost bound is a tier. The bounds are the weights of the single parameter-values. Each tier
+    except the most expensive one only generates rows up to its bound, the most expensive tier is
+    the regular generation. The tiers are generated twice:
+
+    1. From the cheapest to the most expensive tier. Each tier covers only the
+       parameter-value-pairs, which are not covered by a cheaper tier. Therefore, a tier contains
+       only the parameter-value-pairs, which require it.
+    2. From the most expensive to the cheapest tier. Each tier skips the parameter-value-pairs,
+       which are covered by a more expensive tier or can be covered by a cheaper tier. Therefore,
+       the cheap tiers do not repeat parameter-value-pairs, which are covered anyway by the
+       expensive rows.
+
+    At the end, `select_cheapest_cover()` selects the rows of both passes. The rows of the first
+    pass are needed as candidates, because a cheap tier of the second pass can be empty, if the
+    bounded matrix cannot be completed.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        version_relation (VersionRelation): Provides information about the relationships between
+                the versions of various parameter-values. For example, which GCC version supports
+                which C++ standard.
+        runtime_infos (Dict[str, Callable[..., bool]]): Runtime infos created by
+            get_runtime_infos().
+        cost_model (CostModel): Returns the weight of a combination. The weight needs to be
+            positive. The cost model is also called with incomplete rows, which are wrapped in a
+            `BashiRow`, and should not decrease if parameters are added.
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+
+    Returns:
+        CombinationList: combination-list
+    """
+    filter_chain = get_generator_filter_chain(
+        version_relation, runtime_infos, custom_filter, debug_print
+    )
+
+    # bound, parameter-value-matrix and filter of each tier
+    tiers: List[Tuple[float, ParameterValueMatrix, Callable[..., bool]]] = []
+    for bound in _get_cost_bounds(parameter_value_matrix, cost_model):
+        row_filter = CostBoundFilter(filter_chain, cost_model, bound)
+        bounded_matrix = _get_bounded_parameter_value_matrix(parameter_value_matrix, row_filter)
+        # if bounded_matrix is None, at least one parameter has no parameter-value, which is cheap
+        # enough
+        if bounded_matrix is not None:
+            tiers.append((bound, bounded_matrix, row_filter))
+    tiers.append((float("inf"), parameter_value_matrix, filter_chain))
+
+    def make_tier(tier: int, covered_combinations: CombinationList) -> CombinationList:
+        _, matrix, row_filter = tiers[tier]
+        try:
+            return make_combination_list(
+                matrix, row_filter, SkipCoveredPairsSorter(matrix, covered_combinations)
+            )
+        except InvalidCondition:
+            # the pair-wise check of the bounded matrix does not find all rows, which cannot be
+            # completed
+            if tier == len(tiers) - 1:
+                raise
+            return []
+
+    forward: List[CombinationList] = []
+    for tier in range(len(tiers)):
+        forward.append(make_tier(tier, [comb for comb_list in forward for comb in comb_list]))
+
+    backward: Dict[int, CombinationList] = {len(tiers) - 1: forward[-1]}
+    for tier in reversed(range(len(tiers) - 1)):
+        covered = [comb for comb_list in backward.values() for comb in comb_list]
+        covered += [comb for comb_list in forward[:tier] for comb in comb_list]
+        backward[tier] = make_tier(tier, covered)
+
+    # the most expensive tier is the same in both passes
+    candidates = [comb for tier in sorted(backward) for comb in backward[tier]]
+    candidates += [comb for comb_list in forward[:-1] for comb in comb_list]
+    return select_cheapest_cover(candidates, cost_model)
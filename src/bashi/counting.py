@@ -0,0 +1,231 @@
+"""Count the valid combinations of a parameter-value-matrix exactly.
+
+The number of valid combinations is the reference for the savings of the pair-wise generation.
+Enumerating the cartesian product is not possible for the full parameter-value-matrix. The
+counter enumerates the parameters depth-first and prunes each partial row, which is rejected by
+the row filter. The number of valid completions of a partial row depends only on the
+parameter-values, which are read by the row filter during the completion. Therefore, the
+parameter-values are wrapped in `_TracedParameterValue` objects, which record the parameter of
+each read access. If another partial row has the same parameter-values for the recorded
+parameters, the stored number of completions is reused.
+"""
+
+import os
+from typing import Callable, Dict, List, Set, Tuple
+from bashi.types import Parameter, ParameterValue, ParameterValueMatrix
+
+# the worker processes are forked and inherit the counter, therefore the filter chain and the
+# runtime infos do not need to be pickled
+_WORKER_COUNTER: "_CombinationCounter | None" = None
+
+
+class _TracedParameterValue(ParameterValue):
+    """ParameterValue, which records the depth of its parameter, if the row filter reads it. Read
+    accesses are the access of `name` and `version` and all operations on the tuple."""
+
+    _depth: int
+    _accessed: Set[int]
+
+    # pylint: disable=signature-differs
+    def __new__(cls, param_val: ParameterValue, depth: int, accessed: Set[int]):
+        traced = super().__new__(cls, param_val.name, param_val.version)
+        object.__setattr__(traced, "_depth", depth)
+        object.__setattr__(traced, "_accessed", accessed)
+        return traced
+
+    def _record(self) -> None:
+        object.__getattribute__(self, "_accessed").add(object.__getattribute__(self, "_depth"))
+
+    def __getattribute__(self, name: str):
+        if name in ("name", "version"):
+            object.__getattribute__(self, "_record")()
+        return object.__getattribute__(self, name)
+
+    def __getitem__(self, index):
+        self._record()
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        self._record()
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self._record()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._record()
+        return super().__ne__(other)
+
+    def __lt__(self, other):
+        self._record()
+        return super().__lt__(other)
+
+    def __le__(self, other):
+        self._record()
+        return super().__le__(other)
+
+    def __gt__(self, other):
+        self._record()
+        return super().__gt__(other)
+
+    def __ge__(self, other):
+        self._record()
+        return super().__ge__(other)
+
+    def __hash__(self):
+        self._record()
+        return super().__hash__()
+
+
+class _CombinationCounter:
+    """Depth-first counter of the valid combinations with memoization of the number of valid
+    completions of a partial row."""
+
+    def __init__(
+        self, parameter_value_matrix: ParameterValueMatrix, row_filter: Callable[..., bool]
+    ):
+        self.row_filter = row_filter
+        self.parameters: List[Parameter] = list(parameter_value_matrix.keys())
+        self.accessed: Set[int] = set()
+        self.values: List[List[_TracedParameterValue]] = [
+            [
+                _TracedParameterValue(param_val, depth, self.accessed)
+                for param_val in parameter_value_matrix[parameter]
+            ]
+            for depth, parameter in enumerate(self.parameters)
+        ]
+        self.row: Dict[Parameter, ParameterValue] = {}
+        self.indices: List[int] = []
+        # self.memo[depth][depths][indices] is the number of valid completions of each partial row
+        # with the depth, which has the parameter-value indices at the recorded depths
+        self.memo: List[Dict[Tuple[int, ...], Dict[Tuple[int, ...], int]]] = [
+            {} for _ in self.parameters
+        ]
+
+    def count_value(self, depth: int, index: int) -> Tuple[int, Set[int]]:
+        """Add a parameter-value to the partial row and count the valid completions.
+
+        Args:
+            depth (int): depth of the parameter, the partial row contains all previous parameters
+            index (int): index of the parameter-value
+
+        Returns:
+            Tuple[int, Set[int]]: number of valid completions and the depths of the previous
+                parameters, which are read by the row filter
+        """
+        parameter = self.parameters[depth]
+        self.row[parameter] = self.values[depth][index]
+        self.indices.append(index)
+        try:
+            self.accessed.clear()
+            valid = self.row_filter(self.row)
+            accessed = {
+                accessed_depth for accessed_depth in self.accessed if accessed_depth < depth
+            }
+            if not valid:
+                return 0, accessed
+            if depth + 1 == len(self.parameters):
+                return 1, accessed
+            number, completion_accessed = self.count_completions(depth + 1)
+            accessed.update(
+                accessed_depth for accessed_depth in completion_accessed if accessed_depth < depth
+            )
+            return number, accessed
+        finally:
+            self.indices.pop()
+            del self.row[parameter]
+
+    def count_completions(self, depth: int) -> Tuple[int, Set[int]]:
+        """Count the valid completions of the partial row, which contains the parameters before
+        the depth.
+
+        Args:
+            depth (int): depth of the next parameter
+
+        Returns:
+            Tuple[int, Set[int]]: number of valid completions and the depths of the parameters of
+                the partial row, which are read by the row filter
+        """
+        for depths, numbers in self.memo[depth].items():
+            number = numbers.get(tuple(self.indices[accessed_depth] for accessed_depth in depths))
+            if number is not None:
+                return number, set(depths)
+
+        total = 0
+        accessed: Set[int] = set()
+        for index in range(len(self.values[depth])):
+            number, value_accessed = self.count_value(depth, index)
+            total += number
+            accessed.update(value_accessed)
+
+        depths = tuple(sorted(accessed))
+        self.memo[depth].setdefault(depths, {})[
+            tuple(self.indices[accessed_depth] for accessed_depth in depths)
+        ] = total
+        return total, accessed
+
+
+def _run_count_value(index: int) -> int:
+    """Worker function. Count the valid combinations, which contain a parameter-value of the first
+    parameter, with the counter inherited from the parent process.
+
+    Args:
+        index (int): index of the parameter-value of the first parameter
+
+    Returns:
+        int: number of valid combinations
+    """
+    assert _WORKER_COUNTER is not None
+    return _WORKER_COUNTER.count_value(0, index)[0]
+
+
+def count_valid_combinations(
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    jobs: int | None = None,
+) -> int:
+    """Count the combinations of the parameter-value-matrix, which pass the row filter. Like in
+    the generation, each partial row needs to pass the row filter. The parameter-values of the
+    first parameter are counted in parallel by forked worker processes.
+
+    The row filter needs to be deterministic and may only depend on the parameter-values of the
+    row, for example a FilterChain without debug mode.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid
+        jobs (int | None, optional): Number of worker processes. If None, the number of CPUs is
+            used. If the platform does not support forking, the combinations are counted in the
+            current process. Defaults to None.
+
+    Returns:
+        int: number of valid combinations, 0 if the parameter-value-matrix is empty
+    """
+    global _WORKER_COUNTER  # pylint: disable=global-statement
+
+    if not parameter_value_matrix:
+        return 0
+    counter = _CombinationCounter(parameter_value_matrix, row_filter)
+    number_of_first_values = len(counter.values[0])
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, number_of_first_values))
+    if jobs > 1:
+        # multiprocessing is only imported if it is used, see bashi.forbidden_pairs
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            _WORKER_COUNTER = counter
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+                ) as executor:
+                    return sum(executor.map(_run_count_value, range(number_of_first_values)))
+            finally:
+                _WORKER_COUNTER = None
+
+    return sum(counter.count_value(0, index)[0] for index in range(number_of_first_values))
@@ -0,0 +1,259 @@
+"""Generate a combination-list from independent groups of parameters.
+
+Not all parameters are constrained by the filter rules. For example, the Boost version and the CPU
+backends are not restricted by any rule for a pair of parameter-values. covertable does not know
+this and explores all parameters together. `get_parameter_groups()` finds the groups of
+parameters, which are coupled by the filter chain. `generate_decomposed_combination_list()`
+generates a combination-list for each group and merges the rows of the groups. The remaining
+parameter-value-pairs between the groups are covered by a final pass of covertable.
+"""
+
+import itertools
+from collections import OrderedDict
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+from bashi.types import (
+    Combination,
+    CombinationList,
+    Parameter,
+    ParameterValue,
+    ParameterValueMatrix,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.filter_base import FilterBase
+from bashi.generator import (
+    SkipCoveredPairsSorter,
+    get_generator_filter_chain,
+    make_combination_list,
+)
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+from bashi.version.relation import VersionRelation
+
+
+def get_parameter_groups(
+    parameter_value_matrix: ParameterValueMatrix, row_filter: Callable[..., bool]
+) -> List[List[Parameter]]:
+    """Find the groups of parameters, which are coupled by the row filter. Two parameters are
+    coupled, if the row filter rejects a pair of their parameter-values, although it accepts both
+    parameter-values alone. The groups are the connected components of the coupled parameters.
+
+    The row filter is probed with single parameter-values and parameter-value-pairs. Rules, which
+    need more than two parameter-values, are not detected. The generation checks all rows with the
+    row filter anyway, therefore a missed coupling does not create invalid rows.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid,
+            for example a FilterChain
+
+    Returns:
+        List[List[Parameter]]: groups of parameters. The groups are ordered by their first
+            parameter and the parameters of a group are in the order of the
+            parameter-value-matrix.
+    """
+    parameters = list(parameter_value_matrix.keys())
+    valid_values = {
+        parameter: [
+            param_val
+            for param_val in parameter_value_matrix[parameter]
+            if row_filter(OrderedDict({parameter: param_val}))
+        ]
+        for parameter in parameters
+    }
+
+    # union-find of the parameters
+    root: Dict[Parameter, Parameter] = {parameter: parameter for parameter in parameters}
+
+    def find(parameter: Parameter) -> Parameter:
+        while root[parameter] != parameter:
+            root[parameter] = root[root[parameter]]
+            parameter = root[parameter]
+        return parameter
+
+    for first, second in itertools.combinations(parameters, 2):
+        if find(first) == find(second):
+            continue
+        if any(
+            not row_filter(OrderedDict([(first, first_val), (second, second_val)]))
+            for first_val in valid_values[first]
+            for second_val in valid_values[second]
+        ):
+            root[find(second)] = find(first)
+
+    groups: Dict[Parameter, List[Parameter]] = OrderedDict()
+    for parameter in parameters:
+        groups.setdefault(find(parameter), []).append(parameter)
+    return list(groups.values())
+
+
+def _generate_group(
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    group: List[Parameter],
+) -> CombinationList:
+    """Generate the partial combination-list of a group of parameters.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid
+        group (List[Parameter]): parameters of the group
+
+    Returns:
+        CombinationList: partial combinations, which contain only the parameters of the group
+    """
+    if len(group) == 1:
+        # covertable needs at least two parameters
+        return [
+            comb
+            for comb in (
+                OrderedDict({group[0]: param_val}) for param_val in parameter_value_matrix[group[0]]
+            )
+            if row_filter(comb)
+        ]
+    return make_combination_list(
+        OrderedDict((parameter, parameter_value_matrix[parameter]) for parameter in group),
+        row_filter,
+    )
+
+
+def _get_gain(
+    group_ids: Sequence[int], row_ids: Sequence[int], covered: Set[Tuple[int, int]]
+) -> int:
+    """Returns the number of not covered id pairs, if a row of a group is added to a partial row.
+    Only the pairs, which contain an id of the group, are counted.
+
+    Args:
+        group_ids (Sequence[int]): encoded row of the group
+        row_ids (Sequence[int]): encoded partial row
+        covered (Set[Tuple[int, int]]): covered id pairs
+
+    Returns:
+        int: number of new id pairs
+    """
+    pairs = get_covered_id_pairs([group_ids])
+    pairs.update(
+        (min(group_id, row_id), max(group_id, row_id))
+        for group_id in group_ids
+        for row_id in row_ids
+    )
+    return len(pairs - covered)
+
+
+# pylint: disable=too-many-locals
+def _merge_group_rows(
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    group_lists: List[CombinationList],
+    dropped_rows: List[Combination] | None = None,
+) -> CombinationList:
+    """Merge the partial combination-lists of the groups into complete combinations. The longest
+    partial combination-list is the base. Each base row is extended with a row of each other
+    group, which covers the most not covered parameter-value-pairs and passes the row filter. If
+    no row of a group passes the row filter, the base row is dropped. This is only possible, if a
+    filter rule couples more than two parameters. The parameter-value-pairs of a dropped base row
+    are covered by the final pass of covertable.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a combination is valid
+        group_lists (List[CombinationList]): partial combination-list of each group
+        dropped_rows (List[Combination] | None, optional): If not None, the dropped base rows are
+            appended to the list. Defaults to None.
+
+    Returns:
+        CombinationList: complete combinations
+    """
+    registry = ParameterValueRegistry(parameter_value_matrix)
+    group_lists = sorted(group_lists, key=len, reverse=True)
+    encoded_lists = [registry.encode_combination_list(group_list) for group_list in group_lists]
+    covered: Set[Tuple[int, int]] = set()
+
+    comb_list: CombinationList = []
+    for base_index, base_row in enumerate(group_lists[0]):
+        row: Dict[Parameter, ParameterValue] = dict(base_row)
+        row_ids: List[int] = list(encoded_lists[0][base_index])
+        for group_list, encoded_list in zip(group_lists[1:], encoded_lists[1:]):
+            gains = [_get_gain(group_ids, row_ids, covered) for group_ids in encoded_list]
+            # sorted() is stable, therefore rows with the same gain keep the order of covertable
+            candidates = sorted(range(len(group_list)), key=gains.__getitem__, reverse=True)
+            for index in candidates:
+                merged = dict(row)
+                merged.update(group_list[index])
+                if row_filter(
+                    OrderedDict(
+                        (parameter, merged[parameter])
+                        for parameter in parameter_value_matrix
+                        if parameter in merged
+                    )
+                ):
+                    row = merged
+                    row_ids += list(encoded_list[index])
+                    break
+            else:
+                if dropped_rows is not None:
+                    dropped_rows.append(base_row)
+                break
+        else:
+            comb: Combination = OrderedDict(
+                (parameter, row[parameter]) for parameter in parameter_value_matrix
+            )
+            comb_list.append(comb)
+            covered.update(get_covered_id_pairs([row_ids]))
+    return comb_list
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def generate_decomposed_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+    dropped_rows: List[Combination] | None = None,
+) -> CombinationList:
+    """Generate a combination-list, which contains all valid parameter-value-pairs, like
+    `generate_combination_list()`. The parameters are split into groups with
+    `get_parameter_groups()`. Each group is generated separately and the rows of the groups are
+    merged. A row of the largest group is dropped, if it cannot be merged with a row of each other
+    group, because a filter rule couples more than two parameters. Afterwards, covertable covers
+    the parameter-value-pairs, which are still missing, including the parameter-value-pairs of
+    the dropped rows. Each row passes the filter chain.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        version_relation (VersionRelation): Provides information about the relationships between
+            the versions of various parameter-values.
+        runtime_infos (Dict[str, Callable[..., bool]]): runtime infos of the filter chain
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi filters.
+            Defaults to FilterBase().
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+        dropped_rows (List[Combination] | None, optional): If not None, the rows of the largest
+            group, which are dropped while merging, are appended to the list. The rows contain
+            only the parameters of the group. Defaults to None.
+
+    Raises:
+        covertable.exceptions.InvalidCondition: if a row cannot be completed with the filter
+
+    Returns:
+        CombinationList: combination-list
+    """
+    filter_chain = get_generator_filter_chain(
+        version_relation, runtime_infos, custom_filter, debug_print
+    )
+
+    groups = get_parameter_groups(parameter_value_matrix, filter_chain)
+    if len(groups) == 1:
+        return make_combination_list(parameter_value_matrix, filter_chain)
+
+    comb_list = _merge_group_rows(
+        parameter_value_matrix,
+        filter_chain,
+        [_generate_group(parameter_value_matrix, filter_chain, group) for group in groups],
+        dropped_rows,
+    )
+    return comb_list + make_combination_list(
+        parameter_value_matrix,
+        filter_chain,
+        SkipCoveredPairsSorter(parameter_value_matrix, comb_list),
+    )
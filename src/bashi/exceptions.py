@@ -3,3 +3,7 @@
 
 class BashiUnknownVersion(Exception):
     """Unknown software version."""
+
+
+class BashiDeadlineExceeded(Exception):
+    """The deadline of a time-budgeted generation is reached."""
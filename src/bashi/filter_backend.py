@@ -9,7 +9,7 @@ which rule.
 
 from typing import Dict, Optional, IO, Callable
 import packaging.version as pkv
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.version.relation import VersionRelation
 from bashi.filter_base import FilterBase
@@ -219,7 +219,7 @@ class BackendFilter(FilterBase):
         return True
 
 
-@typechecked
+@lazy_typechecked
 def backend_filter_typechecked(
     row: BashiRow,
     version_relation: VersionRelation,
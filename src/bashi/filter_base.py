@@ -5,6 +5,23 @@ from bashi.version.relation import VersionRelation
 from bashi.row import BashiRow
 
 
+def reason(output: Optional[IO[str]], msg: str):
+    """Write the message to output if it is not None. This function is used
+    in filter functions to print additional information about filter decisions.
+
+    Args:
+        output (Optional[IO[str]]): IO object. For example, can be io.StringIO, sys.stdout or
+            sys.stderr
+        msg (str): the message
+    """
+    if output:
+        print(
+            msg,
+            file=output,
+            end="",
+        )
+
+
 class FilterBase:
     """Base class for a filter functor. A filter functor object behaves like a function. The
     __call__ function implements the required interface of a filter function for the pair-wise
@@ -1,9 +1,8 @@
 """Contains default filter chain and avoids circular import"""
 
 from typing import Callable, Dict
-from typeguard import typechecked
 import covertable  # type: ignore
-import termcolor
+from bashi.typechecking import lazy_typechecked
 from bashi.globals import FilterDebugMode
 
 from bashi.filter_base import FilterBase
@@ -69,6 +68,9 @@ class FilterChain:
         )
 
         if self.debug_print != FilterDebugMode.OFF:
+            # termcolor is only required for the debug output
+            import termcolor  # pylint: disable=import-outside-toplevel
+
             validate_args = self.debug_print == FilterDebugMode.VALIDATOR_ARGS
             row_string = get_str_row_nice(row, bashi_validate=validate_args)
             if result:
@@ -83,7 +85,7 @@ class FilterChain:
         return result
 
 
-@typechecked
+@lazy_typechecked
 def get_default_filter_chain(
     version_relation: VersionRelation,
     debug_print: FilterDebugMode = FilterDebugMode.OFF,
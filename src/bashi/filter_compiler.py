@@ -9,13 +9,12 @@ which rule.
 
 from typing import Dict, Optional, IO, List, Callable, cast
 import packaging.version as pkv
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.types import Parameter, ValueName
 from bashi.version.dependencies.base_version_support import CompilerCxxSupport
 from bashi.version.relation import VersionRelation
-from bashi.filter_base import FilterBase
-from bashi.utils import reason
+from bashi.filter_base import FilterBase, reason
 from bashi.row import BashiRow
 
 
@@ -508,7 +507,7 @@ class CompilerFilter(FilterBase):
         return True
 
 
-@typechecked
+@lazy_typechecked
 def compiler_filter_typechecked(
     row: BashiRow,
     version_relation: VersionRelation,
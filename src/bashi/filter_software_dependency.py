@@ -9,11 +9,12 @@ which rule.
 
 from typing import Dict, Optional, IO, Callable, cast
 import packaging.version as pkv
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.filter_base import FilterBase
 from bashi.version.relation import VersionRelation
 from bashi.printer import ubuntu_version_to_string
+from bashi.runtime_info import UbuntuSDKSupportTable
 from bashi.row import BashiRow
 
 
@@ -44,6 +45,30 @@ class SoftwareDependencyFilter(FilterBase):
         output: IO[str] | None = None,
     ):
         super().__init__(runtime_infos, version_relation, output)
+        # used if the runtime infos do not provide a precomputed Ubuntu SDK support table
+        self._ubuntu_sdk_tables: Dict[str, UbuntuSDKSupportTable] = {}
+
+    def _get_ubuntu_sdk_table(self, rt_table_name: str) -> UbuntuSDKSupportTable:
+        """Returns the Ubuntu SDK support table for HIP or CUDA. Prefers the precomputed table of
+        the runtime infos. If it does not exist, a table is created, which is filled on demand.
+
+        Args:
+            rt_table_name (str): Either RT_UBUNTU_HIP_SDK_SUPPORT or RT_UBUNTU_CUDA_SDK_SUPPORT
+
+        Returns:
+            UbuntuSDKSupportTable: The table
+        """
+        if rt_table_name in self.runtime_infos:
+            return cast(UbuntuSDKSupportTable, self.runtime_infos[rt_table_name])
+
+        if rt_table_name not in self._ubuntu_sdk_tables:
+            self._ubuntu_sdk_tables[rt_table_name] = UbuntuSDKSupportTable(
+                self.version.get_ubuntu_hip_version_range()
+                if rt_table_name == RT_UBUNTU_HIP_SDK_SUPPORT
+                else self.version.get_ubuntu_cuda_version_range()
+            )
+
+        return self._ubuntu_sdk_tables[rt_table_name]
 
     def __call__(
         self,
@@ -93,18 +118,18 @@ class SoftwareDependencyFilter(FilterBase):
             # check if a hipcc version is available on an ubuntu version
             for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
                 if row[compiler_type].name == HIPCC:
-                    for ubuntu_hip_range in self.version.get_ubuntu_hip_version_range():
-                        if (
-                            cast(ValueVersion, row[compiler_type].version)
-                            in ubuntu_hip_range.sdk_range
-                            and row[UBUNTU].version != ubuntu_hip_range.ubuntu
-                        ):
-                            self.reason(
-                                f"The hipcc {row[compiler_type].version} compiler is not available "
-                                f"on the Ubuntu {ubuntu_version_to_string(row[UBUNTU].version)} "
-                                "image.",
-                            )
-                            return False
+                    if self._get_ubuntu_sdk_table(
+                        RT_UBUNTU_HIP_SDK_SUPPORT
+                    ).is_bound_to_other_ubuntu(
+                        cast(ValueVersion, row[UBUNTU].version),
+                        cast(ValueVersion, row[compiler_type].version),
+                    ):
+                        self.reason(
+                            f"The hipcc {row[compiler_type].version} compiler is not available "
+                            f"on the Ubuntu {ubuntu_version_to_string(row[UBUNTU].version)} "
+                            "image.",
+                        )
+                        return False
 
             # Rule: d5
             if row[ALPAKA_ACC_GPU_HIP_ENABLE].version == ON_VER:
@@ -117,35 +142,33 @@ class SoftwareDependencyFilter(FilterBase):
                     )
                     return False
 
+            ubuntu_cuda_table = self._get_ubuntu_sdk_table(RT_UBUNTU_CUDA_SDK_SUPPORT)
+
             # Rule: d6
             if row[DEVICE_COMPILER].name == NVCC:
-                for ubuntu_cuda_range in self.version.get_ubuntu_cuda_version_range():
-                    if (
-                        cast(ValueVersion, row[DEVICE_COMPILER].version)
-                        in ubuntu_cuda_range.sdk_range
-                        and row[UBUNTU].version != ubuntu_cuda_range.ubuntu
-                    ):
-                        self.reason(
-                            f"The nvcc {row[DEVICE_COMPILER].version} compiler is not available "
-                            f"on the Ubuntu {ubuntu_version_to_string(row[UBUNTU].version)} "
-                            "image.",
-                        )
-                        return False
+                if ubuntu_cuda_table.is_bound_to_other_ubuntu(
+                    cast(ValueVersion, row[UBUNTU].version),
+                    cast(ValueVersion, row[DEVICE_COMPILER].version),
+                ):
+                    self.reason(
+                        f"The nvcc {row[DEVICE_COMPILER].version} compiler is not available "
+                        f"on the Ubuntu {ubuntu_version_to_string(row[UBUNTU].version)} "
+                        "image.",
+                    )
+                    return False
 
             # Rule: d7
             if row[ALPAKA_ACC_GPU_CUDA_ENABLE].version != OFF_VER:
-                for ubuntu_cuda_range in self.version.get_ubuntu_cuda_version_range():
-                    if (
-                        cast(ValueVersion, row[ALPAKA_ACC_GPU_CUDA_ENABLE].version)
-                        in ubuntu_cuda_range.sdk_range
-                        and row[UBUNTU].version != ubuntu_cuda_range.ubuntu
-                    ):
-                        self.reason(
-                            f"The CUDA SDK {row[ALPAKA_ACC_GPU_CUDA_ENABLE].version} is not "
-                            "available on the Ubuntu "
-                            f"{ubuntu_version_to_string(row[UBUNTU].version)} image.",
-                        )
-                        return False
+                if ubuntu_cuda_table.is_bound_to_other_ubuntu(
+                    cast(ValueVersion, row[UBUNTU].version),
+                    cast(ValueVersion, row[ALPAKA_ACC_GPU_CUDA_ENABLE].version),
+                ):
+                    self.reason(
+                        f"The CUDA SDK {row[ALPAKA_ACC_GPU_CUDA_ENABLE].version} is not "
+                        "available on the Ubuntu "
+                        f"{ubuntu_version_to_string(row[UBUNTU].version)} image.",
+                    )
+                    return False
 
             # Rule: d8
             for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
@@ -206,7 +229,7 @@ class SoftwareDependencyFilter(FilterBase):
         return True
 
 
-@typechecked
+@lazy_typechecked
 def software_dependency_filter_typechecked(
     row: BashiRow,
     version_relation: VersionRelation,
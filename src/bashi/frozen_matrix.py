@@ -0,0 +1,93 @@
+"""Immutable and hashable version of the parameter-value-matrix."""
+
+from typing import Dict, Iterable, Iterator, Mapping, Tuple
+from collections import OrderedDict
+from bashi.types import Parameter, ParameterValue, ParameterValueMatrix
+
+
+class FrozenParameterValueMatrix(Mapping[Parameter, Tuple[ParameterValue, ...]]):
+    """Read-only parameter-value-matrix. The ordering of the parameters and parameter-values is
+    kept. The content hash is calculated once at construction time, therefore the object can be
+    used cheaply as key for caches and dicts.
+
+    Use `to_parameter_value_matrix()` to get a mutable `ParameterValueMatrix` and `extend()` to
+    derive a new matrix with additional parameters, for example a project specific `BUILD_TYPE`.
+    """
+
+    __slots__ = ("_matrix", "_index", "_hash")
+
+    def __init__(
+        self,
+        parameter_value_matrix: Mapping[Parameter, Iterable[ParameterValue]] | None = None,
+    ):
+        """Construct new FrozenParameterValueMatrix.
+
+        Args:
+            parameter_value_matrix (Mapping[Parameter, Iterable[ParameterValue]] | None, optional):
+                Parameters and their parameter-values. The content is copied. Defaults to None.
+        """
+        self._matrix: Tuple[Tuple[Parameter, Tuple[ParameterValue, ...]], ...] = ()
+        if parameter_value_matrix is not None:
+            self._matrix = tuple(
+                (param, tuple(param_vals)) for param, param_vals in parameter_value_matrix.items()
+            )
+        self._index: Dict[Parameter, Tuple[ParameterValue, ...]] = dict(self._matrix)
+        self._hash = hash(self._matrix)
+
+    def __getitem__(self, parameter: Parameter) -> Tuple[ParameterValue, ...]:
+        return self._index[parameter]
+
+    def __iter__(self) -> Iterator[Parameter]:
+        return (param for param, _ in self._matrix)
+
+    def __contains__(self, parameter: object) -> bool:
+        return parameter in self._index
+
+    def __len__(self) -> int:
+        return len(self._matrix)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, FrozenParameterValueMatrix):
+            # the hash comparison is cheap and avoids the comparison of the content in most cases
+            return self._hash == other._hash and self._matrix == other._matrix
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self._index)})"
+
+    def extend(
+        self, parameter: Parameter, parameter_values: Iterable[ParameterValue]
+    ) -> "FrozenParameterValueMatrix":
+        """Returns a new matrix with an additional parameter. If the parameter already exists, the
+        parameter-values are replaced and the position of the parameter is kept.
+
+        Args:
+            parameter (Parameter): name of the parameter
+            parameter_values (Iterable[ParameterValue]): parameter-values of the parameter
+
+        Returns:
+            FrozenParameterValueMatrix: the extended matrix
+        """
+        extended: OrderedDict[Parameter, Iterable[ParameterValue]] = OrderedDict(self._matrix)
+        extended[parameter] = parameter_values
+        return FrozenParameterValueMatrix(extended)
+
+    def to_parameter_value_matrix(self) -> ParameterValueMatrix:
+        """Returns a mutable copy of the matrix. Modifying the copy does not affect the frozen
+        matrix.
+
+        Returns:
+            ParameterValueMatrix: parameter-value-matrix
+        """
+        return OrderedDict((param, list(param_vals)) for param, param_vals in self._matrix)
@@ -1,80 +1,87 @@
 """Functions to generate the combination-list"""
 
-from typing import Dict, List, Callable, cast
+import itertools
+import time
+from typing import Any, Dict, List, Callable, Mapping, NamedTuple, Set, Tuple, cast
 from collections import OrderedDict
 
-from covertable import make  # type: ignore
+from covertable import make, sorters  # type: ignore
+from covertable.main import (  # type: ignore
+    Row,
+    convert_factors_to_serials,
+    make_async,
+    make_incomplete,
+)
 
 from bashi.types import (
     Parameter,
     ParameterValue,
     ParameterValueMatrix,
+    ParameterValuePair,
+    ParameterValueSingle,
     Combination,
     CombinationList,
 )
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.exceptions import BashiDeadlineExceeded
 from bashi.filter_base import FilterBase
 from bashi.filter_chain import get_default_filter_chain, FilterChain
-from bashi.runtime_info import get_sdk_supporting_ubuntus
+from bashi.forbidden_pairs import ForbiddenPairFilter, LookaheadFilter
+
+# get_runtime_infos() was part of the generator, it is still exported from here
+from bashi.runtime_info import get_runtime_infos  # pylint: disable=unused-import
 from bashi.version.relation import VersionRelation
 
 
-def get_runtime_infos(
-    parameter_value_matrix: ParameterValueMatrix, version_relation: VersionRelation
-) -> Dict[str, Callable[..., bool]]:
-    """Get several runtime filter rules for the given input parameter-value-matrix
+def get_generator_filter_chain(
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+) -> FilterChain:
+    """Returns the default filter chain for the arguments of the generator functions, for example
+    `generate_combination_list()`.
 
     Args:
-        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
         version_relation (VersionRelation): Provides information about the relationships between
                 the versions of various parameter-values. For example, which GCC version supports
                 which C++ standard.
+        runtime_infos (Dict[str, Callable[..., bool]]): runtime infos of the filter chain
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+
     Returns:
-        Dict[str, Callable[..., bool]]: Dict of filter functions
+        FilterChain: filter chain
     """
-    runtime_infos: Dict[str, Callable[..., bool]] = {}
-
-    if UBUNTU in parameter_value_matrix and DEVICE_COMPILER in parameter_value_matrix:
-        ubuntus: List[ValueVersion] = [
-            param_val.version for param_val in parameter_value_matrix[UBUNTU]
-        ]
-        if len(ubuntus) > 0:
-            for sdk_name, version_range, rt_func_name in [
-                (
-                    HIPCC,
-                    version_relation.get_ubuntu_hip_version_range(),
-                    RT_AVAILABLE_HIP_SDK_UBUNTU_VER,
-                ),
-                (
-                    NVCC,
-                    version_relation.get_ubuntu_cuda_version_range(),
-                    RT_AVAILABLE_CUDA_SDK_UBUNTU_VER,
-                ),
-            ]:
-                sdks: List[ValueVersion] = []
-                for param_val in parameter_value_matrix[DEVICE_COMPILER]:
-                    if param_val.name == sdk_name:
-                        sdks.append(param_val.version)
-
-                if len(sdks) > 0 and len(version_range) > 0:
-                    runtime_infos[rt_func_name] = get_sdk_supporting_ubuntus(
-                        ubuntus=ubuntus,
-                        sdk_versions=sdks,
-                        ubuntu_sdk_version_range=version_range,
-                    )
-
-    return runtime_infos
+    return get_default_filter_chain(
+        version_relation=version_relation,
+        debug_print=debug_print,
+        runtime_infos=runtime_infos,
+        custom_filter=custom_filter,
+    )
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
 def generate_combination_list(
     parameter_value_matrix: ParameterValueMatrix,
     version_relation: VersionRelation,
     runtime_infos: Dict[str, Callable[..., bool]],
     custom_filter: FilterBase = FilterBase(),
     debug_print: FilterDebugMode = FilterDebugMode.OFF,
+    removed_parameter_values: List[ParameterValueSingle] | None = None,
+    order_parameters: bool = False,
 ) -> CombinationList:
     """Generate combination-list from the parameter-value-matrix. The combination list contains
-    all valid parameter-value-pairs at least one time.
+    all valid parameter-value-pairs at least one time. Before the generation, the
+    parameter-values, which cannot be part of a valid combination, are removed with
+    `prune_parameter_value_matrix()`. If the debug mode is off, the filter chain is wrapped by a
+    `LookaheadFilter`, which rejects rows with a forbidden parameter-value-pair or a parameter
+    without possible parameter-values without calling the filter chain. The possible
+    parameter-values are only pruned with the table of forbidden parameter-value-pairs. This
+    requires, that the filter chain including the custom filter rejects each row, which contains a
+    rejected parameter-value-pair.
 
     Args:
         parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
@@ -86,35 +93,515 @@ def generate_combination_list(
             filters. Defaults is lambda _: True.
         debug_print (FilterDebugMode): Depending on the debug mode, print additional information
             for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+        removed_parameter_values (List[ParameterValueSingle] | None, optional): If not None, the
+            parameter-values removed before the generation are appended to the list. Defaults to
+            None.
+        order_parameters (bool, optional): If True, the parameters are generated in the order of
+            `order_parameters_by_constraint()`. The combinations keep the order of the
+            parameter-value-matrix. Defaults to False.
     Returns:
         CombinationList: combination-list
     """
+    generation_matrix, row_filter = _get_generation_input(
+        parameter_value_matrix,
+        get_generator_filter_chain(version_relation, runtime_infos, custom_filter, debug_print),
+        debug_print,
+        removed_parameter_values,
+        order_parameters,
+    )
+    if not order_parameters:
+        return make_combination_list(generation_matrix, row_filter)
 
-    filter_chain: FilterChain = get_default_filter_chain(
-        version_relation=version_relation,
-        debug_print=debug_print,
-        runtime_infos=runtime_infos,
-        custom_filter=custom_filter,
+    return [
+        _to_combination(parameter_value_matrix, comb)
+        for comb in make_combination_list(generation_matrix, row_filter)
+    ]
+
+
+def _get_generation_input(
+    parameter_value_matrix: ParameterValueMatrix,
+    filter_chain: FilterChain,
+    debug_print: FilterDebugMode,
+    removed_parameter_values: List[ParameterValueSingle] | None,
+    order_parameters: bool,
+) -> Tuple[ParameterValueMatrix, Callable[..., bool]]:
+    """Returns the parameter-value-matrix and the filter, which are passed to covertable by
+    `generate_combination_list()` and `generate_combination_list_with_deadline()`.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        filter_chain (FilterChain): filter chain
+        debug_print (FilterDebugMode): debug mode of the filter chain
+        removed_parameter_values (List[ParameterValueSingle] | None): If not None, the pruned
+            parameter-values are appended to the list.
+        order_parameters (bool): If True, the parameters are ordered by
+            `order_parameters_by_constraint()`.
+
+    Returns:
+        Tuple[ParameterValueMatrix, Callable[..., bool]]: pruned parameter-value-matrix and filter
+    """
+    row_filter: Callable[..., bool] = filter_chain
+    # the debug output should show all rows checked by the filter chain
+    if debug_print == FilterDebugMode.OFF:
+        # The table rejects each row, which contains a parameter-value-pair rejected by the filter
+        # chain. This is only correct, if the filter chain rejects each row, which contains a
+        # rejected part (monotonic filter). The bashi filter rules and covertable require this
+        # anyway, custom filters need to follow it too. The table is built in the current
+        # process, forking worker processes from a library function is not safe for threaded
+        # callers and it takes only a fraction of a second.
+        row_filter = LookaheadFilter(filter_chain, parameter_value_matrix, jobs=1)
+
+    pruned_matrix = prune_parameter_value_matrix(
+        parameter_value_matrix, row_filter, removed_parameter_values
+    )
+    if order_parameters:
+        pruned_matrix = order_parameters_by_constraint(pruned_matrix, row_filter)
+    return pruned_matrix, row_filter
+
+
+def get_parameter_rejection_rates(
+    parameter_value_matrix: ParameterValueMatrix, row_filter: Callable[..., bool]
+) -> Dict[Parameter, float]:
+    """Measure how strongly each parameter is constrained by the row filter. The rejection rate of
+    a parameter is the share of the parameter-value-pairs with all other parameters, which are
+    rejected by the row filter. If the row filter is a `ForbiddenPairFilter`, its table is used
+    instead of calling the row filter.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid,
+            for example a FilterChain
+
+    Returns:
+        Dict[Parameter, float]: rejection rate between 0.0 and 1.0 of each parameter. A parameter
+            without parameter-value-pairs has the rejection rate 0.0.
+    """
+
+    def is_rejected(row: Mapping[Parameter, ParameterValue]) -> bool:
+        if isinstance(row_filter, ForbiddenPairFilter):
+            return row_filter.is_forbidden(row)
+        return not row_filter(row)
+
+    rejected: Dict[Parameter, int] = {parameter: 0 for parameter in parameter_value_matrix}
+    checked: Dict[Parameter, int] = {parameter: 0 for parameter in parameter_value_matrix}
+    for first, second in itertools.combinations(parameter_value_matrix.keys(), 2):
+        number_of_rejected = sum(
+            1
+            for first_val in parameter_value_matrix[first]
+            for second_val in parameter_value_matrix[second]
+            if is_rejected(OrderedDict([(first, first_val), (second, second_val)]))
+        )
+        number_of_pairs = len(parameter_value_matrix[first]) * len(parameter_value_matrix[second])
+        for parameter in (first, second):
+            rejected[parameter] += number_of_rejected
+            checked[parameter] += number_of_pairs
+
+    return {
+        parameter: rejected[parameter] / checked[parameter] if checked[parameter] else 0.0
+        for parameter in parameter_value_matrix
+    }
+
+
+def order_parameters_by_constraint(
+    parameter_value_matrix: ParameterValueMatrix, row_filter: Callable[..., bool]
+) -> ParameterValueMatrix:
+    """Reorder the parameters, so that the most constrained parameters come first. covertable
+    completes a row in the order of the parameters. If a strongly constrained parameter is added
+    late, many partial rows are rejected. The parameters are ordered by the rejection rate of
+    `get_parameter_rejection_rates()`. Parameters with the same rejection rate keep their order.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid,
+            for example a FilterChain
+
+    Returns:
+        ParameterValueMatrix: new parameter-value-matrix with reordered parameters
+    """
+    rejection_rates = get_parameter_rejection_rates(parameter_value_matrix, row_filter)
+    return OrderedDict(
+        (parameter, parameter_value_matrix[parameter])
+        for parameter in sorted(
+            parameter_value_matrix.keys(), key=lambda parameter: -rejection_rates[parameter]
+        )
     )
 
+
+def prune_parameter_value_matrix(
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    removed_parameter_values: List[ParameterValueSingle] | None = None,
+) -> ParameterValueMatrix:
+    """Remove all parameter-values, which cannot be part of a valid combination. First, each
+    parameter-value is checked alone with the row filter, for example NVCC as host compiler.
+    Afterwards, a parameter-value is removed, if there is another parameter, where no
+    parameter-value passes the row filter together with it. The check is repeated until no
+    parameter-value is removed anymore.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid,
+            for example a FilterChain
+        removed_parameter_values (List[ParameterValueSingle] | None, optional): If not None, the
+            removed parameter-values are appended to the list. Defaults to None.
+
+    Returns:
+        ParameterValueMatrix: new parameter-value-matrix. If a parameter has no valid
+            parameter-value, its list of parameter-values is empty and the pruning stops.
+    """
+    removed: List[ParameterValueSingle] = []
+
+    matrix: ParameterValueMatrix = OrderedDict()
+    for parameter, parameter_values in parameter_value_matrix.items():
+        matrix[parameter] = []
+        for param_val in parameter_values:
+            if row_filter(OrderedDict({parameter: param_val})):
+                matrix[parameter].append(param_val)
+            else:
+                removed.append(ParameterValueSingle(parameter, param_val))
+
+    changed = True
+    while changed:
+        changed = False
+        for parameter, parameter_values in matrix.items():
+            supported: List[ParameterValue] = []
+            for param_val in parameter_values:
+                if all(
+                    any(
+                        row_filter(
+                            OrderedDict([(parameter, param_val), (other_param, other_param_val)])
+                        )
+                        for other_param_val in other_param_values
+                    )
+                    for other_param, other_param_values in matrix.items()
+                    if other_param != parameter
+                ):
+                    supported.append(param_val)
+                else:
+                    removed.append(ParameterValueSingle(parameter, param_val))
+            if len(supported) != len(parameter_values):
+                matrix[parameter] = supported
+                changed = True
+            if not supported:
+                # no valid combination exists, further checks would remove all parameter-values
+                changed = False
+                break
+
+    if removed_parameter_values is not None:
+        removed_parameter_values += removed
+    return matrix
+
+
+def make_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    pre_filter: Callable[..., bool],
+    sorter: Any = None,
+    length: int = 2,
+) -> CombinationList:
+    """Run the pair-wise generator of covertable with the given filter function and convert the
+    result into a combination-list.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        pre_filter (Callable[..., bool]): Filter function, which is applied on each (incomplete)
+            row. Normally, it is a FilterChain.
+        sorter (Any, optional): covertable sorter, an object with a `sort()` function. If None,
+            the default sorter of covertable is used. Defaults to None.
+        length (int, optional): Strength of the generated combination-list. Each valid
+            combination of `length` parameter-values is covered. Defaults to 2.
+
+    Raises:
+        covertable.exceptions.InvalidCondition: if a row cannot be completed with the filter
+
+    Returns:
+        CombinationList: combination-list
+    """
     comb_list: CombinationList = []
+    if isinstance(sorter, SkipCoveredPairsSorter) and not sorter.has_uncovered_pairs(pre_filter):
+        return comb_list
 
+    sorter_args: Dict[str, Any] = {} if sorter is None else {"sorter": sorter}
     all_pairs = cast(
         List[Dict[Parameter, ParameterValue]],
         make(
             factors=parameter_value_matrix,
-            length=2,
-            pre_filter=filter_chain,
+            length=length,
+            pre_filter=pre_filter,
+            **sorter_args,
         ),
     )
 
     # convert List[Dict[Parameter, ParameterValue]] to CombinationList
     for all_pair in all_pairs:
-        tmp_comb: Combination = OrderedDict({})
-        # covertable does not keep the ordering of the parameters
-        # therefore we sort it
-        for param in parameter_value_matrix.keys():
-            tmp_comb[param] = all_pair[param]
-        comb_list.append(tmp_comb)
+        comb_list.append(_to_combination(parameter_value_matrix, all_pair))
 
     return comb_list
+
+
+def _to_combination(
+    parameter_value_matrix: ParameterValueMatrix, row: Mapping[Parameter, ParameterValue]
+) -> Combination:
+    """Convert a row of covertable to a combination.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row (Mapping[Parameter, ParameterValue]): row of covertable
+
+    Returns:
+        Combination: combination
+    """
+    tmp_comb: Combination = OrderedDict({})
+    # covertable does not keep the ordering of the parameters
+    # therefore we sort it
+    for param in parameter_value_matrix.keys():
+        tmp_comb[param] = row[param]
+    return tmp_comb
+
+
+# pylint: disable=too-few-public-methods
+class SkipCoveredPairsSorter:
+    """Sorter for covertable. covertable tries to cover all parameter-value-pairs of the
+    parameter-value-matrix. The sorter determines the parameter-value-pairs, which are not covered
+    by the rows of a previous pass, already before covertable is called. Before the first row is
+    created, it removes all other parameter-value-pairs from the uncovered parameter-value-pairs of
+    covertable. Afterwards, it sorts like the default hash sorter of covertable.
+    """
+
+    def __init__(
+        self, parameter_value_matrix: ParameterValueMatrix, covered_combinations: CombinationList
+    ):
+        """Create the sorter.
+
+        Args:
+            parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix, which is passed
+                to covertable
+            covered_combinations (CombinationList): combinations of the previous passes
+        """
+        # covertable identifies each parameter-value by a serial number in the order of the matrix
+        self.parameter_value_matrix = parameter_value_matrix
+        self.serials, self.parents = convert_factors_to_serials(parameter_value_matrix)
+        serial_numbers: Dict[Tuple[Parameter, ParameterValue], int] = {
+            (parameter, param_val): serial
+            for parameter, parameter_values in parameter_value_matrix.items()
+            for param_val, serial in zip(parameter_values, self.serials[parameter])
+        }
+        self.uncovered_pairs: Set[Tuple[int, int]] = make_incomplete(self.serials, 2)
+        for comb in covered_combinations:
+            self.uncovered_pairs.difference_update(
+                itertools.combinations(
+                    sorted(
+                        serial_numbers[(parameter, param_val)]
+                        for parameter, param_val in comb.items()
+                        if (parameter, param_val) in serial_numbers
+                    ),
+                    2,
+                )
+            )
+        self.first_sort = True
+
+    def has_uncovered_pairs(self, pre_filter: Callable[..., bool]) -> bool:
+        """Check if at least one uncovered parameter-value-pair passes the filter. Otherwise,
+        covertable would complete an arbitrary row, although there is nothing left to cover.
+
+        Args:
+            pre_filter (Callable[..., bool]): filter function, which is passed to covertable
+
+        Returns:
+            bool: True if there is a valid uncovered parameter-value-pair
+        """
+        row = Row(None, self.parameter_value_matrix, self.serials, pre_filter)
+        return any(
+            row.storable([(self.parents[serial], serial) for serial in pair])
+            for pair in self.uncovered_pairs
+        )
+
+    def sort(self, incomplete: Set[Tuple[int, int]], **kwargs: Any) -> List[Tuple[int, int]]:
+        """Interface function for covertable.
+
+        Args:
+            incomplete (Set[Tuple[int, int]]): uncovered parameter-value-pairs as serial numbers
+            kwargs (Any): arguments of the covertable sorter
+
+        Returns:
+            List[Tuple[int, int]]: sorted uncovered parameter-value-pairs
+        """
+        if self.first_sort:
+            incomplete.intersection_update(self.uncovered_pairs)
+            self.first_sort = False
+        return sorters.hash.sort(incomplete, **kwargs)
+
+
+# result of generate_combination_list_with_deadline()
+AnytimeResult = NamedTuple(
+    "AnytimeResult",
+    [
+        ("combination_list", CombinationList),
+        ("missing_pairs", List[ParameterValuePair]),
+        ("complete", bool),
+    ],
+)
+
+
+# pylint: disable=too-few-public-methods
+class _DeadlineFilter:
+    """Filter function for covertable, which stops the generation by raising
+    BashiDeadlineExceeded, if the deadline is reached. covertable calls the filter very often,
+    therefore the generation is also stopped while a row is created."""
+
+    def __init__(self, pre_filter: Callable[..., bool], deadline: float):
+        """Create the filter.
+
+        Args:
+            pre_filter (Callable[..., bool]): wrapped filter function
+            deadline (float): deadline compared to `time.monotonic()`
+        """
+        self.pre_filter = pre_filter
+        self.deadline = deadline
+
+    def __call__(self, row: Dict[Parameter, ParameterValue]) -> bool:
+        if time.monotonic() > self.deadline:
+            raise BashiDeadlineExceeded()
+        return self.pre_filter(row)
+
+
+class _TrackingSorter:
+    """Default hash sorter of covertable, which keeps references of the uncovered pairs and the
+    current row of covertable. Both are required to report the missing pairs, if the generation
+    is stopped."""
+
+    def __init__(self) -> None:
+        self.incomplete: Set[Tuple[int, int]] | None = None
+        self.row: Dict[Parameter, int] = {}
+
+    def sort(
+        self, incomplete: Set[Tuple[int, int]], row: Dict[Parameter, int], **kwargs: Any
+    ) -> List[Tuple[int, int]]:
+        """Interface function for covertable.
+
+        Args:
+            incomplete (Set[Tuple[int, int]]): uncovered parameter-value-pairs as serial numbers
+            row (Dict[Parameter, int]): current row as serial numbers
+            kwargs (Any): arguments of the covertable sorter
+
+        Returns:
+            List[Tuple[int, int]]: sorted uncovered parameter-value-pairs
+        """
+        self.incomplete = incomplete
+        self.row = row
+        return sorters.hash.sort(incomplete=incomplete, row=row, **kwargs)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+def generate_combination_list_with_deadline(
+    parameter_value_matrix: ParameterValueMatrix,
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    deadline: float,
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+    removed_parameter_values: List[ParameterValueSingle] | None = None,
+    order_parameters: bool = False,
+) -> AnytimeResult:
+    """Generate the combination-list like `generate_combination_list()`, but stop if the deadline
+    is reached. The parameter-value-matrix is pruned and the filter is set up like in
+    `generate_combination_list()`, this part is not stopped. The generation is stopped between two
+    rows or while a row is created, therefore the call returns shortly after the deadline. All
+    returned combinations are complete and pass the filter chain.
+
+    The missing pairs are the valid parameter-value-pairs of the pruned parameter-value-matrix,
+    which covertable has not covered yet. If the generation is stopped before covertable has
+    removed the invalid pairs, the pairs are checked with the table of the `LookaheadFilter`. In
+    debug mode, the filter chain is called for each uncovered pair instead.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        version_relation (VersionRelation): Provides information about the relationships between
+                the versions of various parameter-values. For example, which GCC version supports
+                which C++ standard.
+        runtime_infos (Dict[str, Callable[..., bool]]): runtime infos of the filter chain
+        deadline (float): Time budget in seconds, starting with the call.
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi
+            filters. Defaults is lambda _: True.
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+        removed_parameter_values (List[ParameterValueSingle] | None, optional): If not None, the
+            parameter-values removed before the generation are appended to the list. Defaults to
+            None.
+        order_parameters (bool, optional): If True, the parameters are generated in the order of
+            `order_parameters_by_constraint()`. The combinations keep the order of the
+            parameter-value-matrix. Defaults to False.
+
+    Returns:
+        AnytimeResult: combination-list, missing parameter-value-pairs and True if the
+            combination-list is complete
+    """
+    end = time.monotonic() + deadline
+    generation_matrix, row_filter = _get_generation_input(
+        parameter_value_matrix,
+        get_generator_filter_chain(version_relation, runtime_infos, custom_filter, debug_print),
+        debug_print,
+        removed_parameter_values,
+        order_parameters,
+    )
+    deadline_filter = _DeadlineFilter(row_filter, end)
+    sorter = _TrackingSorter()
+
+    comb_list: CombinationList = []
+    try:
+        for row in make_async(
+            factors=generation_matrix, length=2, pre_filter=deadline_filter, sorter=sorter
+        ):
+            comb_list.append(_to_combination(parameter_value_matrix, row))
+            if time.monotonic() > deadline_filter.deadline:
+                raise BashiDeadlineExceeded()
+    except BashiDeadlineExceeded:
+        pass
+    else:
+        return AnytimeResult(comb_list, [], True)
+
+    serials, _ = convert_factors_to_serials(generation_matrix)
+    serial_numbers: Dict[Tuple[Parameter, ParameterValue], int] = {
+        (parameter, param_val): serial
+        for parameter, parameter_values in generation_matrix.items()
+        for param_val, serial in zip(parameter_values, serials[parameter])
+    }
+    values: Dict[int, ParameterValueSingle] = {
+        serial: ParameterValueSingle(parameter, param_val)
+        for (parameter, param_val), serial in serial_numbers.items()
+    }
+    if sorter.incomplete is None:
+        # covertable stopped before it removed the invalid pairs
+        uncovered = set(make_incomplete(serials, 2))
+        # in debug mode, there is no table of forbidden pairs
+        is_valid: Callable[..., bool] = (
+            (lambda row: not row_filter.is_forbidden(row))
+            if isinstance(row_filter, ForbiddenPairFilter)
+            else row_filter
+        )
+        uncovered = {
+            pair for pair in uncovered if is_valid(OrderedDict(values[serial] for serial in pair))
+        }
+    else:
+        # the pairs of the current row are not part of the incomplete pairs anymore
+        uncovered = set(sorter.incomplete)
+        uncovered.update(itertools.combinations(sorted(sorter.row.values()), 2))
+    for comb in comb_list:
+        uncovered.difference_update(
+            itertools.combinations(
+                sorted(serial_numbers[param_single] for param_single in comb.items()), 2
+            )
+        )
+
+    # the pairs keep the parameter order of the parameter-value-matrix, also if the parameters are
+    # generated in a different order
+    position = {parameter: index for index, parameter in enumerate(parameter_value_matrix)}
+    missing_pairs = [
+        ParameterValuePair(
+            *sorted((values[first], values[second]), key=lambda value: position[value.parameter])
+        )
+        for first, second in sorted(uncovered)
+    ]
+    # the deadline can be reached after the last row
+    return AnytimeResult(comb_list, missing_pairs, len(missing_pairs) == 0)
@@ -83,6 +83,9 @@ PARAMETERS: List[Parameter] = [
 # runtime functions
 RT_AVAILABLE_HIP_SDK_UBUNTU_VER: str = "rt_available_hip_sdk_ubuntu_ver"
 RT_AVAILABLE_CUDA_SDK_UBUNTU_VER: str = "rt_available_cuda_sdk_ubuntu_ver"
+# precomputed tables, which SDK version can be installed on which Ubuntu version
+RT_UBUNTU_HIP_SDK_SUPPORT: str = "rt_ubuntu_hip_sdk_support"
+RT_UBUNTU_CUDA_SDK_SUPPORT: str = "rt_ubuntu_cuda_sdk_support"
 
 
 class FilterDebugMode(Enum):
@@ -0,0 +1,350 @@
+"""Local search, which rewrites combinations to shrink a combination-list.
+
+`minimize_combination_list()` can only remove combinations, whose parameter-value-pairs are all
+covered by other combinations. Often, the parameter-value-pairs of a combination could be moved to
+other combinations by changing some of their parameter-values. The local search removes a
+combination and repairs the lost parameter-value-pairs with simulated annealing: a move changes a
+single parameter-value of a combination, which needs to pass the filter chain. If all expected
+parameter-value-pairs are covered again, the combination-list is one combination shorter.
+Otherwise, the last complete combination-list is restored and the next combination is tried.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Set, Tuple
+from bashi.types import CombinationList, ParameterValuePair
+from bashi.minimize import IdPair, get_expected_id_pairs, minimize_combination_list
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+
+# maximum number of moves to repair the parameter-value-pairs of a removed combination
+_MAX_REPAIR_STEPS: int = 2000
+# number of combinations, which are evaluated for a single move
+_MOVE_CANDIDATES: int = 8
+_RANDOM_CANDIDATES: int = 2
+_START_TEMPERATURE: float = 0.5
+_MIN_TEMPERATURE: float = 0.05
+_COOLING_FACTOR: float = 0.999
+
+# the worker processes are forked and inherit the arguments, therefore the filter chain and the
+# runtime infos do not need to be pickled
+_WORKER_ARGUMENTS: Tuple = ()
+
+
+# pylint: disable=too-many-instance-attributes,too-few-public-methods
+class _LocalSearch:
+    """State of the local search. The combinations are stored as list of ids. The position of an
+    id is the index of its parameter in the registry.
+    """
+
+    def __init__(
+        self,
+        registry: ParameterValueRegistry,
+        combination_list: CombinationList,
+        expected_ids: Set[IdPair],
+        row_filter: Callable[..., bool],
+        seed: int,
+    ):
+        """Construct new local search.
+
+        Args:
+            registry (ParameterValueRegistry): registry, which contains all parameter-values
+            combination_list (CombinationList): start combination-list
+            expected_ids (Set[IdPair]): id pairs, which need to be covered
+            row_filter (Callable[..., bool]): filter, which decides if a combination is valid
+            seed (int): seed of the random number generator
+
+        Raises:
+            ValueError: if a combination does not contain all parameters
+        """
+        self.registry = registry
+        self.expected_ids = expected_ids
+        self.row_filter = row_filter
+        self.random = random.Random(seed)
+
+        parameters = registry.parameters
+        self.rows: List[List[int]] = []
+        for comb in combination_list:
+            if len(comb) != len(parameters):
+                raise ValueError(
+                    f"the combination {dict(comb)} does not contain all parameters {parameters}"
+                )
+            row = [0] * len(parameters)
+            for value_id in registry.encode_combination(comb):
+                row[registry.get_parameter_index(value_id)] = value_id
+            self.rows.append(row)
+
+        self.count: Dict[IdPair, int] = {pair: 0 for pair in expected_ids}
+        for row in self.rows:
+            for pair in self._pairs(row):
+                self.count[pair] += 1
+        self.missing: Set[IdPair] = {pair for pair, count in self.count.items() if count == 0}
+
+        # each combination covers at most one pair of two parameters, therefore the list cannot be
+        # shorter than the maximum number of expected pairs of two parameters
+        pairs_per_parameters = Counter(
+            (registry.get_parameter_index(first_id), registry.get_parameter_index(second_id))
+            for first_id, second_id in expected_ids
+        )
+        self.lower_bound: int = max(pairs_per_parameters.values(), default=0)
+
+    def _pairs(self, row: List[int]) -> List[IdPair]:
+        """Returns the expected id pairs of a row."""
+        sorted_ids = sorted(row)
+        return [
+            (first_id, second_id)
+            for i, first_id in enumerate(sorted_ids)
+            for second_id in sorted_ids[i + 1 :]
+            if (first_id, second_id) in self.expected_ids
+        ]
+
+    def _add_pair(self, pair: IdPair):
+        if pair in self.count:
+            self.count[pair] += 1
+            if self.count[pair] == 1:
+                self.missing.discard(pair)
+
+    def _remove_pair(self, pair: IdPair):
+        if pair in self.count:
+            self.count[pair] -= 1
+            if self.count[pair] == 0:
+                self.missing.add(pair)
+
+    def _delta(self, row: List[int], position: int, value_id: int) -> int:
+        """Returns the change of the number of missing pairs, if the id at the position of the row
+        is replaced."""
+        old_id = row[position]
+        delta = 0
+        for other_id in row:
+            if other_id == old_id:
+                continue
+            if self.count.get((min(old_id, other_id), max(old_id, other_id)), 0) == 1:
+                delta += 1
+            if self.count.get((min(value_id, other_id), max(value_id, other_id))) == 0:
+                delta -= 1
+        return delta
+
+    def _apply(self, row: List[int], position: int, value_id: int):
+        old_id = row[position]
+        for other_id in row:
+            if other_id != old_id:
+                self._remove_pair((min(old_id, other_id), max(old_id, other_id)))
+                self._add_pair((min(value_id, other_id), max(value_id, other_id)))
+        row[position] = value_id
+
+    def _is_valid(self, row: List[int], position: int, value_id: int) -> bool:
+        new_row = list(row)
+        new_row[position] = value_id
+        return self.row_filter(self.registry.decode_combination(new_row))
+
+    def _remove_row(self, index: int):
+        for pair in self._pairs(self.rows[index]):
+            self._remove_pair(pair)
+        del self.rows[index]
+
+    def _remove_redundant_rows(self):
+        for index in reversed(range(len(self.rows))):
+            if all(self.count[pair] > 1 for pair in self._pairs(self.rows[index])):
+                self._remove_row(index)
+
+    def _step(self, temperature: float):
+        """Try to cover a random missing pair with simulated annealing. The missing pair is set in
+        some random combinations, the best move passing the filter is accepted with the Metropolis
+        criterion."""
+        first_id, second_id = self.random.choice(sorted(self.missing))
+        first_pos = self.registry.get_parameter_index(first_id)
+        second_pos = self.registry.get_parameter_index(second_id)
+
+        # combinations, which contain one parameter-value of the pair, need only a single change
+        half_covered = [
+            index
+            for index, row in enumerate(self.rows)
+            if row[first_pos] == first_id or row[second_pos] == second_id
+        ]
+        indices = self.random.sample(half_covered, min(len(half_covered), _MOVE_CANDIDATES))
+        indices += [self.random.randrange(len(self.rows)) for _ in range(_RANDOM_CANDIDATES)]
+
+        moves: List[Tuple[int, int, int, int]] = []
+        for index in indices:
+            row = self.rows[index]
+            if row[first_pos] == first_id:
+                position, value_id = second_pos, second_id
+            elif row[second_pos] == second_id or self.random.random() < 0.5:
+                position, value_id = first_pos, first_id
+            else:
+                position, value_id = second_pos, second_id
+            moves.append((self._delta(row, position, value_id), index, position, value_id))
+
+        for delta, index, position, value_id in sorted(moves):
+            row = self.rows[index]
+            if not self._is_valid(row, position, value_id):
+                continue
+            if delta <= 0 or self.random.random() < math.exp(-delta / temperature):
+                self._apply(row, position, value_id)
+            return
+
+    def _try_remove_row(self, index: int, deadline: float) -> bool:
+        """Remove a combination and try to repair the coverage.
+
+        Returns:
+            bool: True if all pairs are covered again, otherwise the state is restored
+        """
+        # the coverage of the current combination-list is complete
+        assert not self.missing
+        backup_rows = [list(row) for row in self.rows]
+        backup_count = dict(self.count)
+        backup_missing = set(self.missing)
+
+        self._remove_row(index)
+        temperature = _START_TEMPERATURE
+        for _ in range(_MAX_REPAIR_STEPS):
+            if not self.missing or time.monotonic() > deadline:
+                break
+            self._step(temperature)
+            temperature = max(temperature * _COOLING_FACTOR, _MIN_TEMPERATURE)
+
+        if not self.missing:
+            self._remove_redundant_rows()
+            return True
+        self.rows = backup_rows
+        self.count = backup_count
+        self.missing = backup_missing
+        return False
+
+    def run(self, deadline: float) -> CombinationList:
+        """Remove combinations until the deadline is reached or no combination can be removed.
+
+        Args:
+            deadline (float): end of the search, compared to `time.monotonic()`
+
+        Returns:
+            CombinationList: shortest combination-list
+        """
+        failed: Set[Tuple[int, ...]] = set()
+        while len(self.rows) > self.lower_bound and time.monotonic() < deadline:
+            # combinations, which cover only a few pairs alone, are the easiest to remove
+            candidates = sorted(
+                (
+                    sum(1 for pair in self._pairs(row) if self.count[pair] == 1),
+                    index,
+                )
+                for index, row in enumerate(self.rows)
+                if tuple(row) not in failed
+            )
+            if not candidates:
+                break
+            _, index = candidates[0]
+            row_key = tuple(self.rows[index])
+            if self._try_remove_row(index, deadline):
+                failed.clear()
+            else:
+                failed.add(row_key)
+        return self.registry.decode_combination_list(self.rows)
+
+
+def _run_local_search(seed: int) -> CombinationList:
+    """Worker function. Run the local search with the arguments inherited from the parent process.
+
+    Args:
+        seed (int): seed of the random number generator
+
+    Returns:
+        CombinationList: shortest combination-list
+    """
+    registry, combination_list, expected_ids, row_filter, time_budget = _WORKER_ARGUMENTS
+    return _LocalSearch(registry, combination_list, expected_ids, row_filter, seed).run(
+        time.monotonic() + time_budget
+    )
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def optimize_combination_list(
+    combination_list: CombinationList,
+    expected_pairs: List[ParameterValuePair],
+    row_filter: Callable[..., bool],
+    time_budget: float = 10.0,
+    restarts: int = 1,
+    jobs: int | None = None,
+    seed: int = 0,
+) -> CombinationList:
+    """Shrink a combination-list by rewriting its combinations with a local search. First,
+    redundant combinations are removed with `minimize_combination_list()`. Afterwards, the local
+    search removes one combination after another and changes parameter-values of the other
+    combinations until all expected parameter-value-pairs, which were covered by the input, are
+    covered again. Each changed combination passes the row filter.
+
+    The local search is randomized. Several restarts with different seeds can run in parallel and
+    the shortest combination-list is returned. The optimisation is opt-in, because it can take the
+    whole time budget.
+
+    Args:
+        combination_list (CombinationList): combination-list. Each combination needs to contain all
+            parameters.
+        expected_pairs (List[ParameterValuePair]): parameter-value-pairs, which need to be covered
+        row_filter (Callable[..., bool]): filter, which decides if a combination is valid, for
+            example the `FilterChain` used to generate the combination-list
+        time_budget (float, optional): Time budget of each restart in seconds. Defaults to 10.0.
+        restarts (int, optional): Number of restarts with different seeds. Defaults to 1.
+        jobs (int | None, optional): Number of worker processes for the restarts. If None, the
+            number of CPUs is used. If the platform does not support forking, the restarts run one
+            after another in the current process. Defaults to None.
+        seed (int, optional): Seed of the first restart. The restart i uses `seed + i`. Defaults to
+            0.
+
+    Raises:
+        ValueError: if the combinations do not contain all parameters or restarts is smaller than 1
+
+    Returns:
+        CombinationList: new combination-list, which is not longer than the input
+    """
+    global _WORKER_ARGUMENTS  # pylint: disable=global-statement
+
+    if restarts < 1:
+        raise ValueError(f"restarts needs to be at least 1: {restarts}")
+
+    minimized = minimize_combination_list(combination_list, expected_pairs)
+    if len(minimized) <= 1:
+        return minimized
+
+    registry = ParameterValueRegistry()
+    encoded_list = registry.encode_combination_list(minimized)
+    # the local search keeps the coverage of the input, not covered pairs are ignored
+    expected_ids = get_expected_id_pairs(registry, expected_pairs) & get_covered_id_pairs(
+        encoded_list
+    )
+    seeds = [seed + restart for restart in range(restarts)]
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, restarts))
+
+    if jobs == 1 or "fork" not in multiprocessing.get_all_start_methods():
+        results = [
+            _LocalSearch(registry, minimized, expected_ids, row_filter, restart_seed).run(
+                time.monotonic() + time_budget
+            )
+            for restart_seed in seeds
+        ]
+    else:
+        _WORKER_ARGUMENTS = (
+            registry,
+            minimized,
+            expected_ids,
+            row_filter,
+            time_budget,
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                results = list(executor.map(_run_local_search, seeds))
+        finally:
+            _WORKER_ARGUMENTS = ()
+
+    # min() returns the first shortest result, therefore the result does not depend on the timing
+    # of the worker processes
+    return min(results, key=len)
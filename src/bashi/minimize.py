@@ -0,0 +1,149 @@
+"""Remove redundant combinations from a combination-list.
+
+The pair-wise generator of covertable is greedy. Therefore, a generated combination-list often
+contains combinations whose parameter-value-pairs are all covered by other combinations, too. Each
+removed combination is a CI job, which does not need to run.
+"""
+
+import heapq
+from typing import Dict, List, Sequence, Set, Tuple
+from bashi.types import CombinationList, ParameterValuePair
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+
+IdPair = Tuple[int, int]
+
+
+def remove_redundant_sets(
+    pair_sets: Sequence[Set[IdPair]], order: Sequence[int], weights: Sequence[float] | None = None
+) -> List[int]:
+    """Remove all sets, whose pairs are also contained in the other sets. The sets are checked
+    one after another, the most expensive set first. Sets with the same weight are checked in the
+    given order.
+
+    Args:
+        pair_sets (Sequence[Set[IdPair]]): pairs of each set
+        order (Sequence[int]): indices of the sets, which are considered
+        weights (Sequence[float] | None, optional): weight of each set. If None, all sets have the
+            same weight. Defaults to None.
+
+    Returns:
+        List[int]: indices of the remaining sets in the given order
+    """
+    pair_count: Dict[IdPair, int] = {}
+    for index in order:
+        for pair in pair_sets[index]:
+            pair_count[pair] = pair_count.get(pair, 0) + 1
+
+    check_order = list(order)
+    if weights is not None:
+        # sorted() is stable, therefore sets with the same weight keep the given order
+        check_order.sort(key=lambda index: weights[index], reverse=True)
+
+    redundant: Set[int] = set()
+    for index in check_order:
+        if all(pair_count[pair] > 1 for pair in pair_sets[index]):
+            redundant.add(index)
+            for pair in pair_sets[index]:
+                pair_count[pair] -= 1
+
+    return [index for index in order if index not in redundant]
+
+
+def select_greedy_set_cover(
+    pair_sets: Sequence[Set[IdPair]], weights: Sequence[float] | None = None
+) -> List[int]:
+    """Select sets until all pairs of all sets are covered. The greedy algorithm for the weighted
+    set cover problem selects the set with the most uncovered pairs per weight first. Afterwards,
+    redundant sets are removed with `remove_redundant_sets()`.
+
+    Args:
+        pair_sets (Sequence[Set[IdPair]]): pairs of each set
+        weights (Sequence[float] | None, optional): positive weight of each set. If None, all sets
+            have the weight 1. Defaults to None.
+
+    Returns:
+        List[int]: indices of the selected sets in the order of selection
+    """
+    set_weights: Sequence[float] = [1.0] * len(pair_sets) if weights is None else weights
+    uncovered: Set[IdPair] = set().union(*pair_sets)
+    # lazy greedy: the gain of a set can only decrease, therefore a set whose updated gain is still
+    # the best one can be selected without updating the gain of all other sets
+    heap: List[Tuple[float, int]] = [
+        (-len(pairs) / set_weights[index], index) for index, pairs in enumerate(pair_sets)
+    ]
+    heapq.heapify(heap)
+    selected: List[int] = []
+    while uncovered and heap:
+        _, index = heapq.heappop(heap)
+        gain = len(pair_sets[index] & uncovered) / set_weights[index]
+        if gain == 0:
+            continue
+        if heap and gain < -heap[0][0]:
+            heapq.heappush(heap, (-gain, index))
+            continue
+        selected.append(index)
+        uncovered -= pair_sets[index]
+
+    return remove_redundant_sets(pair_sets, selected, weights)
+
+
+def get_expected_id_pairs(
+    registry: ParameterValueRegistry, expected_pairs: List[ParameterValuePair]
+) -> Set[IdPair]:
+    """Returns the id pairs of all expected parameter-value-pairs, whose parameter-values are
+    registered. The smaller id is always the first element of a pair, like in
+    `get_covered_id_pairs()`.
+
+    Args:
+        registry (ParameterValueRegistry): registry
+        expected_pairs (List[ParameterValuePair]): expected parameter-value-pairs
+
+    Returns:
+        Set[IdPair]: id pairs
+    """
+    expected_ids: Set[IdPair] = set()
+    for param_val_pair in expected_pairs:
+        first, second = param_val_pair.first, param_val_pair.second
+        if (first.parameter, first.parameterValue) in registry and (
+            second.parameter,
+            second.parameterValue,
+        ) in registry:
+            first_id, second_id = registry.get_pair_ids(param_val_pair)
+            expected_ids.add((min(first_id, second_id), max(first_id, second_id)))
+    return expected_ids
+
+
+def minimize_combination_list(
+    combination_list: CombinationList, expected_pairs: List[ParameterValuePair]
+) -> CombinationList:
+    """Remove combinations from the combination-list, without losing an expected
+    parameter-value-pair. Two strategies are used and the shorter result is returned:
+
+    - remove redundant combinations from the end of the combination-list to the beginning
+    - select combinations with the greedy set cover algorithm, most new parameter-value-pairs first
+
+    Expected parameter-value-pairs, which are not covered by the input, are ignored.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        expected_pairs (List[ParameterValuePair]): parameter-value-pairs, which need to be covered
+
+    Returns:
+        CombinationList: new combination-list, the combinations keep their order
+    """
+    registry = ParameterValueRegistry()
+    encoded_list = registry.encode_combination_list(combination_list)
+    expected_ids = get_expected_id_pairs(registry, expected_pairs)
+
+    # pair coverage index: expected pairs of each combination
+    pair_sets: List[Set[IdPair]] = [
+        get_covered_id_pairs([encoded]) & expected_ids for encoded in encoded_list
+    ]
+
+    # the later combinations of covertable cover less new pairs, therefore try to remove them first
+    kept = remove_redundant_sets(pair_sets, list(reversed(range(len(pair_sets)))))
+    selected = select_greedy_set_cover(pair_sets)
+    if len(selected) < len(kept):
+        kept = selected
+
+    return [combination_list[index] for index in sorted(kept)]
@@ -0,0 +1,121 @@
+"""Order a combination-list, so that consecutive CI jobs share build environments.
+
+The order of a generated combination-list depends on the internals of covertable. Combinations,
+which use the same container image, compiler toolchain or CUDA SDK are scattered over the list.
+Therefore, the runners pull a different image for nearly each job and the compiler cache is cold.
+`order_combination_list()` groups the combinations by locality keys, so that the number of switches
+between consecutive combinations is small.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+from bashi.types import Combination, CombinationList, Parameter, ParameterValue
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+# from the most to the least expensive switch: a different Ubuntu version requires a different
+# container image, a different compiler or CUDA SDK a different toolchain in the image
+DEFAULT_LOCALITY_KEYS: List[Parameter] = [
+    UBUNTU,
+    HOST_COMPILER,
+    DEVICE_COMPILER,
+    ALPAKA_ACC_GPU_CUDA_ENABLE,
+]
+
+
+def _get_sort_key(param_val: ParameterValue | None) -> Tuple:
+    """Returns a sort key for a parameter-value. Combinations without the parameter are sorted to
+    the end.
+
+    Args:
+        param_val (ParameterValue | None): parameter-value or None, if the combination does not
+            contain the parameter
+
+    Returns:
+        Tuple: sort key
+    """
+    if param_val is None:
+        return (1,)
+    return (0, param_val.name, param_val.version)
+
+
+def _order_group(
+    combinations: List[Combination],
+    locality_keys: Sequence[Parameter],
+    previous: Combination | None,
+) -> List[Combination]:
+    """Order the combinations recursively. The combinations are grouped by the first locality key
+    and each group is ordered by the remaining locality keys. The group, which has the same
+    parameter-value like the previous combination, is placed first. Therefore, the parameter-value
+    of the next locality key also does not switch at the border of two groups, if possible.
+
+    Args:
+        combinations (List[Combination]): combinations
+        locality_keys (Sequence[Parameter]): locality keys ordered by priority
+        previous (Combination | None): combination in front of the group or None
+
+    Returns:
+        List[Combination]: ordered combinations
+    """
+    if not locality_keys or len(combinations) < 2:
+        return combinations
+
+    parameter = locality_keys[0]
+    groups: Dict[ParameterValue | None, List[Combination]] = OrderedDict()
+    for comb in combinations:
+        groups.setdefault(comb.get(parameter), []).append(comb)
+
+    group_values = sorted(groups.keys(), key=_get_sort_key)
+    if previous is not None and previous.get(parameter) in groups:
+        group_values.remove(previous.get(parameter))
+        group_values.insert(0, previous.get(parameter))
+
+    ordered: List[Combination] = []
+    for param_val in group_values:
+        ordered += _order_group(
+            groups[param_val], locality_keys[1:], ordered[-1] if ordered else previous
+        )
+    return ordered
+
+
+def order_combination_list(
+    combination_list: CombinationList,
+    locality_keys: Sequence[Parameter] = tuple(DEFAULT_LOCALITY_KEYS),
+) -> CombinationList:
+    """Order the combinations, so that consecutive combinations share the parameter-values of the
+    locality keys. The combinations are grouped hierarchically: all combinations with the same
+    parameter-value of the first locality key are consecutive, which is the minimal number of
+    switches for the first key. Within each group, the combinations are grouped by the next
+    locality key and so on. The combinations of a group keep their relative order.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        locality_keys (Sequence[Parameter], optional): Parameters ordered by the cost of a switch,
+            the most expensive first. Defaults to DEFAULT_LOCALITY_KEYS.
+
+    Returns:
+        CombinationList: new ordered combination-list with the same combinations
+    """
+    return _order_group(list(combination_list), locality_keys, None)
+
+
+def get_locality_switches(
+    combination_list: CombinationList,
+    locality_keys: Sequence[Parameter] = tuple(DEFAULT_LOCALITY_KEYS),
+) -> Dict[Parameter, int]:
+    """Count for each locality key, how often the parameter-value changes between two consecutive
+    combinations.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        locality_keys (Sequence[Parameter], optional): Parameters. Defaults to
+            DEFAULT_LOCALITY_KEYS.
+
+    Returns:
+        Dict[Parameter, int]: number of switches of each locality key
+    """
+    switches: Dict[Parameter, int] = {parameter: 0 for parameter in locality_keys}
+    for previous, current in zip(combination_list, combination_list[1:]):
+        for parameter in locality_keys:
+            if previous.get(parameter) != current.get(parameter):
+                switches[parameter] += 1
+    return switches
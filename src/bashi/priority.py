@@ -0,0 +1,249 @@
+"""Order a combination-list by the priority of the parameter-value-pairs.
+
+If a CI pipeline runs only the first K combinations of a combination-list, the order decides which
+parameter-value-pairs are tested. The order of covertable does not consider, that some
+parameter-value-pairs are more important than others, for example pairs with the newest compiler
+versions. `order_by_priority()` orders the combinations, so that each prefix covers as much
+priority as possible, and `get_coverage_curve()` reports the covered priority of each prefix.
+"""
+
+import heapq
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+from bashi.types import (
+    CombinationList,
+    PairPriority,
+    Parameter,
+    ParameterValue,
+    ParameterValueMatrix,
+    ParameterValuePair,
+    ParameterValueSingle,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.filter_base import FilterBase
+from bashi.generator import generate_combination_list
+from bashi.minimize import IdPair, get_expected_id_pairs
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+from bashi.version.relation import VersionRelation
+
+
+def get_pair_priority(
+    parameter_pair_weights: Mapping[Tuple[Parameter, Parameter], float] | None = None,
+    parameter_value_weights: Mapping[Tuple[Parameter, ParameterValue], float] | None = None,
+) -> PairPriority:
+    """Returns a pair priority, which multiplies the weight of the two parameters with the weights
+    of both parameter-values. Missing weights are 1.
+
+    Args:
+        parameter_pair_weights (Mapping[Tuple[Parameter, Parameter], float] | None, optional):
+            Weight of parameter-value-pairs of two parameters. The order of the parameters does not
+            matter. Defaults to None.
+        parameter_value_weights (Mapping[Tuple[Parameter, ParameterValue], float] | None,
+            optional): Weight of each parameter-value-pair, which contains the parameter-value.
+            Defaults to None.
+
+    Returns:
+        PairPriority: pair priority
+    """
+    pair_weights: Dict[Tuple[Parameter, Parameter], float] = {}
+    for (first, second), weight in (parameter_pair_weights or {}).items():
+        pair_weights[(first, second)] = weight
+        pair_weights[(second, first)] = weight
+    value_weights = parameter_value_weights or {}
+
+    def pair_priority(param_val_pair: ParameterValuePair) -> float:
+        first, second = param_val_pair.first, param_val_pair.second
+        return (
+            pair_weights.get((first.parameter, second.parameter), 1.0)
+            * value_weights.get((first.parameter, first.parameterValue), 1.0)
+            * value_weights.get((second.parameter, second.parameterValue), 1.0)
+        )
+
+    return pair_priority
+
+
+def get_newest_version_weights(
+    parameter_value_matrix: ParameterValueMatrix,
+    parameters: Iterable[Parameter] = (HOST_COMPILER, DEVICE_COMPILER),
+    newest: int = 1,
+    weight: float = 10.0,
+) -> Dict[Tuple[Parameter, ParameterValue], float]:
+    """Returns parameter-value weights for `get_pair_priority()`, which prefer the newest versions
+    of each parameter-value name, for example the newest GCC and the newest Clang version.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        parameters (Iterable[Parameter], optional): Parameters, whose newest versions are weighted.
+            Defaults to (HOST_COMPILER, DEVICE_COMPILER).
+        newest (int, optional): Number of weighted versions per name. Defaults to 1.
+        weight (float, optional): Weight of the newest versions. Defaults to 10.0.
+
+    Returns:
+        Dict[Tuple[Parameter, ParameterValue], float]: weight of each newest parameter-value
+    """
+    weights: Dict[Tuple[Parameter, ParameterValue], float] = {}
+    for parameter in parameters:
+        versions: Dict[str, List[ParameterValue]] = {}
+        for param_val in parameter_value_matrix.get(parameter, []):
+            versions.setdefault(param_val.name, []).append(param_val)
+        for param_vals in versions.values():
+            for param_val in sorted(param_vals, key=lambda param_val: param_val.version)[-newest:]:
+                weights[(parameter, param_val)] = weight
+    return weights
+
+
+def _get_weighted_id_pairs(
+    registry: ParameterValueRegistry,
+    expected_pairs: List[ParameterValuePair],
+    priority: PairPriority | None,
+) -> Dict[IdPair, float]:
+    """Returns the priority of all expected parameter-value-pairs as id pairs. Pairs with
+    parameter-values, which are not registered, cannot be covered and are ignored. The priority is
+    called with the parameter-value with the smaller id as first element of the pair.
+
+    Args:
+        registry (ParameterValueRegistry): registry
+        expected_pairs (List[ParameterValuePair]): expected parameter-value-pairs
+        priority (PairPriority | None): pair priority. If None, all pairs have the priority 1.
+
+    Returns:
+        Dict[IdPair, float]: priority of each id pair
+    """
+    return {
+        (first_id, second_id): (
+            1.0
+            if priority is None
+            else priority(
+                ParameterValuePair(registry.get_value(first_id), registry.get_value(second_id))
+            )
+        )
+        for first_id, second_id in get_expected_id_pairs(registry, expected_pairs)
+    }
+
+
+def order_by_priority(
+    combination_list: CombinationList,
+    expected_pairs: List[ParameterValuePair],
+    priority: PairPriority,
+) -> CombinationList:
+    """Order the combinations, so that each prefix of the combination-list covers as much priority
+    as possible. The greedy algorithm selects the combination with the highest priority of not
+    covered parameter-value-pairs next. Combinations, which do not cover new expected
+    parameter-value-pairs, are appended in the original order.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        expected_pairs (List[ParameterValuePair]): parameter-value-pairs, which should be covered
+        priority (PairPriority): priority of each parameter-value-pair
+
+    Returns:
+        CombinationList: new ordered combination-list with the same combinations
+    """
+    registry = ParameterValueRegistry()
+    encoded_list = registry.encode_combination_list(combination_list)
+    weighted_ids = _get_weighted_id_pairs(registry, expected_pairs, priority)
+    pair_sets = [
+        {pair for pair in get_covered_id_pairs([encoded]) if pair in weighted_ids}
+        for encoded in encoded_list
+    ]
+
+    covered: Set[IdPair] = set()
+
+    def gain(index: int) -> float:
+        return sum(weighted_ids[pair] for pair in pair_sets[index] if pair not in covered)
+
+    # lazy greedy: the gain of a combination can only decrease, therefore a combination, whose
+    # updated gain is still the highest one, can be selected without updating all other gains
+    heap: List[Tuple[float, int]] = [(-gain(index), index) for index in range(len(pair_sets))]
+    heapq.heapify(heap)
+    selected: List[int] = []
+    while heap:
+        old_gain, index = heapq.heappop(heap)
+        new_gain = gain(index)
+        if new_gain <= 0.0:
+            continue
+        if new_gain < -old_gain - 1e-12:
+            heapq.heappush(heap, (-new_gain, index))
+            continue
+        selected.append(index)
+        covered.update(pair_sets[index])
+
+    selected_set = set(selected)
+    selected += [index for index in range(len(combination_list)) if index not in selected_set]
+    return [combination_list[index] for index in selected]
+
+
+def get_coverage_curve(
+    combination_list: CombinationList,
+    expected_pairs: List[ParameterValuePair],
+    priority: PairPriority | None = None,
+) -> List[float]:
+    """Returns the cumulative coverage of each prefix of the combination-list. The value at index
+    i is the fraction of the priority of all expected parameter-value-pairs, which is covered by
+    the first i + 1 combinations.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        expected_pairs (List[ParameterValuePair]): expected parameter-value-pairs
+        priority (PairPriority | None, optional): Priority of each parameter-value-pair. If None,
+            each pair has the priority 1. Defaults to None.
+
+    Returns:
+        List[float]: covered fraction of the priority of each prefix between 0 and 1
+    """
+    registry = ParameterValueRegistry()
+    encoded_list = registry.encode_combination_list(combination_list)
+    weighted_ids = _get_weighted_id_pairs(registry, expected_pairs, priority)
+    # pairs, which are not registered, are not covered, but part of the total priority; each pair
+    # is counted once, independent of the order of its parameter-values
+    unique_pairs: Dict[FrozenSet[ParameterValueSingle], ParameterValuePair] = {}
+    for param_val_pair in expected_pairs:
+        unique_pairs.setdefault(frozenset(param_val_pair), param_val_pair)
+    total = sum(
+        1.0 if priority is None else priority(param_val_pair)
+        for param_val_pair in unique_pairs.values()
+    )
+
+    curve: List[float] = []
+    covered = 0.0
+    for encoded in encoded_list:
+        for pair in get_covered_id_pairs([encoded]):
+            covered += weighted_ids.pop(pair, 0.0)
+        curve.append(covered / total if total > 0 else 1.0)
+    return curve
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def generate_priority_ordered_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    priority: PairPriority,
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+) -> CombinationList:
+    """Generate a combination-list like `generate_combination_list()` and order it with
+    `order_by_priority()`, so that each prefix covers as much priority as possible.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        version_relation (VersionRelation): Provides information about the relationships between
+            the versions of various parameter-values.
+        runtime_infos (Dict[str, Callable[..., bool]]): runtime infos of the filter chain
+        priority (PairPriority): priority of each parameter-value-pair
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi filters.
+            Defaults to FilterBase().
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+
+    Returns:
+        CombinationList: priority ordered combination-list
+    """
+    combination_list = generate_combination_list(
+        parameter_value_matrix, version_relation, runtime_infos, custom_filter, debug_print
+    )
+    expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+        parameter_value_matrix, version_relation, runtime_infos
+    )
+    return order_by_priority(combination_list, expected_pairs, priority)
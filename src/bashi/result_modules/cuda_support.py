@@ -60,10 +60,10 @@ def remove_cuda_specific_parameter_value_pairs(
         parameter_value_pairs, removed_parameter_value_pairs
     )
     _remove_unsupported_nvcc_ubuntu_combinations(
-        parameter_value_pairs, removed_parameter_value_pairs, version_relation
+        parameter_value_pairs, removed_parameter_value_pairs, version_relation, runtime_infos
     )
     _remove_unsupported_cuda_backend_ubuntu_combinations(
-        parameter_value_pairs, removed_parameter_value_pairs, version_relation
+        parameter_value_pairs, removed_parameter_value_pairs, version_relation, runtime_infos
     )
     _remove_unsupported_clang_cuda_ubuntu_combinations(
         parameter_value_pairs, removed_parameter_value_pairs, version_relation
@@ -502,6 +502,7 @@ def _remove_unsupported_nvcc_ubuntu_combinations(
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
     version: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]] | None = None,
 ):
     """Remove all pairs where NVCC does not support a specific Ubuntu version
 
@@ -509,13 +510,19 @@ def _remove_unsupported_nvcc_ubuntu_combinations(
         parameter_value_pairs (List[ParameterValuePair]): List of parameter-value pairs.
         removed_parameter_value_pairs (List[ParameterValuePair): list with removed
             parameter-value-pairs
+        version (VersionRelation): Provides the CUDA SDK Ubuntu version ranges.
+        runtime_infos: Dict[str, Callable[..., bool]] | None: If it contains the precomputed
+            table RT_UBUNTU_CUDA_SDK_SUPPORT, the table is used instead of the version ranges.
+            Defaults to None.
     """
+    if runtime_infos is None:
+        runtime_infos = {}
     remove_unsupported_sdk_ubuntu_combinations(
         parameter_value_pairs,
         removed_parameter_value_pairs,
         DEVICE_COMPILER,
         NVCC,
-        version.get_ubuntu_cuda_version_range(),
+        runtime_infos.get(RT_UBUNTU_CUDA_SDK_SUPPORT, version.get_ubuntu_cuda_version_range()),
     )
 
 
@@ -523,6 +530,7 @@ def _remove_unsupported_cuda_backend_ubuntu_combinations(
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
     version: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]] | None = None,
 ):
     """Remove all pairs where the CUDA backend does not support a specific Ubuntu version
 
@@ -530,13 +538,19 @@ def _remove_unsupported_cuda_backend_ubuntu_combinations(
         parameter_value_pairs (List[ParameterValuePair]): List of parameter-value pairs.
         removed_parameter_value_pairs (List[ParameterValuePair): list with removed
             parameter-value-pairs
+        version (VersionRelation): Provides the CUDA SDK Ubuntu version ranges.
+        runtime_infos: Dict[str, Callable[..., bool]] | None: If it contains the precomputed
+            table RT_UBUNTU_CUDA_SDK_SUPPORT, the table is used instead of the version ranges.
+            Defaults to None.
     """
+    if runtime_infos is None:
+        runtime_infos = {}
     remove_unsupported_sdk_ubuntu_combinations(
         parameter_value_pairs,
         removed_parameter_value_pairs,
         ALPAKA_ACC_GPU_CUDA_ENABLE,
         ALPAKA_ACC_GPU_CUDA_ENABLE,
-        version.get_ubuntu_cuda_version_range(),
+        runtime_infos.get(RT_UBUNTU_CUDA_SDK_SUPPORT, version.get_ubuntu_cuda_version_range()),
     )
 
 
@@ -33,7 +33,7 @@ def remove_hip_specific_parameter_value_pairs(
     _remove_enabled_sycl_backend_for_hipcc(parameter_value_pairs, removed_parameter_value_pairs)
     _remove_enabled_cuda_backend_for_hipcc(parameter_value_pairs, removed_parameter_value_pairs)
     _remove_unsupported_hipcc_ubuntu_combinations(
-        parameter_value_pairs, removed_parameter_value_pairs, version_relation
+        parameter_value_pairs, removed_parameter_value_pairs, version_relation, runtime_infos
     )
     _remove_runtime_unsupported_hip_backend_ubuntu_combinations(
         parameter_value_pairs, removed_parameter_value_pairs, runtime_infos
@@ -135,6 +135,7 @@ def _remove_unsupported_hipcc_ubuntu_combinations(
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
     version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]] | None = None,
 ):
     """Remove all pairs where HIPCC does not support a specific Ubuntu version
 
@@ -142,14 +143,23 @@ def _remove_unsupported_hipcc_ubuntu_combinations(
         parameter_value_pairs (List[ParameterValuePair]): List of parameter-value pairs.
         removed_parameter_value_pairs (List[ParameterValuePair): list with removed
             parameter-value-pairs
+        version_relation (VersionRelation): Provides the HIP SDK Ubuntu version ranges.
+        runtime_infos: Dict[str, Callable[..., bool]] | None: If it contains the precomputed
+            table RT_UBUNTU_HIP_SDK_SUPPORT, the table is used instead of the version ranges.
+            Defaults to None.
     """
+    if runtime_infos is None:
+        runtime_infos = {}
+    ubuntu_hip_support = runtime_infos.get(
+        RT_UBUNTU_HIP_SDK_SUPPORT, version_relation.get_ubuntu_hip_version_range()
+    )
     for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
         remove_unsupported_sdk_ubuntu_combinations(
             parameter_value_pairs,
             removed_parameter_value_pairs,
             compiler_type,
             HIPCC,
-            version_relation.get_ubuntu_hip_version_range(),
+            ubuntu_hip_support,
         )
 
 
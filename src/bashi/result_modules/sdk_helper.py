@@ -5,6 +5,7 @@ from packaging.specifiers import SpecifierSet
 from bashi.types import Parameter, ValueName, ParameterValueSingle, ParameterValuePair
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.version.dependencies.ubuntu import UbuntuSDKMinMax
+from bashi.runtime_info import UbuntuSDKSupportTable
 
 
 def remove_unsupported_sdk_ubuntu_combinations(
@@ -12,7 +13,9 @@ def remove_unsupported_sdk_ubuntu_combinations(
     removed_parameter_value_pairs: List[ParameterValuePair],
     sdk_parameter: Parameter,
     sdk_value_name: ValueName,
-    ubuntu_sdk_version_range: List[UbuntuSDKMinMax] | Dict[ValueVersion, SpecifierSet],
+    ubuntu_sdk_version_range: (
+        List[UbuntuSDKMinMax] | Dict[ValueVersion, SpecifierSet] | Callable[..., bool]
+    ),
 ):
     """Remove all pairs where SDK does not support a specific Ubuntu version
 
@@ -22,15 +25,22 @@ def remove_unsupported_sdk_ubuntu_combinations(
             parameter-value-pairs
         sdk_parameter (Parameter): Parameter of the SDK
         sdk_value_name (ValueName): Name of the SDK
-        ubuntu_sdk_version_range (List[UbuntuSDKMinMax] | Dict[ValueVersion, SpecifierSet]): Version
-            range which specified, which combination is valid.
+        ubuntu_sdk_version_range (List[UbuntuSDKMinMax] | Dict[ValueVersion, SpecifierSet] |
+            Callable[..., bool]): Version range which specified, which combination is valid. A
+            precomputed UbuntuSDKSupportTable avoids the expensive `SpecifierSet` membership tests.
     """
-    ub_sdk_ranges: Dict[ValueVersion, SpecifierSet] = {}
-    if isinstance(ubuntu_sdk_version_range, (List, UbuntuSDKMinMax)):
-        for ub_sdk in ubuntu_sdk_version_range:
-            ub_sdk_ranges[ub_sdk.ubuntu] = ub_sdk.sdk_range
+    ubuntu_sdk_table: Callable[..., bool]
+    if callable(ubuntu_sdk_version_range):
+        ubuntu_sdk_table = ubuntu_sdk_version_range
+    elif isinstance(ubuntu_sdk_version_range, (List, UbuntuSDKMinMax)):
+        ubuntu_sdk_table = UbuntuSDKSupportTable(ubuntu_sdk_version_range)
     else:
-        ub_sdk_ranges = ubuntu_sdk_version_range
+        ubuntu_sdk_table = UbuntuSDKSupportTable(
+            [
+                UbuntuSDKMinMax(ubuntu=ubuntu, sdk_range=sdk_range)
+                for ubuntu, sdk_range in ubuntu_sdk_version_range.items()
+            ]
+        )
 
     tmp_parameter_value_pairs: List[ParameterValuePair] = []
 
@@ -43,12 +53,8 @@ def remove_unsupported_sdk_ubuntu_combinations(
             # assumption: no Compiler has the version number 0.0.0
             and param_val2.parameterValue.version != OFF_VER
         ):
-            if param_val1.parameterValue.version not in ub_sdk_ranges:
-                return True
-
-            if (
-                param_val2.parameterValue.version
-                not in ub_sdk_ranges[param_val1.parameterValue.version]
+            if not ubuntu_sdk_table(
+                param_val1.parameterValue.version, param_val2.parameterValue.version
             ):
                 return True
 
@@ -1,7 +1,7 @@
 """Create list of expected parameter-value-pairs respecting bashi filter rules"""
 
 from typing import List, Tuple, Dict, Callable
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 from bashi.types import ParameterValuePair, ParameterValueMatrix
 from bashi.utils import (
     get_expected_parameter_value_pairs,
@@ -17,7 +17,7 @@ from bashi.result_modules.hip_support import remove_hip_specific_parameter_value
 from bashi.result_modules.cxx_compiler_support import remove_cxx_specific_parameter_value_pairs
 
 
-@typechecked
+@lazy_typechecked
 def get_expected_bashi_parameter_value_pairs(
     parameter_matrix: ParameterValueMatrix,
     version_relation: VersionRelation,
@@ -1,11 +1,86 @@
 """Filter rules which will generated during runtime depending on the input of the input
 parameter-value-matrix"""
 
-from typing import List, Dict
+from typing import Callable, Iterable, List, Dict, Tuple
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 from bashi.version.dependencies.ubuntu import UbuntuSDKMinMax
-from bashi.types import ValueVersion
+from bashi.version.relation import VersionRelation
+from bashi.types import Parameter, ParameterValueMatrix, ValueName, ValueVersion
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+class UbuntuSDKSupportTable:
+    """Boolean table which stores if a SDK version can be installed on a specific Ubuntu version.
+    The table is precomputed for the given Ubuntu and SDK versions, therefore a lookup is a single
+    dict access instead of several `SpecifierSet` membership tests. Version combinations which are
+    not precomputed are calculated on first access and stored in the table.
+
+    The object can be used as runtime info function. The call operator takes a Ubuntu version and a
+    SDK version and returns True, if the SDK version is in the version range of the Ubuntu version.
+    """
+
+    def __init__(
+        self,
+        ubuntu_sdk_version_range: List[UbuntuSDKMinMax],
+        ubuntus: Iterable[ValueVersion] = (),
+        sdk_versions: Iterable[ValueVersion] = (),
+    ):
+        """Construct and precompute new UbuntuSDKSupportTable.
+
+        Args:
+            ubuntu_sdk_version_range (List[UbuntuSDKMinMax]): List of supported SDK versions for
+                given Ubuntu versions.
+            ubuntus (Iterable[ValueVersion], optional): Ubuntu versions to precompute. Defaults to
+                ().
+            sdk_versions (Iterable[ValueVersion], optional): SDK versions to precompute. Defaults to
+                ().
+        """
+        self._ubuntu_sdk_version_range = ubuntu_sdk_version_range
+        # if a Ubuntu version has more than one range, the last one is used
+        self._sdk_ranges: Dict[ValueVersion, SpecifierSet] = {}
+        for ubuntu, sdk_range in ubuntu_sdk_version_range:
+            self._sdk_ranges[ubuntu] = sdk_range
+
+        # each entry contains the result of __call__() and is_bound_to_other_ubuntu()
+        self._table: Dict[Tuple[ValueVersion, ValueVersion], Tuple[bool, bool]] = {}
+        sdk_versions = list(sdk_versions)
+        for ubuntu in ubuntus:
+            for sdk_version in sdk_versions:
+                self._table[(ubuntu, sdk_version)] = self._calc_entry(ubuntu, sdk_version)
+
+    def _calc_entry(self, ubuntu_ver: ValueVersion, sdk_ver: ValueVersion) -> Tuple[bool, bool]:
+        supported = ubuntu_ver in self._sdk_ranges and sdk_ver in self._sdk_ranges[ubuntu_ver]
+        bound_to_other_ubuntu = False
+        for ubuntu, sdk_range in self._ubuntu_sdk_version_range:
+            if ubuntu != ubuntu_ver and sdk_ver in sdk_range:
+                bound_to_other_ubuntu = True
+                break
+        return (supported, bound_to_other_ubuntu)
+
+    def _get_entry(self, ubuntu_ver: ValueVersion, sdk_ver: ValueVersion) -> Tuple[bool, bool]:
+        try:
+            return self._table[(ubuntu_ver, sdk_ver)]
+        except KeyError:
+            entry = self._calc_entry(ubuntu_ver, sdk_ver)
+            self._table[(ubuntu_ver, sdk_ver)] = entry
+            return entry
+
+    def __call__(self, ubuntu_ver: ValueVersion, sdk_ver: ValueVersion) -> bool:
+        return self._get_entry(ubuntu_ver, sdk_ver)[0]
+
+    def is_bound_to_other_ubuntu(self, ubuntu_ver: ValueVersion, sdk_ver: ValueVersion) -> bool:
+        """Returns True, if the SDK version is in the version range of another Ubuntu version. This
+        means the SDK is not available on the given Ubuntu version.
+
+        Args:
+            ubuntu_ver (ValueVersion): Ubuntu version
+            sdk_ver (ValueVersion): SDK version
+
+        Returns:
+            bool: True if the SDK version belongs to another Ubuntu version
+        """
+        return self._get_entry(ubuntu_ver, sdk_ver)[1]
 
 
 # pylint: disable=too-few-public-methods
@@ -22,7 +97,7 @@ class ValidUbuntuSDK:
 def get_sdk_supporting_ubuntus(
     ubuntus: List[ValueVersion],
     sdk_versions: List[ValueVersion],
-    ubuntu_sdk_version_range: List[UbuntuSDKMinMax],
+    ubuntu_sdk_version_range: List[UbuntuSDKMinMax] | UbuntuSDKSupportTable,
 ):
     """Take a list of given Ubuntu and SDK versions and also a list of which SDK can be installed on
     which Ubuntu. Creates a validator object, which checks if a given Ubuntu version is in a list.
@@ -36,8 +111,8 @@ def get_sdk_supporting_ubuntus(
     Args:
         ubuntus (List[ValueVersion]): List of Ubuntu versions.
         sdk_versions (List[ValueVersion]): List of SDK versions
-        ubuntu_sdk_version_range (List[UbuntuHipMinMax]): List of supported SDK versions for
-            given Ubuntu versions.
+        ubuntu_sdk_version_range (List[UbuntuSDKMinMax] | UbuntuSDKSupportTable): List of
+            supported SDK versions for given Ubuntu versions or an already precomputed table.
 
     Raises:
         RuntimeError: If at least one of the input lists is empty
@@ -52,31 +127,102 @@ def get_sdk_supporting_ubuntus(
             "are empty."
         )
 
-    # store which ubuntu version is valid
-    valid_ubuntus: Dict[ValueVersion, bool] = {}
-    for ub in ubuntus:
-        valid_ubuntus[ub] = True
-
-    # parse in a better suited data structure
-    supported_ubuntus: Dict[ValueVersion, SpecifierSet] = {}
-    for ubuntu, sdk_range in ubuntu_sdk_version_range:
-        supported_ubuntus[ubuntu] = sdk_range
-
-    # disable all ubuntu versions, which are not named in the ubuntu HIP SDK support list
-    for ub_ver in valid_ubuntus:
-        if ub_ver not in supported_ubuntus:
-            valid_ubuntus[ub_ver] = False
-
-    # disable all ubuntu versions, where no HIP SDK version is available for installation
-    for ub_ver, valid in valid_ubuntus.items():
-        if valid:
-            found = False
+    ubuntu_sdk_table = (
+        ubuntu_sdk_version_range
+        if isinstance(ubuntu_sdk_version_range, UbuntuSDKSupportTable)
+        else UbuntuSDKSupportTable(ubuntu_sdk_version_range, ubuntus, sdk_versions)
+    )
+
+    # a Ubuntu version is valid, if at least one SDK version can be installed on it
+    valid_ubuntus: List[ValueVersion] = []
+    for ub_ver in ubuntus:
+        if ub_ver not in valid_ubuntus:
             for sdk_ver in sdk_versions:
-                if sdk_ver in supported_ubuntus[ub_ver]:
-                    found = True
+                if ubuntu_sdk_table(ub_ver, sdk_ver):
+                    valid_ubuntus.append(ub_ver)
                     break
 
-            if not found:
-                valid_ubuntus[ub_ver] = False
+    return ValidUbuntuSDK(valid_ubuntus)
+
+
+def _get_value_versions(
+    parameter_value_matrix: ParameterValueMatrix, parameter: Parameter, value_name: ValueName
+) -> List[ValueVersion]:
+    """Returns the versions of all enabled parameter-values of a parameter with a specific name.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        parameter (Parameter): parameter
+        value_name (ValueName): name of the parameter-values
+
+    Returns:
+        List[ValueVersion]: versions of the parameter-values
+    """
+    return [
+        param_val.version
+        for param_val in parameter_value_matrix.get(parameter, [])
+        if param_val.name == value_name and param_val.version != OFF_VER
+    ]
+
 
-    return ValidUbuntuSDK([ub for ub, valid in valid_ubuntus.items() if valid])
+def get_runtime_infos(
+    parameter_value_matrix: ParameterValueMatrix, version_relation: VersionRelation
+) -> Dict[str, Callable[..., bool]]:
+    """Get several runtime filter rules for the given input parameter-value-matrix
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        version_relation (VersionRelation): Provides information about the relationships between
+                the versions of various parameter-values. For example, which GCC version supports
+                which C++ standard.
+    Returns:
+        Dict[str, Callable[..., bool]]: Dict of filter functions
+    """
+    runtime_infos: Dict[str, Callable[..., bool]] = {}
+
+    if UBUNTU in parameter_value_matrix and DEVICE_COMPILER in parameter_value_matrix:
+        ubuntus: List[ValueVersion] = [
+            param_val.version for param_val in parameter_value_matrix[UBUNTU]
+        ]
+        if len(ubuntus) > 0:
+            for sdk_name, sdk_backend, version_range, rt_func_name, rt_table_name in [
+                (
+                    HIPCC,
+                    # the HIP backend can be only enabled or disabled, therefore it does not contain
+                    # SDK versions
+                    None,
+                    version_relation.get_ubuntu_hip_version_range(),
+                    RT_AVAILABLE_HIP_SDK_UBUNTU_VER,
+                    RT_UBUNTU_HIP_SDK_SUPPORT,
+                ),
+                (
+                    NVCC,
+                    ALPAKA_ACC_GPU_CUDA_ENABLE,
+                    version_relation.get_ubuntu_cuda_version_range(),
+                    RT_AVAILABLE_CUDA_SDK_UBUNTU_VER,
+                    RT_UBUNTU_CUDA_SDK_SUPPORT,
+                ),
+            ]:
+                if len(version_range) == 0:
+                    continue
+
+                sdks = _get_value_versions(parameter_value_matrix, DEVICE_COMPILER, sdk_name)
+                # the table contains all SDK versions of the matrix, also the versions of the
+                # backend, which are not used to decide if a Ubuntu version is available
+                table_sdks = sdks
+                if sdk_backend is not None:
+                    table_sdks = sdks + _get_value_versions(
+                        parameter_value_matrix, sdk_backend, sdk_backend
+                    )
+
+                ubuntu_sdk_table = UbuntuSDKSupportTable(version_range, ubuntus, table_sdks)
+                runtime_infos[rt_table_name] = ubuntu_sdk_table
+
+                if len(sdks) > 0:
+                    runtime_infos[rt_func_name] = get_sdk_supporting_ubuntus(
+                        ubuntus=ubuntus,
+                        sdk_versions=sdks,
+                        ubuntu_sdk_version_range=ubuntu_sdk_table,
+                    )
+
+    return runtime_infos
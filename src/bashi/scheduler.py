@@ -0,0 +1,326 @@
+"""Distribute the combinations of a combination-list to runner pools.
+
+The CI jobs run on different runner pools, for example CPU, NVIDIA, AMD and Intel runners. Each
+pool has a number of runners (capacity) and a relative speed. `schedule_combination_list()`
+assigns each combination to a runner of a pool, which supports the combination, and minimises the
+makespan, the time until the last runner finished its batch of jobs. The run time of a job is
+estimated with a duration model, which can be learned from the run times of previous pipelines with
+`learn_duration_model()`.
+"""
+
+import csv
+from typing import IO, Callable, Dict, List, Mapping, NamedTuple, Sequence, Tuple
+import packaging.version as pkv
+from bashi.types import (
+    Combination,
+    CombinationList,
+    DurationModel,
+    Parameter,
+    ParameterValue,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.ordering import DEFAULT_LOCALITY_KEYS, order_combination_list
+
+CPU_RUNNER: str = "cpu-runner"
+NVIDIA_GPU_RUNNER: str = "nvidia-gpu-runner"
+AMD_GPU_RUNNER: str = "amd-gpu-runner"
+INTEL_GPU_RUNNER: str = "intel-gpu-runner"
+
+# tag of the runners, number of runners and speed relative to the estimated duration
+RunnerPool = NamedTuple("RunnerPool", [("tag", str), ("capacity", int), ("speed", float)])
+# batches of jobs of each runner of a pool
+Schedule = Dict[str, List[CombinationList]]
+
+
+def get_runner_tags(combination: Mapping[Parameter, ParameterValue]) -> List[str]:
+    """Returns the tag of the runner pool, which is required by the combination. A combination with
+    an enabled GPU backend requires a runner with the related GPU, all other combinations run on a
+    CPU runner.
+
+    Args:
+        combination (Mapping[Parameter, ParameterValue]): combination
+
+    Returns:
+        List[str]: tags of the runner pools, which can run the combination
+    """
+
+    def enabled(backend: Parameter) -> bool:
+        return backend in combination and combination[backend].version != OFF_VER
+
+    if enabled(ALPAKA_ACC_ONEAPI_GPU_ENABLE):
+        return [INTEL_GPU_RUNNER]
+    if enabled(ALPAKA_ACC_GPU_HIP_ENABLE):
+        return [AMD_GPU_RUNNER]
+    if enabled(ALPAKA_ACC_GPU_CUDA_ENABLE):
+        return [NVIDIA_GPU_RUNNER]
+    return [CPU_RUNNER]
+
+
+def _improve_schedule(
+    runner_jobs: List[List[int]],
+    loads: List[float],
+    runtimes: List[Dict[int, float]],
+):
+    """Local search, which improves the schedule by moving a job from the runner with the highest
+    load to another runner or by swapping two jobs. A move or swap is only applied, if the higher
+    load of both runners is smaller afterwards. The search stops, if the runner with the highest
+    load cannot be improved anymore.
+
+    Args:
+        runner_jobs (List[List[int]]): jobs of each runner, modified in place
+        loads (List[float]): load of each runner, modified in place
+        runtimes (List[Dict[int, float]]): run time of each job on each runner, which can run the
+            job
+    """
+    # each step reduces the sorted load vector, the limit only protects against rounding issues
+    for _ in range(len(runtimes) * len(loads)):
+        worst = max(range(len(loads)), key=lambda runner: loads[runner])
+        best_load = loads[worst]
+        best_step: Tuple[int, int, int | None] | None = None
+        for job in runner_jobs[worst]:
+            for other, other_time in runtimes[job].items():
+                if other == worst:
+                    continue
+                new_load = max(loads[worst] - runtimes[job][worst], loads[other] + other_time)
+                if new_load < best_load - 1e-9:
+                    best_load, best_step = new_load, (job, other, None)
+                for other_job in runner_jobs[other]:
+                    if worst not in runtimes[other_job]:
+                        continue
+                    new_load = max(
+                        loads[worst] - runtimes[job][worst] + runtimes[other_job][worst],
+                        loads[other] - runtimes[other_job][other] + other_time,
+                    )
+                    if new_load < best_load - 1e-9:
+                        best_load, best_step = new_load, (job, other, other_job)
+        if best_step is None:
+            return
+
+        job, other, swap_job = best_step
+        runner_jobs[worst].remove(job)
+        runner_jobs[other].append(job)
+        loads[worst] -= runtimes[job][worst]
+        loads[other] += runtimes[job][other]
+        if swap_job is not None:
+            runner_jobs[other].remove(swap_job)
+            runner_jobs[worst].append(swap_job)
+            loads[other] -= runtimes[swap_job][other]
+            loads[worst] += runtimes[swap_job][worst]
+
+
+# pylint: disable=too-many-locals
+def schedule_combination_list(
+    combination_list: CombinationList,
+    runner_pools: Sequence[RunnerPool],
+    duration_model: DurationModel,
+    get_tags: Callable[[Combination], Sequence[str]] = get_runner_tags,
+    locality_keys: Sequence[Parameter] | None = tuple(DEFAULT_LOCALITY_KEYS),
+) -> Schedule:
+    """Distribute the combinations to the runners of the runner pools, so that the makespan is
+    small. First, the longest processing time first rule creates a schedule: the combinations are
+    sorted by the estimated duration and each combination is assigned to the runner, where it
+    finishes first. Afterwards, a local search moves and swaps jobs of the runner with the highest
+    load. The run time on a runner is the estimated duration divided by the speed of its pool.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        runner_pools (Sequence[RunnerPool]): runner pools
+        duration_model (DurationModel): estimated duration of a combination
+        get_tags (Callable[[Combination], Sequence[str]], optional): Returns the tags of the runner
+            pools, which can run a combination. Defaults to get_runner_tags.
+        locality_keys (Sequence[Parameter] | None, optional): The batch of each runner is ordered
+            with `order_combination_list()` and these locality keys. If None, the batches keep the
+            order of the combination-list. Defaults to DEFAULT_LOCALITY_KEYS.
+
+    Raises:
+        ValueError: if a runner pool has no runners or speed, or no runner pool can run a
+            combination
+
+    Returns:
+        Schedule: batches of each runner, indexed by the tag of the runner pool
+    """
+    # all runners of all pools as (tag, speed)
+    runner_infos: List[Tuple[str, float]] = []
+    runners_of_pool: Dict[str, List[int]] = {}
+    for pool in runner_pools:
+        if pool.capacity < 1 or pool.speed <= 0:
+            raise ValueError(f"runner pool needs at least one runner and a positive speed: {pool}")
+        runners_of_pool[pool.tag] = list(
+            range(len(runner_infos), len(runner_infos) + pool.capacity)
+        )
+        runner_infos += [(pool.tag, pool.speed)] * pool.capacity
+
+    # run time of each job on each runner, which can run the job
+    runtimes: List[Dict[int, float]] = []
+    for comb in combination_list:
+        duration = duration_model(comb)
+        runners = [runner for tag in get_tags(comb) for runner in runners_of_pool.get(tag, [])]
+        if not runners:
+            raise ValueError(f"no runner pool can run the combination: {dict(comb)}")
+        runtimes.append({runner: duration / runner_infos[runner][1] for runner in runners})
+
+    loads: List[float] = [0.0] * len(runner_infos)
+    runner_jobs: List[List[int]] = [[] for _ in runner_infos]
+    for job in sorted(range(len(combination_list)), key=lambda job: -max(runtimes[job].values())):
+        runner, runtime = min(runtimes[job].items(), key=lambda item: loads[item[0]] + item[1])
+        loads[runner] += runtime
+        runner_jobs[runner].append(job)
+
+    _improve_schedule(runner_jobs, loads, runtimes)
+
+    schedule: Schedule = {tag: [] for tag in runners_of_pool}
+    for (tag, _), jobs in zip(runner_infos, runner_jobs):
+        batch = [combination_list[job] for job in sorted(jobs)]
+        if locality_keys is not None:
+            batch = order_combination_list(batch, locality_keys)
+        schedule[tag].append(batch)
+    return schedule
+
+
+def get_makespan(
+    schedule: Schedule, runner_pools: Sequence[RunnerPool], duration_model: DurationModel
+) -> float:
+    """Returns the estimated time until the last runner finished its batch.
+
+    Args:
+        schedule (Schedule): schedule created by `schedule_combination_list()`
+        runner_pools (Sequence[RunnerPool]): runner pools
+        duration_model (DurationModel): estimated duration of a combination
+
+    Returns:
+        float: makespan
+    """
+    speeds = {pool.tag: pool.speed for pool in runner_pools}
+    return max(
+        (
+            sum(duration_model(comb) for comb in batch) / speeds[tag]
+            for tag, batches in schedule.items()
+            for batch in batches
+        ),
+        default=0.0,
+    )
+
+
+# pylint: disable=too-few-public-methods
+class AdditiveDurationModel:
+    """Duration model, which estimates the duration of a combination as sum of a base duration and
+    the effect of each parameter-value. Unknown parameter-values have no effect. The estimation is
+    never negative.
+    """
+
+    def __init__(
+        self, base: float, effects: Dict[Tuple[Parameter, ParameterValue], float] | None = None
+    ):
+        """Construct new AdditiveDurationModel.
+
+        Args:
+            base (float): base duration in seconds
+            effects (Dict[Tuple[Parameter, ParameterValue], float] | None, optional): Additional
+                duration in seconds of each parameter-value. Defaults to None.
+        """
+        self.base = base
+        self.effects: Dict[Tuple[Parameter, ParameterValue], float] = (
+            {} if effects is None else effects
+        )
+
+    def __call__(self, combination: Mapping[Parameter, ParameterValue]) -> float:
+        return max(
+            0.0,
+            self.base
+            + sum(self.effects.get(param_single, 0.0) for param_single in combination.items()),
+        )
+
+
+def _parse_csv_value(parameter: Parameter, value: str) -> ParameterValue:
+    """Parse a parameter-value of the CSV file. The format is `name@version` or `version`. If the
+    name is missing, the name of the parameter is used, like for the backends. The versions `ON`
+    and `OFF` are supported.
+
+    Args:
+        parameter (Parameter): parameter
+        value (str): parameter-value
+
+    Raises:
+        ValueError: if the version is invalid
+
+    Returns:
+        ParameterValue: parameter-value
+    """
+    name, _, version = value.strip().rpartition("@")
+    if name == "":
+        name = parameter
+    version = {"ON": ON, "OFF": OFF}.get(version.upper(), version)
+    try:
+        return ParameterValue(name, pkv.parse(version))
+    except pkv.InvalidVersion as e:
+        raise ValueError(f"invalid version of {parameter}: {value}") from e
+
+
+# pylint: disable=too-many-locals
+def learn_duration_model(
+    input_file: IO[str], duration_column: str = "duration", iterations: int = 20
+) -> AdditiveDurationModel:
+    """Learn an additive duration model from the run times of previous jobs. The CSV file has a
+    header with the parameters and the duration column. Each line contains the parameter-values of
+    a job and its duration in seconds, for example:
+
+        host_compiler,device_compiler,alpaka_ACC_GPU_CUDA_ENABLE,duration
+        gcc@12,nvcc@12.4,12.4,1800
+        clang@17,clang@17,OFF,600
+
+    Empty cells are ignored. The effect of each parameter-value is fitted with backfitting: the
+    effect is set to the mean residual of all jobs containing the parameter-value, until the effects
+    converge to the least squares solution.
+
+    Args:
+        input_file (IO[str]): CSV file
+        duration_column (str, optional): Name of the duration column. Defaults to "duration".
+        iterations (int, optional): Maximum number of backfitting iterations. Defaults to 20.
+
+    Raises:
+        ValueError: if the duration column is missing or a cell cannot be parsed
+
+    Returns:
+        AdditiveDurationModel: learned duration model
+    """
+    reader = csv.DictReader(input_file)
+    if reader.fieldnames is None or duration_column not in reader.fieldnames:
+        raise ValueError(f"CSV file has no column {duration_column}")
+
+    jobs: List[Tuple[List[Tuple[Parameter, ParameterValue]], float]] = []
+    for line_number, line in enumerate(reader, start=2):
+        try:
+            duration = float(line[duration_column])
+            param_singles = [
+                (parameter, _parse_csv_value(parameter, value))
+                for parameter, value in line.items()
+                if parameter != duration_column and value is not None and value.strip() != ""
+            ]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"line {line_number}: {e}") from e
+        jobs.append((param_singles, duration))
+
+    if not jobs:
+        return AdditiveDurationModel(0.0)
+
+    base = sum(duration for _, duration in jobs) / len(jobs)
+    effects: Dict[Tuple[Parameter, ParameterValue], float] = {}
+    for _ in range(iterations):
+        max_change = 0.0
+        for parameter in [name for name in reader.fieldnames if name != duration_column]:
+            residuals: Dict[Tuple[Parameter, ParameterValue], List[float]] = {}
+            for param_singles, duration in jobs:
+                estimation = base + sum(effects.get(single, 0.0) for single in param_singles)
+                for single in param_singles:
+                    if single[0] == parameter:
+                        residuals.setdefault(single, []).append(
+                            duration - estimation + effects.get(single, 0.0)
+                        )
+            for single, values in residuals.items():
+                effect = sum(values) / len(values)
+                max_change = max(max_change, abs(effect - effects.get(single, 0.0)))
+                effects[single] = effect
+        if max_change < 1e-6:
+            break
+
+    return AdditiveDurationModel(base, effects)
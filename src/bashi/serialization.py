@@ -0,0 +1,95 @@
+"""Read and write combination-lists as JSON."""
+
+import json
+from typing import IO, Any, Dict, List, Mapping
+from collections import OrderedDict
+import packaging.version as pkv
+from bashi.types import Combination, CombinationList, Parameter, ParameterValue
+
+
+def combination_to_json_object(
+    combination: Mapping[Parameter, ParameterValue]
+) -> Dict[str, List[str]]:
+    """Convert a combination to a JSON serializable dict. Each parameter is mapped to the list
+    `[value-name, value-version]`.
+
+    Args:
+        combination (Mapping[Parameter, ParameterValue]): combination or row
+
+    Returns:
+        Dict[str, List[str]]: JSON serializable dict
+    """
+    return {
+        param: [param_val.name, str(param_val.version)] for param, param_val in combination.items()
+    }
+
+
+def json_object_to_combination(json_object: Dict[str, Any]) -> Combination:
+    """Convert a dict created by `combination_to_json_object()` back to a combination. The ordering
+    of the parameters is kept.
+
+    Args:
+        json_object (Dict[str, Any]): parsed JSON object
+
+    Raises:
+        ValueError: if the JSON object does not have the expected shape
+
+    Returns:
+        Combination: combination
+    """
+    if not isinstance(json_object, dict):
+        raise ValueError(f"combination needs to be a JSON object: {json_object}")
+
+    combination: Combination = OrderedDict()
+    for param, param_val in json_object.items():
+        if not isinstance(param_val, list) or len(param_val) != 2:
+            raise ValueError(
+                f"parameter-value of {param} needs to be a list [value-name, value-version]: "
+                f"{param_val}"
+            )
+        try:
+            combination[param] = ParameterValue(str(param_val[0]), pkv.parse(str(param_val[1])))
+        except pkv.InvalidVersion as e:
+            raise ValueError(f"invalid version of {param}: {param_val[1]}") from e
+    return combination
+
+
+def write_combination_list(
+    combination_list: CombinationList, output: IO[str], json_lines: bool = False
+):
+    """Write a combination-list as JSON.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        output (IO[str]): output file
+        json_lines (bool, optional): If True, each combination is written as a single JSON object
+            per line. Otherwise, the combination-list is written as JSON array. Defaults to False.
+    """
+    if json_lines:
+        for comb in combination_list:
+            output.write(json.dumps(combination_to_json_object(comb)) + "\n")
+    else:
+        json.dump([combination_to_json_object(comb) for comb in combination_list], output, indent=1)
+        output.write("\n")
+
+
+def read_combination_list(input_file: IO[str]) -> CombinationList:
+    """Read a combination-list written by `write_combination_list()`. Supports both, the JSON array
+    and the JSON lines format.
+
+    Args:
+        input_file (IO[str]): input file
+
+    Raises:
+        ValueError: if the input is not a valid serialized combination-list
+
+    Returns:
+        CombinationList: combination-list
+    """
+    content = input_file.read()
+    if content.lstrip().startswith("["):
+        json_objects = json.loads(content)
+    else:
+        json_objects = [json.loads(line) for line in content.splitlines() if line.strip() != ""]
+
+    return [json_object_to_combination(json_object) for json_object in json_objects]
@@ -0,0 +1,346 @@
+"""Generate and verify combination-lists with a strength higher than 2.
+
+Some bugs show up only for a combination of three parameter-values, for example a host compiler
+version, a CUDA version and a C++ standard. covertable can generate 3-wise combination-lists, but
+the number of parameter-value-triples grows fast and covertable applies the filter chain to each
+of them. For the full parameter-value-matrix of alpaka, this is not practical. Therefore,
+`generate_mixed_strength_combination_list()` covers only the triples of a chosen subset of
+parameters, which is small enough for covertable, and covers the remaining parameter-value-pairs
+pairwise. `get_missing_parameter_value_tuples()` verifies the coverage of a combination-list with
+any strength.
+"""
+
+import itertools
+import math
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from bashi.types import (
+    Combination,
+    CombinationList,
+    Parameter,
+    ParameterValue,
+    ParameterValueMatrix,
+)
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.filter_base import FilterBase
+from bashi.generator import (
+    SkipCoveredPairsSorter,
+    get_generator_filter_chain,
+    make_combination_list,
+)
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+from bashi.version.relation import VersionRelation
+
+# maximum number of filter calls to complete a single combination of the strength parameters
+_MAX_COMPLETION_STEPS: int = 10000
+
+# maximum number of parameter-value-tuples, which are generated by covertable directly, if all
+# parameters are strength parameters
+_MAX_FULL_STRENGTH_TUPLES: int = 20000
+
+
+def _get_strength_parameters(
+    parameter_value_matrix: ParameterValueMatrix,
+    strength: int,
+    strength_parameters: Iterable[Parameter] | None,
+) -> List[Parameter]:
+    """Check the strength parameters and return them in the order of the parameter-value-matrix.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        strength (int): strength
+        strength_parameters (Iterable[Parameter] | None): parameters or None for all parameters
+
+    Raises:
+        ValueError: if the strength is smaller than 2, a parameter is not part of the
+            parameter-value-matrix or there are less parameters than the strength
+
+    Returns:
+        List[Parameter]: strength parameters
+    """
+    if strength < 2:
+        raise ValueError(f"strength needs to be at least 2: {strength}")
+    if strength_parameters is None:
+        parameters = list(parameter_value_matrix.keys())
+    else:
+        selected = set(strength_parameters)
+        unknown = selected - set(parameter_value_matrix.keys())
+        if unknown:
+            raise ValueError(f"parameters are not part of the parameter-value-matrix: {unknown}")
+        parameters = [parameter for parameter in parameter_value_matrix if parameter in selected]
+    if len(parameters) < strength:
+        raise ValueError(f"strength {strength} needs at least {strength} parameters: {parameters}")
+    return parameters
+
+
+def _ordered_combination(
+    parameter_value_matrix: ParameterValueMatrix, row: Dict[Parameter, ParameterValue]
+) -> Combination:
+    """Returns the (partial) row as combination in the order of the parameter-value-matrix."""
+    return OrderedDict(
+        (parameter, row[parameter]) for parameter in parameter_value_matrix if parameter in row
+    )
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def _complete_combination(
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    registry: ParameterValueRegistry,
+    covered_pairs: Set[Tuple[int, int]],
+    partial_combination: Combination,
+    max_steps: int | None = _MAX_COMPLETION_STEPS,
+) -> Combination | None:
+    """Add the missing parameters to a partial combination. The parameters are added in the order
+    of the parameter-value-matrix. The parameter-values, which cover the most not covered
+    parameter-value-pairs, are tried first. Each partial combination needs to pass the row filter,
+    if no parameter-value passes, the previous parameter is changed (backtracking).
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a (partial) combination is
+            valid
+        registry (ParameterValueRegistry): registry, which contains the parameter-value-matrix
+        covered_pairs (Set[Tuple[int, int]]): id pairs, which are already covered
+        partial_combination (Combination): partial combination, which passes the row filter
+        max_steps (int | None, optional): Maximum number of filter calls. If None, the search is
+            exhaustive. Defaults to _MAX_COMPLETION_STEPS.
+
+    Returns:
+        Combination | None: complete combination or None, if the partial combination cannot be
+            completed within `max_steps` filter calls
+    """
+    remaining = [
+        parameter for parameter in parameter_value_matrix if parameter not in partial_combination
+    ]
+    row: Dict[Parameter, ParameterValue] = dict(partial_combination)
+    steps = 0
+
+    def gain(parameter: Parameter, param_val: ParameterValue) -> int:
+        value_id = registry.get_id(parameter, param_val)
+        return sum(
+            1
+            for other_id in (registry.get_id(other, val) for other, val in row.items())
+            if (min(value_id, other_id), max(value_id, other_id)) not in covered_pairs
+        )
+
+    def search(index: int) -> bool:
+        nonlocal steps
+        if index == len(remaining):
+            return True
+        parameter = remaining[index]
+        for param_val in sorted(
+            parameter_value_matrix[parameter], key=lambda param_val: -gain(parameter, param_val)
+        ):
+            if max_steps is not None and steps >= max_steps:
+                return False
+            steps += 1
+            row[parameter] = param_val
+            if row_filter(_ordered_combination(parameter_value_matrix, row)) and search(index + 1):
+                return True
+            del row[parameter]
+        return False
+
+    if not search(0):
+        return None
+    return _ordered_combination(parameter_value_matrix, row)
+
+
+# pylint: disable=too-many-locals
+def generate_mixed_strength_combination_list(
+    parameter_value_matrix: ParameterValueMatrix,
+    version_relation: VersionRelation,
+    runtime_infos: Dict[str, Callable[..., bool]],
+    strength: int = 3,
+    strength_parameters: Iterable[Parameter] | None = None,
+    custom_filter: FilterBase = FilterBase(),
+    debug_print: FilterDebugMode = FilterDebugMode.OFF,
+    uncovered_tuples: List[Combination] | None = None,
+) -> CombinationList:
+    """Generate a combination-list, which contains each valid combination of `strength`
+    parameter-values of the strength parameters and all valid parameter-value-pairs of the
+    parameter-value-matrix.
+
+    If the strength parameters are all parameters, covertable generates the combination-list with
+    the strength directly. This is only practical for small parameter-value-matrices, because
+    covertable calls the filter chain for each parameter-value-tuple. For the full
+    parameter-value-matrix of alpaka, covertable would need about 40 seconds per row. Therefore,
+    the direct generation is refused for more than `_MAX_FULL_STRENGTH_TUPLES`
+    parameter-value-tuples. Use the strength parameters for large parameter-value-matrices.
+    Otherwise, the generation has four steps:
+
+    1. covertable generates the combinations of the strength parameters with the strength.
+    2. Each combination is completed with the remaining parameters. The completion prefers
+       parameter-values, which cover new parameter-value-pairs. If the completion does not finish
+       within `_MAX_COMPLETION_STEPS` filter calls, it is repeated with an exhaustive search. A
+       combination of the strength parameters, which cannot be completed to a valid combination,
+       is dropped.
+    3. The valid tuples of the strength parameters, which are not covered because of a dropped
+       combination, are completed one by one with an exhaustive search. Tuples, which cannot be
+       completed, are reported in `uncovered_tuples`.
+    4. covertable covers the remaining parameter-value-pairs pairwise.
+
+    Args:
+        parameter_value_matrix (ParameterValueMatrix): Input matrix with parameter and
+            parameter-values.
+        version_relation (VersionRelation): Provides information about the relationships between
+            the versions of various parameter-values.
+        runtime_infos (Dict[str, Callable[..., bool]]): runtime infos of the filter chain
+        strength (int, optional): Strength of the strength parameters. Defaults to 3.
+        strength_parameters (Iterable[Parameter] | None, optional): Parameters, whose
+            parameter-values are covered with the strength, for example HOST_COMPILER,
+            DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE and CXX_STANDARD. If None, all parameters
+            are used. Defaults to None.
+        custom_filter (FilterBase, optional): Custom filter function to extend bashi filters.
+            Defaults to FilterBase().
+        debug_print (FilterDebugMode): Depending on the debug mode, print additional information
+            for each row passing the filter function. Defaults to FilterDebugMode.OFF.
+        uncovered_tuples (List[Combination] | None, optional): If not None, the tuples of the
+            strength parameters, which pass the filter chain, but are not part of any valid
+            combination, are appended to the list. Defaults to None.
+
+    Raises:
+        ValueError: if the strength is smaller than 2, a strength parameter is not part of the
+            parameter-value-matrix, there are less strength parameters than the strength or all
+            parameters are strength parameters and the parameter-value-matrix has too many
+            parameter-value-tuples
+        covertable.exceptions.InvalidCondition: if a row cannot be completed with the filter
+
+    Returns:
+        CombinationList: combination-list
+    """
+    parameters = _get_strength_parameters(parameter_value_matrix, strength, strength_parameters)
+    filter_chain = get_generator_filter_chain(
+        version_relation, runtime_infos, custom_filter, debug_print
+    )
+
+    if len(parameters) == len(parameter_value_matrix):
+        number_of_tuples = sum(
+            math.prod(len(parameter_value_matrix[parameter]) for parameter in tuple_parameters)
+            for tuple_parameters in itertools.combinations(parameters, strength)
+        )
+        if number_of_tuples > _MAX_FULL_STRENGTH_TUPLES:
+            raise ValueError(
+                f"the parameter-value-matrix has {number_of_tuples} parameter-value-tuples of "
+                f"strength {strength}, covertable can generate at most {_MAX_FULL_STRENGTH_TUPLES} "
+                "in an acceptable time: choose a subset of strength parameters"
+            )
+        return make_combination_list(parameter_value_matrix, filter_chain, length=strength)
+
+    sub_matrix: ParameterValueMatrix = OrderedDict(
+        (parameter, parameter_value_matrix[parameter]) for parameter in parameters
+    )
+    registry = ParameterValueRegistry(parameter_value_matrix)
+    covered_pairs: Set[Tuple[int, int]] = set()
+    comb_list: CombinationList = []
+    dropped = False
+    for partial_combination in make_combination_list(sub_matrix, filter_chain, length=strength):
+        comb = _complete_combination(
+            parameter_value_matrix, filter_chain, registry, covered_pairs, partial_combination
+        )
+        if comb is None:
+            comb = _complete_combination(
+                parameter_value_matrix,
+                filter_chain,
+                registry,
+                covered_pairs,
+                partial_combination,
+                max_steps=None,
+            )
+        if comb is None:
+            dropped = True
+        else:
+            comb_list.append(comb)
+            covered_pairs.update(get_covered_id_pairs([registry.encode_combination(comb)]))
+
+    # the tuples of a dropped combination can be part of other valid combinations
+    if dropped:
+        for missing_tuple in get_missing_parameter_value_tuples(
+            comb_list, parameter_value_matrix, filter_chain, strength, parameters
+        ):
+            if any(
+                all(comb[parameter] == param_val for parameter, param_val in missing_tuple.items())
+                for comb in comb_list
+            ):
+                continue
+            comb = _complete_combination(
+                parameter_value_matrix,
+                filter_chain,
+                registry,
+                covered_pairs,
+                missing_tuple,
+                max_steps=None,
+            )
+            if comb is None:
+                if uncovered_tuples is not None:
+                    uncovered_tuples.append(missing_tuple)
+            else:
+                comb_list.append(comb)
+                covered_pairs.update(get_covered_id_pairs([registry.encode_combination(comb)]))
+
+    return comb_list + make_combination_list(
+        parameter_value_matrix,
+        filter_chain,
+        SkipCoveredPairsSorter(parameter_value_matrix, comb_list),
+    )
+
+
+def get_missing_parameter_value_tuples(
+    combination_list: CombinationList,
+    parameter_value_matrix: ParameterValueMatrix,
+    row_filter: Callable[..., bool],
+    strength: int = 3,
+    parameters: Iterable[Parameter] | None = None,
+) -> List[Combination]:
+    """Returns all valid combinations of `strength` parameter-values, which are not covered by the
+    combination-list. The row filter decides, if a combination of parameter-values is valid. It is
+    only called for combinations, which are not covered, therefore the verification of a complete
+    combination-list needs only a few filter calls.
+
+    Args:
+        combination_list (CombinationList): combination-list
+        parameter_value_matrix (ParameterValueMatrix): parameter-value-matrix
+        row_filter (Callable[..., bool]): filter, which decides if a partial combination is valid,
+            for example a FilterChain
+        strength (int, optional): Number of parameter-values of a tuple. Defaults to 3.
+        parameters (Iterable[Parameter] | None, optional): Only tuples of these parameters are
+            checked. If None, all parameters are checked. Defaults to None.
+
+    Raises:
+        ValueError: if the strength is smaller than 2, a parameter is not part of the
+            parameter-value-matrix or there are less parameters than the strength
+
+    Returns:
+        List[Combination]: missing tuples as partial combinations in the order of the
+            parameter-value-matrix
+    """
+    checked_parameters = _get_strength_parameters(parameter_value_matrix, strength, parameters)
+    registry = ParameterValueRegistry(parameter_value_matrix)
+    parameter_combinations = list(itertools.combinations(checked_parameters, strength))
+
+    covered: Set[Tuple[int, ...]] = set()
+    for comb in combination_list:
+        for parameter_combination in parameter_combinations:
+            if all(parameter in comb for parameter in parameter_combination):
+                covered.add(
+                    tuple(
+                        registry.register(parameter, comb[parameter])
+                        for parameter in parameter_combination
+                    )
+                )
+
+    missing: List[Combination] = []
+    for parameter_combination in parameter_combinations:
+        for param_vals in itertools.product(
+            *(parameter_value_matrix[parameter] for parameter in parameter_combination)
+        ):
+            ids = tuple(
+                registry.get_id(parameter, param_val)
+                for parameter, param_val in zip(parameter_combination, param_vals)
+            )
+            if ids in covered:
+                continue
+            partial_combination: Combination = OrderedDict(zip(parameter_combination, param_vals))
+            if row_filter(partial_combination):
+                missing.append(partial_combination)
+    return missing
@@ -0,0 +1,36 @@
+"""Run-time type checking, which is instrumented on the first call.
+
+typeguard instruments each function decorated with `@typechecked` by parsing the source code of the
+whole module. With several decorated functions, this dominates the import time, also if the
+functions are never called, for example in the command line tool bashi-validate.
+"""
+
+import functools
+from typing import Any, Callable, TypeVar, cast
+
+CallableT = TypeVar("CallableT", bound=Callable[..., Any])
+
+
+def lazy_typechecked(function: CallableT) -> CallableT:
+    """Decorator, which behaves like `typeguard.typechecked` for a function or method, but imports
+    typeguard and instruments the function not before the first call.
+
+    Args:
+        function (CallableT): function or method, which is not wrapped by another decorator
+
+    Returns:
+        CallableT: wrapped function
+    """
+    instrumented: Callable[..., Any] | None = None
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal instrumented
+        if instrumented is None:
+            # pylint: disable=import-outside-toplevel
+            from typeguard import typechecked
+
+            instrumented = typechecked(function)
+        return instrumented(*args, **kwargs)
+
+    return cast(CallableT, wrapper)
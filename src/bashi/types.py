@@ -1,6 +1,6 @@
 """bashi data types"""
 
-from typing import TypeAlias, List, NamedTuple, Tuple, Union
+from typing import Callable, Mapping, TypeAlias, List, NamedTuple, Tuple, Union
 from collections import OrderedDict
 from packaging.version import Version
 
@@ -20,6 +20,12 @@ ParameterValuePair = NamedTuple(
 ParameterValueTuple: TypeAlias = OrderedDict[Parameter, ParameterValue]
 Combination: TypeAlias = OrderedDict[Parameter, ParameterValue]
 CombinationList: TypeAlias = List[Combination]
+# returns the weight (e.g. runner cost) of a (possible incomplete) combination
+CostModel: TypeAlias = Callable[[Mapping[Parameter, ParameterValue]], float]
+# returns the estimated run time in seconds of a combination
+DurationModel: TypeAlias = Callable[[Mapping[Parameter, ParameterValue]], float]
+# returns the priority (non-negative weight) of a parameter-value-pair
+PairPriority: TypeAlias = Callable[[ParameterValuePair], float]
 
 ParsableValueVersion: TypeAlias = Union[str, int, float, Version]
 
@@ -1,10 +1,10 @@
 """Different helper functions for bashi"""
 
 import sys
-from typing import IO, Dict, List, Optional, Union, Callable
+from typing import IO, Dict, List, Set, Tuple, Union, Callable
 
 from packaging.specifiers import SpecifierSet
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 
 from bashi.types import (
     CombinationList,
@@ -19,10 +19,14 @@ from bashi.types import (
     Combination,
 )
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.value_registry import ParameterValueRegistry, get_covered_id_pairs
+
+# is defined in filter_base, which is imported by the filter modules without loading this module
+from bashi.filter_base import reason  # pylint: disable=unused-import
 
 
 # pylint: disable=too-many-positional-arguments
-@typechecked
+@lazy_typechecked
 def create_parameter_value_pair(  # pylint: disable=too-many-arguments
     parameter1: str,
     value_name1: str,
@@ -66,7 +70,7 @@ def create_parameter_value_pair(  # pylint: disable=too-many-arguments
     )
 
 
-@typechecked
+@lazy_typechecked
 def get_expected_parameter_value_pairs(
     parameter_matrix: ParameterValueMatrix,
 ) -> List[ParameterValuePair]:
@@ -100,7 +104,7 @@ def get_expected_parameter_value_pairs(
     return expected_pairs
 
 
-@typechecked
+@lazy_typechecked
 def _loop_over_parameter_values(
     parameters: ParameterValueMatrix,
     expected_pairs: List[ParameterValuePair],
@@ -125,7 +129,7 @@ def _loop_over_parameter_values(
             )
 
 
-@typechecked
+@lazy_typechecked
 def bi_filter(
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
@@ -175,7 +179,45 @@ def get_nice_paremter_value_pair_str(param_val_pair: ParameterValuePair) -> str:
     return output
 
 
-@typechecked
+def _get_covered_pairs(
+    combination_list: CombinationList,
+) -> Tuple[ParameterValueRegistry, Set[Tuple[int, int]]]:
+    """Encode the combination-list and collect all parameter-value-pairs, which are covered by it.
+
+    Args:
+        combination_list (CombinationList): list of combinations
+
+    Returns:
+        Tuple[ParameterValueRegistry, Set[Tuple[int, int]]]: registry, which was used for encoding
+            and the covered pairs of ids
+    """
+    registry = ParameterValueRegistry()
+    return registry, get_covered_id_pairs(registry.encode_combination_list(combination_list))
+
+
+def _is_pair_covered(
+    registry: ParameterValueRegistry,
+    covered_pairs: Set[Tuple[int, int]],
+    param_val_pair: ParameterValuePair,
+) -> bool:
+    """Check if a parameter-value-pair is contained in the covered pairs of ids.
+
+    Args:
+        registry (ParameterValueRegistry): registry, which was used to create the covered pairs
+        covered_pairs (Set[Tuple[int, int]]): covered pairs of ids
+        param_val_pair (ParameterValuePair): parameter-value-pair to check
+
+    Returns:
+        bool: True if the parameter-value-pair is covered
+    """
+    for param_single in param_val_pair:
+        if (param_single.parameter, param_single.parameterValue) not in registry:
+            return False
+    first_id, second_id = registry.get_pair_ids(param_val_pair)
+    return (min(first_id, second_id), max(first_id, second_id)) in covered_pairs
+
+
+@lazy_typechecked
 def check_parameter_value_pair_in_combination_list(
     combination_list: CombinationList,
     parameter_value_pairs: List[ParameterValuePair],
@@ -194,18 +236,10 @@ def check_parameter_value_pair_in_combination_list(
         bool: returns True, if all given parameter-values-pairs was found in the combination-list
     """
     missing_expected_param = False
+    registry, covered_pairs = _get_covered_pairs(combination_list)
 
     for ex_param_val_pair in parameter_value_pairs:
-        param1, param_val1 = ex_param_val_pair[0]
-        param2, param_val2 = ex_param_val_pair[1]
-        found = False
-        for comb in combination_list:
-            # comb contains all parameters, therefore a check is not required
-            if comb[param1] == param_val1 and comb[param2] == param_val2:
-                found = True
-                break
-
-        if not found:
+        if not _is_pair_covered(registry, covered_pairs, ex_param_val_pair):
             print(
                 f"MISSING in combination list: "
                 f"{get_nice_paremter_value_pair_str(ex_param_val_pair)}",
@@ -216,7 +250,7 @@ def check_parameter_value_pair_in_combination_list(
     return not missing_expected_param
 
 
-@typechecked
+@lazy_typechecked
 def check_unexpected_parameter_value_pair_in_combination_list(
     combination_list: CombinationList,
     parameter_value_pairs: List[ParameterValuePair],
@@ -235,41 +269,20 @@ def check_unexpected_parameter_value_pair_in_combination_list(
         bool: returns True, if no given parameter-values-pairs was found in the combination-list
     """
     found_unexpected_param = False
+    registry, covered_pairs = _get_covered_pairs(combination_list)
 
     for ex_param_val_pair in parameter_value_pairs:
-        param1, param_val1 = ex_param_val_pair[0]
-        param2, param_val2 = ex_param_val_pair[1]
-        for comb in combination_list:
-            # comb contains all parameters, therefore a check is not required
-            if comb[param1] == param_val1 and comb[param2] == param_val2:
-                print(
-                    f"FOUND unexpected parameter-value-pair in combination list: "
-                    f"{get_nice_paremter_value_pair_str(ex_param_val_pair)}",
-                    file=output,
-                )
-                found_unexpected_param = True
-                break
+        if _is_pair_covered(registry, covered_pairs, ex_param_val_pair):
+            print(
+                f"FOUND unexpected parameter-value-pair in combination list: "
+                f"{get_nice_paremter_value_pair_str(ex_param_val_pair)}",
+                file=output,
+            )
+            found_unexpected_param = True
 
     return not found_unexpected_param
 
 
-def reason(output: Optional[IO[str]], msg: str):
-    """Write the message to output if it is not None. This function is used
-    in filter functions to print additional information about filter decisions.
-
-    Args:
-        output (Optional[IO[str]]): IO object. For example, can be io.StringIO, sys.stdout or
-            sys.stderr
-        msg (str): the message
-    """
-    if output:
-        print(
-            msg,
-            file=output,
-            end="",
-        )
-
-
 def _create_version_range(
     min_version: Union[int, float, str],
     min_version_inclusive: bool,
@@ -319,7 +332,7 @@ def _create_version_range(
 
 # pylint: disable=too-many-locals
 # pylint: disable=too-many-positional-arguments
-@typechecked
+@lazy_typechecked
 def remove_parameter_value_pairs_ranges(  # pylint: disable=too-many-arguments
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
@@ -458,7 +471,7 @@ def remove_parameter_value_pairs_ranges(  # pylint: disable=too-many-arguments
 
 # pylint: disable=too-many-locals
 # pylint: disable=too-many-positional-arguments
-@typechecked
+@lazy_typechecked
 def remove_parameter_value_pairs(  # pylint: disable=too-many-arguments
     parameter_value_pairs: List[ParameterValuePair],
     removed_parameter_value_pairs: List[ParameterValuePair],
@@ -522,7 +535,7 @@ def remove_parameter_value_pairs(  # pylint: disable=too-many-arguments
     )
 
 
-@typechecked
+@lazy_typechecked
 def parse_value_version(version: ParsableValueVersion) -> ValueVersion:
     """Parse the given object to a ValueVersion
 
@@ -538,7 +551,7 @@ def parse_value_version(version: ParsableValueVersion) -> ValueVersion:
     return packaging.version.parse(str(version))
 
 
-@typechecked
+@lazy_typechecked
 def parse_parameter_single(
     parsable_parameter_single: ParsableParameterSingle,
 ) -> ParameterValueSingle:
@@ -568,7 +581,7 @@ def parse_parameter_single(
     )
 
 
-@typechecked
+@lazy_typechecked
 def parse_combination(parsable_parameter_singles: List[ParsableParameterSingle]) -> Combination:
     """Parse list of parsable object to a combination
 
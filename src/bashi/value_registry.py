@@ -0,0 +1,303 @@
+"""Compact, integer coded representation of parameter-values and combinations."""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Set, Tuple
+from collections import OrderedDict
+from bashi.types import (
+    Parameter,
+    ParameterValue,
+    ParameterValuePair,
+    ParameterValueSingle,
+    Combination,
+    CombinationList,
+)
+
+# maximum id, which can be stored in an array('H')
+_MAX_SHORT_ID: int = 0xFFFF
+
+
+class ParameterValueRegistry:
+    """Assigns each combination of parameter and parameter-value a dense integer id. The ids start
+    at 0 and are assigned in the order of registration. Therefore, the ids can be used directly as
+    index for lists and arrays.
+
+    A combination is represented as array of ids. Each id implies the parameter, therefore the
+    ordering of the parameters is kept. Use `encode_combination()` and `decode_combination()` to
+    convert between the representations and `view()` to get a read-only dict-like view of an
+    encoded combination.
+    """
+
+    def __init__(
+        self, parameter_values: Mapping[Parameter, Iterable[ParameterValue]] | None = None
+    ):
+        """Construct new ParameterValueRegistry.
+
+        Args:
+            parameter_values (Mapping[Parameter, Iterable[ParameterValue]] | None, optional):
+                Parameter-values, which are registered directly, for example a
+                parameter-value-matrix. Defaults to None.
+        """
+        self._ids: Dict[Tuple[Parameter, ParameterValue], int] = {}
+        self._values: List[ParameterValueSingle] = []
+        self._parameters: Dict[Parameter, int] = {}
+        # index of the parameter of each id
+        self._parameter_of_id: List[int] = []
+
+        if parameter_values is not None:
+            self.register_parameter_value_matrix(parameter_values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, param_val: object) -> bool:
+        return param_val in self._ids
+
+    @property
+    def parameters(self) -> List[Parameter]:
+        """Returns all registered parameters in order of registration.
+
+        Returns:
+            List[Parameter]: list of parameters
+        """
+        return list(self._parameters.keys())
+
+    @property
+    def typecode(self) -> str:
+        """Returns the typecode of the arrays created by `encode_combination()`. As long as the
+        registry contains less than 65536 entries, unsigned short is used.
+
+        Returns:
+            str: array typecode
+        """
+        return "H" if len(self._values) <= _MAX_SHORT_ID + 1 else "L"
+
+    def register(self, parameter: Parameter, parameter_value: ParameterValue) -> int:
+        """Register a parameter-value of a parameter. If it is already registered, the existing id
+        is returned.
+
+        Args:
+            parameter (Parameter): name of the parameter
+            parameter_value (ParameterValue): parameter-value
+
+        Returns:
+            int: id of the parameter-value
+        """
+        key = (parameter, parameter_value)
+        value_id = self._ids.get(key)
+        if value_id is None:
+            value_id = len(self._values)
+            self._ids[key] = value_id
+            self._values.append(ParameterValueSingle(parameter, parameter_value))
+            self._parameter_of_id.append(
+                self._parameters.setdefault(parameter, len(self._parameters))
+            )
+        return value_id
+
+    def register_parameter_value_matrix(
+        self, parameter_values: Mapping[Parameter, Iterable[ParameterValue]]
+    ):
+        """Register all parameter-values of a parameter-value-matrix.
+
+        Args:
+            parameter_values (Mapping[Parameter, Iterable[ParameterValue]]): parameter-value-matrix
+        """
+        for parameter, param_vals in parameter_values.items():
+            for param_val in param_vals:
+                self.register(parameter, param_val)
+
+    def get_id(self, parameter: Parameter, parameter_value: ParameterValue) -> int:
+        """Returns the id of a registered parameter-value.
+
+        Args:
+            parameter (Parameter): name of the parameter
+            parameter_value (ParameterValue): parameter-value
+
+        Raises:
+            KeyError: if the parameter-value is not registered
+
+        Returns:
+            int: id of the parameter-value
+        """
+        try:
+            return self._ids[(parameter, parameter_value)]
+        except KeyError as e:
+            raise KeyError(
+                f"{parameter}: {parameter_value} is not registered in the ParameterValueRegistry"
+            ) from e
+
+    def get_value(self, value_id: int) -> ParameterValueSingle:
+        """Returns the parameter and parameter-value of an id.
+
+        Args:
+            value_id (int): id of the parameter-value
+
+        Returns:
+            ParameterValueSingle: parameter and parameter-value
+        """
+        return self._values[value_id]
+
+    def get_parameter_index(self, value_id: int) -> int:
+        """Returns the index of the parameter of an id. The index of a parameter is defined by the
+        order of registration.
+
+        Args:
+            value_id (int): id of the parameter-value
+
+        Returns:
+            int: index of the parameter
+        """
+        return self._parameter_of_id[value_id]
+
+    def get_pair_ids(self, parameter_value_pair: ParameterValuePair) -> Tuple[int, int]:
+        """Returns the ids of both parameter-values of a parameter-value-pair.
+
+        Args:
+            parameter_value_pair (ParameterValuePair): parameter-value-pair
+
+        Returns:
+            Tuple[int, int]: ids of the first and second parameter-value
+        """
+        return (
+            self.get_id(
+                parameter_value_pair.first.parameter, parameter_value_pair.first.parameterValue
+            ),
+            self.get_id(
+                parameter_value_pair.second.parameter, parameter_value_pair.second.parameterValue
+            ),
+        )
+
+    def encode_combination(
+        self, combination: Mapping[Parameter, ParameterValue], register: bool = True
+    ) -> array:
+        """Encode a combination to an array of ids.
+
+        Args:
+            combination (Mapping[Parameter, ParameterValue]): combination to encode
+            register (bool, optional): If True, unknown parameter-values are registered. Otherwise
+                a KeyError is raised. Defaults to True.
+
+        Returns:
+            array: ids of the parameter-values
+        """
+        get = self.register if register else self.get_id
+        ids = [get(parameter, param_val) for parameter, param_val in combination.items()]
+        return array(self.typecode, ids)
+
+    def decode_combination(self, encoded_combination: Iterable[int]) -> Combination:
+        """Decode an array or tuple of ids to a combination.
+
+        Args:
+            encoded_combination (Iterable[int]): ids of the parameter-values
+
+        Returns:
+            Combination: decoded combination
+        """
+        values = self._values
+        return OrderedDict(values[value_id] for value_id in encoded_combination)
+
+    def encode_combination_list(
+        self, combination_list: Iterable[Mapping[Parameter, ParameterValue]], register: bool = True
+    ) -> List[array]:
+        """Encode each combination of a combination-list.
+
+        Args:
+            combination_list (Iterable[Mapping[Parameter, ParameterValue]]): combination-list
+            register (bool, optional): If True, unknown parameter-values are registered. Otherwise
+                a KeyError is raised. Defaults to True.
+
+        Returns:
+            List[array]: list of encoded combinations
+        """
+        return [self.encode_combination(comb, register) for comb in combination_list]
+
+    def decode_combination_list(self, encoded_list: Iterable[Iterable[int]]) -> CombinationList:
+        """Decode a list of encoded combinations.
+
+        Args:
+            encoded_list (Iterable[Iterable[int]]): list of encoded combinations
+
+        Returns:
+            CombinationList: combination-list
+        """
+        return [self.decode_combination(encoded) for encoded in encoded_list]
+
+    def view(self, encoded_combination: Sequence[int]) -> "CompactRow":
+        """Returns a read-only dict-like view of an encoded combination.
+
+        Args:
+            encoded_combination (Sequence[int]): ids of the parameter-values
+
+        Returns:
+            CompactRow: view of the combination
+        """
+        return CompactRow(self, encoded_combination)
+
+
+class CompactRow(Mapping[Parameter, ParameterValue]):
+    """Read-only dict-like view of an encoded combination. The view stores only the ids and a
+    reference to the registry, the parameter-values are looked up on access.
+    """
+
+    __slots__ = ("_registry", "_ids")
+
+    def __init__(self, registry: ParameterValueRegistry, encoded_combination: Sequence[int]):
+        """Construct new CompactRow.
+
+        Args:
+            registry (ParameterValueRegistry): registry, which was used to encode the combination
+            encoded_combination (Sequence[int]): ids of the parameter-values
+        """
+        self._registry = registry
+        self._ids = encoded_combination
+
+    @property
+    def ids(self) -> Sequence[int]:
+        """Returns the ids of the parameter-values.
+
+        Returns:
+            Sequence[int]: ids of the parameter-values
+        """
+        return self._ids
+
+    def __getitem__(self, parameter: Parameter) -> ParameterValue:
+        for value_id in self._ids:
+            param_single = self._registry.get_value(value_id)
+            if param_single.parameter == parameter:
+                return param_single.parameterValue
+        raise KeyError(parameter)
+
+    def __iter__(self) -> Iterator[Parameter]:
+        return (self._registry.get_value(value_id).parameter for value_id in self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def to_combination(self) -> Combination:
+        """Returns the combination as mutable OrderedDict.
+
+        Returns:
+            Combination: decoded combination
+        """
+        return self._registry.decode_combination(self._ids)
+
+
+def get_covered_id_pairs(encoded_list: Iterable[Sequence[int]]) -> Set[Tuple[int, int]]:
+    """Returns all pairs of ids, which are contained in at least one encoded combination. The
+    smaller id is always the first element of a pair.
+
+    Args:
+        encoded_list (Iterable[Sequence[int]]): list of encoded combinations
+
+    Returns:
+        Set[Tuple[int, int]]: covered id pairs
+    """
+    covered: Set[Tuple[int, int]] = set()
+    for encoded in encoded_list:
+        sorted_ids = sorted(encoded)
+        for i, first_id in enumerate(sorted_ids):
+            for second_id in sorted_ids[i + 1 :]:
+                covered.add((first_id, second_id))
+    return covered
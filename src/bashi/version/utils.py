@@ -1,17 +1,18 @@
 """Utility functions for software versions"""
 
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 import copy
+import functools
 from collections import OrderedDict
 import packaging
-from typeguard import typechecked
+from bashi.typechecking import lazy_typechecked
 from bashi.types import ValueName, ValueVersion, ParameterValue, ParameterValueMatrix
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.version import VERSIONS
 from bashi.exceptions import BashiUnknownVersion
+from bashi.frozen_matrix import FrozenParameterValueMatrix
 
 
-# pylint: disable=too-many-branches
 def get_parameter_value_matrix(
     software_versions: Dict[str, List[Union[str, int, float]]] | None = None,
     backends: List[str] | None = None,
@@ -19,6 +20,9 @@ def get_parameter_value_matrix(
     """Generates a parameter-value-matrix from all supported compilers, softwares and compilation
     configuration.
 
+    The matrix is built only once for each distinct set of arguments. Each call returns a new
+    mutable copy, therefore the returned matrix can be modified by the caller.
+
     Args:
         software_versions (Dict[str, List[Union[str, int, float]]] | None, optional): Dict of
             software version which will be used to generate the parameter-value-matrix. The default
@@ -29,30 +33,77 @@ def get_parameter_value_matrix(
     Returns:
         ParameterValueMatrix: parameter-value-matrix
     """
+    return get_frozen_parameter_value_matrix(
+        software_versions, backends
+    ).to_parameter_value_matrix()
+
+
+def get_frozen_parameter_value_matrix(
+    software_versions: Dict[str, List[Union[str, int, float]]] | None = None,
+    backends: List[str] | None = None,
+) -> FrozenParameterValueMatrix:
+    """Same like get_parameter_value_matrix() but returns the read-only and hashable version of the
+    parameter-value-matrix. The result is memoised, therefore calls with the same arguments return
+    the same object.
+
+    Args:
+        software_versions (Dict[str, List[Union[str, int, float]]] | None, optional): Dict of
+            software version which will be used to generate the parameter-value-matrix. The default
+            value is bashi.globals.VERSION. Defaults to None.
+        backends (List[str] | None, optional): List of backend names which will be used to generate
+        the parameter-value-matrix. The default value is bashi.globals.BACKENDS Defaults to None.
+
+    Returns:
+        FrozenParameterValueMatrix: parameter-value-matrix
+    """
     if software_versions is None:
         software_versions = VERSIONS
     if backends is None:
         backends = BACKENDS
 
+    # the versions are parsed via str() anyway, therefore the string representation is a valid
+    # cache key and avoids problems with unhashable or mutable arguments
+    return _build_parameter_value_matrix(
+        tuple(
+            (sw_name, tuple(str(sw_version) for sw_version in sw_versions))
+            for sw_name, sw_versions in software_versions.items()
+        ),
+        tuple(backends),
+    )
+
+
+# pylint: disable=too-many-branches
+@functools.lru_cache(maxsize=32)
+def _build_parameter_value_matrix(
+    software_versions: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    backends: Tuple[str, ...],
+) -> FrozenParameterValueMatrix:
+    """Builds the parameter-value-matrix. See get_parameter_value_matrix().
+
+    Args:
+        software_versions (Tuple[Tuple[str, Tuple[str, ...]], ...]): software names and versions
+        backends (Tuple[str, ...]): backend names
+
+    Returns:
+        FrozenParameterValueMatrix: parameter-value-matrix
+    """
     param_val_matrix: ParameterValueMatrix = OrderedDict()
 
     for compiler_type in [HOST_COMPILER, DEVICE_COMPILER]:
         compilers: List[ParameterValue] = []
-        for sw_name, sw_versions in software_versions.items():
+        for sw_name, sw_versions in software_versions:
             if sw_name in COMPILERS:
                 for sw_version in sw_versions:
-                    compilers.append(
-                        ParameterValue(sw_name, packaging.version.parse(str(sw_version)))
-                    )
+                    compilers.append(ParameterValue(sw_name, packaging.version.parse(sw_version)))
         if len(compilers) > 0:
             param_val_matrix[compiler_type] = compilers
 
     for backend in backends:
         if backend == ALPAKA_ACC_GPU_CUDA_ENABLE:
             param_val_matrix[backend] = [ParameterValue(backend, OFF_VER)]
-            for cuda_version in software_versions[NVCC]:
+            for cuda_version in dict(software_versions)[NVCC]:
                 param_val_matrix[backend].append(
-                    ParameterValue(backend, packaging.version.parse(str(cuda_version)))
+                    ParameterValue(backend, packaging.version.parse(cuda_version))
                 )
         else:
             param_val_matrix[backend] = [
@@ -60,21 +111,38 @@ def get_parameter_value_matrix(
                 ParameterValue(backend, ON_VER),
             ]
 
-    for other, versions in software_versions.items():
+    for other, versions in software_versions:
         if not other in COMPILERS + BACKENDS:
             param_val_matrix[other] = []
             for version in versions:
                 param_val_matrix[other].append(
-                    ParameterValue(other, packaging.version.parse(str(version)))
+                    ParameterValue(other, packaging.version.parse(version))
                 )
 
-    return param_val_matrix
+    return FrozenParameterValueMatrix(param_val_matrix)
 
 
-@typechecked
+@lazy_typechecked
 def is_supported_version(name: ValueName, version: ValueVersion) -> bool:
     """Check if a specific software version is supported by the bashi library.
 
+    Args:
+        name (ValueName): Name of the software, e.g. gcc, boost or ubuntu.
+        version (ValueVersion): Version of the software.
+
+    Raises:
+        ValueError: If the name of the software is not known.
+
+    Returns:
+        bool: True if supported otherwise False.
+    """
+    return _is_supported_version(name, version)
+
+
+def _is_supported_version(name: ValueName, version: ValueVersion) -> bool:
+    """Not type-checked version of `is_supported_version()`, which is used by bashi-validate for
+    each parameter-value.
+
     Args:
         name (ValueName): Name of the software, e.g. gcc, boost or ubuntu.
         version (ValueVersion): Version of the software.
@@ -1,6 +1,34 @@
 # pylint: disable=invalid-name
-"""Build your validation tool for a given parameter-value-tuple."""
+"""Build your validation tool for a given parameter-value-tuple.
 
-from bashiValidate.validator import Validator
+The Validator is loaded on first access, so that the thin client of the validator daemon does
+not pay the import time of the bashi filters.
+"""
 
-__all__ = ["Validator"]
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from bashiValidate.validator import Validator
+    from bashiValidate.verdict import Verdict
+
+# maps the lazy loaded exports to the module, which contains it
+_LAZY_EXPORTS: Dict[str, str] = {
+    "Validator": "bashiValidate.validator",
+    "Verdict": "bashiValidate.verdict",
+}
+
+__all__ = ["Validator", "Verdict"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        # cache the value, so that __getattr__ is called only once per name
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals().keys()) | set(__all__))
@@ -1,9 +1,9 @@
 """Application argument handling for bashi based validator apps."""
 
 import argparse
+import functools
 
 from typing import NamedTuple, List, Dict, Sequence, Any, Tuple
-from typeguard import typechecked
 import packaging.version
 from bashi.types import Parameter, ParameterValue
 from bashi.globals import (
@@ -22,11 +22,17 @@ from bashi.globals import (
 from bashi.printer import PARAMETER_SHORT_NAME
 from bashi.version import VERSIONS
 from bashiValidate.utils import exit_error
+from bashiValidate.batch import BATCH_FORMATS
+
+OUTPUT_FORMATS: List[str] = ["text", "jsonl"]
 
 ArgumentAlias = NamedTuple("ArgumentAlias", [("alias", List[str]), ("parameter", Parameter)])
 
+# The actions and get_validator_args() are not type-checked. They run on each start-up of
+# bashi-validate and the import and instrumentation of typeguard would dominate the start-up time.
+# argparse calls the actions always with the same argument types.
+
 
-@typechecked
 class VersionCheck(argparse.Action):
     """Verify that version can be parsed to package.version.Version.
 
@@ -62,7 +68,6 @@ class VersionCheck(argparse.Action):
             exit_error(f"Could not parse version of argument {option_string}: {version}")
 
 
-@typechecked
 class CompilerVersionCheck(argparse.Action):
     """Tries to parse compiler versions string of the shape "name@version" to a parameter-value."""
 
@@ -100,7 +105,6 @@ class CompilerVersionCheck(argparse.Action):
             exit_error(f"Could not parse version number of {name}: {version}")
 
 
-@typechecked
 class AliasParser(argparse.Action):
     """Takes a string and maps to a package.version.Version.
 
@@ -143,8 +147,82 @@ class AliasParser(argparse.Action):
             parser.param_order.append(option_string)  # type: ignore
 
 
+def _get_parameter_of_argument(argument: str) -> Parameter:
+    """Returns the parameter of a builtin argument.
+
+    Args:
+        argument (str): Name of the argument without '--' prefix
+
+    Raises:
+        ValueError: If parameter is unknown
+
+    Returns:
+        Parameter: parameter
+    """
+    modified_arg = argument
+    if argument == "host-compiler":
+        modified_arg = HOST_COMPILER
+
+    if argument == "device-compiler":
+        modified_arg = DEVICE_COMPILER
+
+    if argument == "cxx":
+        modified_arg = CXX_STANDARD
+
+    if not modified_arg in (
+        HOST_COMPILER,
+        DEVICE_COMPILER,
+        *BACKENDS,
+        UBUNTU,
+        CMAKE,
+        BOOST,
+        CXX_STANDARD,
+    ):
+        raise ValueError(f"{modified_arg} is not a know Parameter")
+
+    return modified_arg
+
+
+@functools.lru_cache(maxsize=None)
+def get_builtin_argument_aliases() -> Dict[str, ArgumentAlias]:
+    """Returns the argument names and aliases of all builtin parameters. The table is created only
+    once per process and shared by all validators.
+
+    Returns:
+        Dict[str, ArgumentAlias]: The keys are the argument names like argparse stores it ('-' is
+            replaced by '_'). Do not modify the returned dict.
+    """
+    args_alias: Dict[str, ArgumentAlias] = {}
+    for argument in (
+        "host-compiler",
+        "device-compiler",
+        *BACKENDS,
+        "ubuntu",
+        "cmake",
+        "boost",
+        "cxx",
+    ):
+        parameter = _get_parameter_of_argument(argument)
+        argument_alias = [f"--{argument}"]
+        if parameter in PARAMETER_SHORT_NAME:
+            argument_alias.append(f"--{PARAMETER_SHORT_NAME[parameter]}")
+        # argparse also replace the '-' with the '_' if it stores the argument
+        args_alias[argument.replace("-", "_")] = ArgumentAlias(argument_alias, parameter)
+    return args_alias
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_software_versions() -> Dict[str, List[str]]:
+    """Returns the default versions of the --ver-<software> arguments. The versions are converted
+    only once per process.
+
+    Returns:
+        Dict[str, List[str]]: software name and versions as string. Do not modify the returned dict.
+    """
+    return {sw_name: [str(ver) for ver in sw_versions] for sw_name, sw_versions in VERSIONS.items()}
+
+
 # pylint: disable=too-many-locals
-@typechecked
 def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAlias], List[str]]:
     """Set up command line arguments.
 
@@ -156,7 +234,9 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
         List[str]: The ordering of the parameters, how the user type it in. The ordering is
             important to trigger a specific rule first.
     """
-    args_alias: Dict[str, ArgumentAlias] = {}
+    builtin_args_alias = get_builtin_argument_aliases()
+    # the validator adds custom parameters, therefore the cached table needs to be copied
+    args_alias: Dict[str, ArgumentAlias] = dict(builtin_args_alias)
     parser = argparse.ArgumentParser(description="Check if combination of parameters is valid.")
     param_order: List[str] = []
     setattr(parser, "param_order", param_order)
@@ -167,61 +247,29 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
     argument_aliases: Dict[str, str] = {}
     setattr(parser, "argument_aliases", argument_aliases)
 
-    def add_param_alias(argument: str, args_alias: Dict[str, ArgumentAlias]) -> List[str]:
-        """Returns the argument name and also an alias, if it is defined in the PARAMETER_SHORT_NAME
+    def get_alias(argument: str) -> List[str]:
+        """Returns the argument name and also an alias, if it is defined in the
+        PARAMETER_SHORT_NAME
 
         Args:
             argument (str): Name of the argument without '--' prefix
-            args_alias (Dict[str, ArgumentAlias]): Stores the alias and it's parameter for an
-                argument
-
-        Raises:
-            ValueError: If parameter is unknown
 
         Returns:
             List[str]: List of arguments for argparse
         """
-        argument_alias = [f"--{argument}"]
-        modified_arg = argument
-        if argument == "host-compiler":
-            modified_arg = HOST_COMPILER
-
-        if argument == "device-compiler":
-            modified_arg = DEVICE_COMPILER
-
-        if argument == "cxx":
-            modified_arg = CXX_STANDARD
-
-        if not modified_arg in (
-            HOST_COMPILER,
-            DEVICE_COMPILER,
-            *BACKENDS,
-            UBUNTU,
-            CMAKE,
-            BOOST,
-            CXX_STANDARD,
-        ):
-            raise ValueError(f"{modified_arg} is not a know Parameter")
-
-        if modified_arg in PARAMETER_SHORT_NAME:
-            argument_alias.append(f"--{PARAMETER_SHORT_NAME[modified_arg]}")
-
-        # argparse also replace the '-' with the '_' if it stores the argument
-        args_alias[argument.replace("-", "_")] = ArgumentAlias(argument_alias, modified_arg)
-
-        return argument_alias
+        return builtin_args_alias[argument.replace("-", "_")].alias
 
     compiler_arg_group = parser.add_argument_group("Compiler")
 
     compiler_arg_group.add_argument(
-        *add_param_alias("host-compiler", args_alias),
+        *get_alias("host-compiler"),
         type=str,
         action=CompilerVersionCheck,
         help="Define host compiler. Shape needs to be name@version. " "For example gcc@10",
     )
 
     compiler_arg_group.add_argument(
-        *add_param_alias("device-compiler", args_alias),
+        *get_alias("device-compiler"),
         type=str,
         action=CompilerVersionCheck,
         help="Define device compiler. Shape needs to be name@version. " "For example nvcc@11.3",
@@ -232,7 +280,7 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
     for backend in BACKENDS:
         if backend != ALPAKA_ACC_GPU_CUDA_ENABLE:
             backends_arg_group.add_argument(
-                *add_param_alias(backend, args_alias),
+                *get_alias(backend),
                 type=str,
                 action=VersionCheck,
                 choices=["ON", "OFF"],
@@ -240,7 +288,7 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
             )
         else:
             backends_arg_group.add_argument(
-                *add_param_alias(backend, args_alias),
+                *get_alias(backend),
                 type=str,
                 action=VersionCheck,
                 help=f"Set backend {backend} to disabled (OFF) or a specific CUDA SDK version.",
@@ -255,7 +303,7 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
         ("cxx", "C++ version."),
     ):
         other_sw_arg_group.add_argument(
-            *add_param_alias(argument, args_alias),
+            *get_alias(argument),
             type=str,
             action=VersionCheck,
             help=help_text,
@@ -263,14 +311,61 @@ def get_validator_args() -> Tuple[argparse.ArgumentParser, Dict[str, ArgumentAli
 
     sw_versions_arg_group = parser.add_argument_group("Software Versions")
 
-    for sw_name, sw_version in VERSIONS.items():
-        parsed_sw_versions = [str(ver) for ver in sw_version]
+    for sw_name, parsed_sw_versions in get_default_software_versions().items():
         sw_versions_arg_group.add_argument(
             f"--ver-{sw_name}",
             type=str,
             nargs="*",
-            default=parsed_sw_versions,
+            default=list(parsed_sw_versions),
             help=f"Set input version for {sw_name}. Default: {parsed_sw_versions}.",
         )
 
+    batch_arg_group = parser.add_argument_group("Batch Mode")
+
+    batch_arg_group.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="Read rows from FILE ('-' for stdin) and validate each row. The filter stages are "
+        "created only once. All other arguments are used as default values for each row.",
+    )
+    batch_arg_group.add_argument(
+        "--batch-format",
+        type=str,
+        choices=BATCH_FORMATS,
+        default="args",
+        help="Format of the batch input. args: command line arguments per line, jsonl: one JSON "
+        "object per line with argument names as keys, csv: argument names as header. "
+        "Default: args.",
+    )
+
+    output_arg_group = parser.add_argument_group("Output")
+
+    output_arg_group.add_argument(
+        "--format",
+        type=str,
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format. text: colored human readable output, jsonl: one JSON object per "
+        "row with the result of each filter stage, the reasons and warnings. Default: text.",
+    )
+
+    combination_list_arg_group = parser.add_argument_group("Combination-List Mode")
+
+    combination_list_arg_group.add_argument(
+        "--combination-list",
+        type=str,
+        metavar="FILE",
+        help="Check all combinations of a combination-list written by "
+        "bashi.serialization.write_combination_list() ('-' for stdin). Prints the failing "
+        "combinations with the reasons.",
+    )
+    combination_list_arg_group.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes for --combination-list. Default: number of CPUs.",
+    )
+
     return parser, args_alias, param_order
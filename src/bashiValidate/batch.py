@@ -0,0 +1,106 @@
+"""Read rows for the batch mode of bashi based validator apps."""
+
+import csv
+import json
+import shlex
+from typing import IO, Any, Dict, Iterator, List, NamedTuple
+
+BATCH_FORMATS: List[str] = ["args", "jsonl", "csv"]
+
+# line is the line number in the input file, args the row in the shape of command line arguments
+BatchRow = NamedTuple("BatchRow", [("line", int), ("args", List[str])])
+
+
+class BatchFormatError(Exception):
+    """A line of the batch input cannot be parsed."""
+
+
+def _to_argument(name: str, value: Any) -> List[str]:
+    """Create command line arguments from an argument name and value.
+
+    Args:
+        name (str): Argument name with or without leading '--'
+        value (Any): Argument value. Booleans are mapped to ON and OFF.
+
+    Returns:
+        List[str]: Arguments. Empty if the value is None or an empty string.
+    """
+    if value is None or value == "":
+        return []
+    if isinstance(value, bool):
+        value = "ON" if value else "OFF"
+    argument = name if name.startswith("--") else f"--{name}"
+    if isinstance(value, list):
+        return [argument] + [str(val) for val in value]
+    return [argument, str(value)]
+
+
+def _read_args(input_file: IO[str]) -> Iterator[BatchRow]:
+    for line_number, line in enumerate(input_file, start=1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise BatchFormatError(f"line {line_number}: {e}") from e
+        if args:
+            yield BatchRow(line_number, args)
+
+
+def _read_jsonl(input_file: IO[str]) -> Iterator[BatchRow]:
+    for line_number, line in enumerate(input_file, start=1):
+        if line.strip() == "":
+            continue
+        try:
+            parsed_row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise BatchFormatError(f"line {line_number}: {e}") from e
+        if not isinstance(parsed_row, dict):
+            raise BatchFormatError(f"line {line_number}: expected a JSON object")
+        args: List[str] = []
+        for name, value in parsed_row.items():
+            args += _to_argument(name, value)
+        yield BatchRow(line_number, args)
+
+
+def _read_csv(input_file: IO[str]) -> Iterator[BatchRow]:
+    reader = csv.DictReader(input_file, skipinitialspace=True)
+    for csv_row in reader:
+        row_values: Dict[str, Any] = csv_row
+        args: List[str] = []
+        for name, value in row_values.items():
+            if name is None:
+                raise BatchFormatError(f"line {reader.line_num}: more values than columns")
+            args += _to_argument(name.strip(), value.strip() if value else value)
+        if args:
+            yield BatchRow(reader.line_num, args)
+
+
+def read_batch_rows(input_file: IO[str], batch_format: str = "args") -> Iterator[BatchRow]:
+    """Read rows from a file. The rows are returned in the shape of command line arguments, so
+    that they can be parsed with the argument parser of the validator.
+
+    Supported formats:
+        - args: each line contains the command line arguments of a row, e.g.
+          `--host-compiler gcc@11 --ubuntu 22.04`. Empty lines and comments starting with # are
+          ignored.
+        - jsonl: each line contains a JSON object, the keys are the argument names, e.g.
+          `{"host-compiler": "gcc@11", "ubuntu": "22.04"}`
+        - csv: the header contains the argument names, empty cells are ignored
+
+    Args:
+        input_file (IO[str]): input file
+        batch_format (str, optional): Either args, jsonl or csv. Defaults to "args".
+
+    Raises:
+        ValueError: if the format is unknown
+        BatchFormatError: if a line cannot be parsed
+
+    Returns:
+        Iterator[BatchRow]: rows with the line number
+    """
+    if batch_format == "args":
+        return _read_args(input_file)
+    if batch_format == "jsonl":
+        return _read_jsonl(input_file)
+    if batch_format == "csv":
+        return _read_csv(input_file)
+    raise ValueError(f"Unknown batch format: {batch_format}\nKnown formats: {BATCH_FORMATS}")
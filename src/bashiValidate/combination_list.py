@@ -0,0 +1,108 @@
+"""Check all combinations of a combination-list with the filter stages of a validator in
+parallel."""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Tuple
+from bashi.types import CombinationList
+from bashi.filter_base import FilterBase
+from bashi.row import BashiRow
+from bashiValidate.verdict import check_row
+
+# index of the combination in the combination-list and the reason of each failing filter stage
+FailedCombination = NamedTuple(
+    "FailedCombination", [("index", int), ("reasons", List[Tuple[str, str]])]
+)
+
+# the worker processes are forked and inherit the filter stages and the combination-list,
+# therefore the filter stages, runtime infos and combinations do not need to be pickled
+_WORKER_FILTER_STAGES: List[FilterBase] = []
+_WORKER_COMBINATION_LIST: CombinationList = []
+
+
+def _check_combination(
+    filter_stages: List[FilterBase], combination_list: CombinationList, index: int
+) -> FailedCombination | None:
+    """Check a single combination with all filter stages.
+
+    Args:
+        filter_stages (List[FilterBase]): filter stages
+        combination_list (CombinationList): combination-list
+        index (int): index of the combination
+
+    Returns:
+        FailedCombination | None: None if the combination passes all filter stages
+    """
+    verdict = check_row(filter_stages, BashiRow(combination_list[index]))
+    if not verdict:
+        return FailedCombination(index, verdict.reasons)
+    return None
+
+
+def _check_range(start: int, stop: int) -> List[FailedCombination]:
+    """Worker function. Check the combinations in the range [start, stop).
+
+    Args:
+        start (int): first index
+        stop (int): last index (exclusive)
+
+    Returns:
+        List[FailedCombination]: failed combinations
+    """
+    failed: List[FailedCombination] = []
+    for index in range(start, stop):
+        result = _check_combination(_WORKER_FILTER_STAGES, _WORKER_COMBINATION_LIST, index)
+        if result is not None:
+            failed.append(result)
+    return failed
+
+
+def check_combination_list(
+    filter_stages: List[FilterBase], combination_list: CombinationList, jobs: int | None = None
+) -> List[FailedCombination]:
+    """Check all combinations of the combination-list with the filter stages. The combinations are
+    distributed to a pool of forked worker processes. If the platform does not support forking,
+    the combinations are checked in the current process.
+
+    Args:
+        filter_stages (List[FilterBase]): filter stages, including the runtime infos
+        combination_list (CombinationList): combination-list
+        jobs (int | None, optional): Number of worker processes. If None, the number of CPUs is
+            used. Defaults to None.
+
+    Returns:
+        List[FailedCombination]: failed combinations ordered by index
+    """
+    global _WORKER_FILTER_STAGES, _WORKER_COMBINATION_LIST  # pylint: disable=global-statement
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(combination_list)))
+
+    if jobs == 1 or "fork" not in multiprocessing.get_all_start_methods():
+        failed: List[FailedCombination] = []
+        for index in range(len(combination_list)):
+            result = _check_combination(filter_stages, combination_list, index)
+            if result is not None:
+                failed.append(result)
+        return failed
+
+    # several chunks per worker for a better load balancing
+    chunk_size = max(1, len(combination_list) // (jobs * 4))
+    _WORKER_FILTER_STAGES = filter_stages
+    _WORKER_COMBINATION_LIST = combination_list
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            starts = range(0, len(combination_list), chunk_size)
+            stops = [min(start + chunk_size, len(combination_list)) for start in starts]
+            return [
+                failed_comb
+                for failed_chunk in executor.map(_check_range, starts, stops)
+                for failed_comb in failed_chunk
+            ]
+    finally:
+        _WORKER_FILTER_STAGES = []
+        _WORKER_COMBINATION_LIST = []
@@ -0,0 +1,324 @@
+"""Long running validator daemon on a Unix domain socket and the thin client to talk to it.
+
+Protocol: The client sends one JSON object per line and the daemon answers each request with one
+JSON object per line.
+
+Requests:
+    - `{"command": "validate", "args": [...], "cwd": "...", "stdin": "..."}`: validate the
+      arguments like bashi-validate. `cwd` is used to resolve relative paths and `stdin` is used as
+      input for `--batch -`. Both are optional.
+    - `{"command": "ping"}`: check if the daemon is alive
+    - `{"command": "shutdown"}`: stop the daemon
+
+Responses:
+    - `{"exit_code": int, "stdout": str, "stderr": str}` for validate
+    - `{"exit_code": 0}` for ping and shutdown
+    - `{"exit_code": 1, "stderr": str}` for invalid requests
+"""
+
+import argparse
+import contextlib
+import getpass
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import traceback
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from bashiValidate.validator import Validator
+
+# timeout in seconds of the client for a single request
+CLIENT_TIMEOUT: float = 600.0
+
+
+def get_default_socket_path() -> str:
+    """Returns the path of the socket. Can be set via the environment variable
+    BASHI_VALIDATE_SOCKET. Otherwise, a user specific file in the temp folder is used.
+
+    Returns:
+        str: path of the Unix domain socket
+    """
+    if "BASHI_VALIDATE_SOCKET" in os.environ:
+        return os.environ["BASHI_VALIDATE_SOCKET"]
+    return os.path.join(tempfile.gettempdir(), f"bashi-validate-{getpass.getuser()}.sock")
+
+
+def _is_socket(path: str) -> bool:
+    """Check if the path is an existing socket file.
+
+    Args:
+        path (str): path
+
+    Returns:
+        bool: True if the path is a socket
+    """
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _reads_batch_from_stdin(args: List[str]) -> bool:
+    """Check if the arguments enable the batch mode with stdin as input.
+
+    Args:
+        args (List[str]): application arguments
+
+    Returns:
+        bool: True if the batch input is read from stdin
+    """
+    for index, arg in enumerate(args):
+        if arg == "--batch=-" or (arg == "--batch" and args[index + 1 : index + 2] == ["-"]):
+            return True
+    return False
+
+
+class _ValidatorRequestHandler(socketserver.StreamRequestHandler):
+    """Handles all requests of a single connection."""
+
+    server: "ValidatorDaemon"
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip() == b"":
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request needs to be a JSON object")
+                response = self.server.handle_daemon_request(request)
+            except ValueError as e:
+                response = {"exit_code": 1, "stderr": f"invalid request: {e}\n"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.stop_requested:
+                return
+
+
+class ValidatorDaemon(socketserver.UnixStreamServer):
+    """Unix domain socket server, which keeps a validator alive. The filter stages, the version
+    relation and the runtime infos of the validator are reused for all requests. The requests are
+    processed one after another, because the validator is not thread safe.
+    """
+
+    def __init__(self, socket_path: str, validator: "Validator"):
+        """Bind the socket. A stale socket file of a daemon, which is not running anymore, is
+        removed.
+
+        Args:
+            socket_path (str): path of the Unix domain socket
+            validator (Validator): validator, which is used to answer the requests
+
+        Raises:
+            RuntimeError: if a daemon is already listening on the socket or the path exists, but
+                is not a socket
+        """
+        if os.path.exists(socket_path):
+            # never remove a file, which was passed as socket path by mistake
+            if not _is_socket(socket_path):
+                raise RuntimeError(f"{socket_path} exists and is not a socket")
+            if request_daemon({"command": "ping"}, socket_path) is not None:
+                raise RuntimeError(f"a bashi-validate daemon is already running on {socket_path}")
+            os.unlink(socket_path)
+
+        self.validator = validator
+        self.validator.silent = False
+        self.stop_requested = False
+        # the socket file is created with the access rights 0o600 by bind(), so that no other user
+        # can connect, not even for a short time
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _ValidatorRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def handle_daemon_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a single request.
+
+        Args:
+            request (Dict[str, Any]): parsed request
+
+        Raises:
+            ValueError: if the request is invalid
+
+        Returns:
+            Dict[str, Any]: response
+        """
+        command = request.get("command", "validate")
+        if command == "ping":
+            return {"exit_code": 0}
+        if command == "shutdown":
+            self.stop_requested = True
+            return {"exit_code": 0}
+        if command != "validate":
+            raise ValueError(f"unknown command {command}")
+
+        args = request.get("args", [])
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            raise ValueError("args needs to be a list of strings")
+        return self.validate(args, request.get("cwd"), request.get("stdin"))
+
+    def validate(
+        self, args: List[str], cwd: str | None = None, stdin: str | None = None
+    ) -> Dict[str, Any]:
+        """Validate the arguments and capture the output like the bashi-validate CLI.
+
+        Args:
+            args (List[str]): application arguments
+            cwd (str | None, optional): Working directory of the client. Defaults to None.
+            stdin (str | None, optional): Content of stdin for the batch mode. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: exit code, stdout and stderr
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+        old_cwd = os.getcwd()
+        old_stdin = sys.stdin
+        self.validator.args = args
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    if cwd is not None:
+                        os.chdir(cwd)
+                    sys.stdin = io.StringIO(stdin if stdin is not None else "")
+                    exit_code = int(not self.validator.validate())
+                except SystemExit as e:
+                    # argparse and exit_error() terminates the application
+                    exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # keep the daemon alive
+                    traceback.print_exc()
+                    exit_code = 1
+        finally:
+            sys.stdin = old_stdin
+            os.chdir(old_cwd)
+
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def serve_until_shutdown(self):
+        """Process requests until a shutdown request was received."""
+        while not self.stop_requested:
+            self.handle_request()
+
+
+def serve(validator: "Validator", socket_path: str | None = None):
+    """Run a validator daemon until a shutdown request was received or the process is interrupted.
+    Can be used to create a daemon for custom validator applications.
+
+    Args:
+        validator (Validator): validator, which is used to answer the requests
+        socket_path (str | None, optional): Path of the Unix domain socket. If None,
+            `get_default_socket_path()` is used. Defaults to None.
+    """
+    if socket_path is None:
+        socket_path = get_default_socket_path()
+
+    with ValidatorDaemon(socket_path, validator) as daemon:
+        # warm up the runtime infos for the default software versions
+        daemon.validate([])
+        try:
+            daemon.serve_until_shutdown()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if _is_socket(socket_path):
+                os.unlink(socket_path)
+
+
+def request_daemon(
+    request: Dict[str, Any], socket_path: str | None = None, timeout: float = CLIENT_TIMEOUT
+) -> Dict[str, Any] | None:
+    """Send a request to the validator daemon.
+
+    Args:
+        request (Dict[str, Any]): request
+        socket_path (str | None, optional): Path of the Unix domain socket. If None,
+            `get_default_socket_path()` is used. Defaults to None.
+        timeout (float, optional): Timeout in seconds. Defaults to CLIENT_TIMEOUT.
+
+    Returns:
+        Dict[str, Any] | None: Response of the daemon or None, if no daemon is running or the
+            socket cannot be used, for example a stale socket file of another user.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    if socket_path is None:
+        socket_path = get_default_socket_path()
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("rb") as response_file:
+                response = response_file.readline()
+    except OSError:
+        # the client falls back to the validation in the same process
+        return None
+    if response == b"":
+        return None
+    return json.loads(response)
+
+
+def client_main() -> None:
+    """Entry point of the thin client. Takes the same arguments as bashi-validate. Falls back to
+    validation in the same process, if no daemon is running.
+    """
+    args = sys.argv[1:]
+    stdin = sys.stdin.read() if _reads_batch_from_stdin(args) else None
+
+    response = request_daemon(
+        {"command": "validate", "args": args, "cwd": os.getcwd(), "stdin": stdin}
+    )
+    if response is None:
+        # pylint: disable=import-outside-toplevel
+        from bashi.version.relation import VersionRelation
+        from bashiValidate.validator import Validator
+
+        if stdin is not None:
+            sys.stdin = io.StringIO(stdin)
+        validator = Validator(VersionRelation(), args=args)
+        validator.args = args
+        sys.exit(int(not validator.validate()))
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.exit(response["exit_code"])
+
+
+def daemon_main() -> None:
+    """Entry point of the daemon."""
+    parser = argparse.ArgumentParser(
+        description="Run bashi-validate as daemon on a Unix domain socket. Use "
+        "bashi-validate-client to send requests."
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Path of the Unix domain socket. Default: $BASHI_VALIDATE_SOCKET or "
+        f"{get_default_socket_path()}",
+    )
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon.")
+    args = parser.parse_args()
+
+    if args.stop:
+        if request_daemon({"command": "shutdown"}, args.socket) is None:
+            print("no bashi-validate daemon is running", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    # pylint: disable=import-outside-toplevel
+    from bashi.version.relation import VersionRelation
+    from bashiValidate.validator import Validator
+
+    serve(Validator(VersionRelation(), args=[]), args.socket)
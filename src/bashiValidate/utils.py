@@ -1,11 +1,11 @@
 """Utility function for bashi based validator applications."""
 
 import sys
-from typeguard import typechecked
 import termcolor
+from bashi.typechecking import lazy_typechecked
 
 
-@typechecked
+@lazy_typechecked
 def exit_error(text: str):
     """Prints error message and exits application with error code 1.
 
@@ -1,13 +1,17 @@
 """Provide class to build bashi based validator app."""
 
+import argparse
+import contextlib
 import io
+import json
+import shlex
 import sys
-from typing import Dict, List, Callable
+from typing import IO, Dict, List, Callable, Mapping, Sequence, Tuple
 import termcolor
 import packaging.version
-from typeguard import typechecked
-from bashi.types import ParameterValue
-from bashi.version.utils import is_supported_version
+from bashi.typechecking import lazy_typechecked
+from bashi.types import Parameter, ParameterValue, CombinationList
+from bashi.version.utils import _is_supported_version
 from bashi.filter_base import FilterBase
 from bashi.filter_compiler import CompilerFilter
 from bashi.filter_backend import BackendFilter
@@ -16,9 +20,14 @@ from bashi.exceptions import BashiUnknownVersion
 from bashi.version import VERSIONS
 from bashi.version.utils import get_parameter_value_matrix
 from bashi.version.relation import VersionRelation
-from bashi.generator import get_runtime_infos
+from bashi.runtime_info import get_runtime_infos
 from bashi.row import BashiRow
+from bashi.printer import get_str_row_nice
+from bashi.serialization import read_combination_list, combination_to_json_object
 from .arguments import get_validator_args, ArgumentAlias, VersionCheck, AliasParser
+from .batch import read_batch_rows, BatchFormatError
+from .utils import exit_error
+from .verdict import Verdict, check_row, get_reason_buffer
 
 
 # pylint: disable=too-many-instance-attributes
@@ -58,9 +67,19 @@ class Validator:
         # list of software names, where the available versions can be set via CLI arguments
         self.software_version_names = list(VERSIONS.keys())
         self.runtime_infos: Dict[str, Callable[..., bool]] = {}
+        # runtime infos added by add_custom_runtime_info_function(), they are part of each set of
+        # runtime infos
+        self._custom_runtime_infos: Dict[str, Callable[..., bool]] = {}
         self.version_relation = version_relation
-
-    @typechecked
+        # runtime infos for each set of software versions
+        self._runtime_infos_cache: Dict[
+            Tuple[Tuple[str, Tuple[str, ...]], ...], Dict[str, Callable[..., bool]]
+        ] = {}
+        self._runtime_infos_initialized = False
+        # either text or jsonl, is set by the --format argument
+        self.output_format = "text"
+
+    @lazy_typechecked
     def add_software_version_parameter(
         self, name: str, help_text: str, short_name: str = "", choices: List[str] | None = None
     ):
@@ -83,7 +102,7 @@ class Validator:
         )
         self.argument_alias[name.replace("-", "_")] = ArgumentAlias(argument_names, name)
 
-    @typechecked
+    @lazy_typechecked
     def add_string_parameter(
         self,
         name: str,
@@ -114,11 +133,14 @@ class Validator:
             help=help_text,
             choices=value_aliases.keys(),
         )
+        # the alias tables are set as attributes of the parser by get_validator_args()
+        # pylint: disable=no-member
         self.parser.argument_value_aliases[name] = value_aliases  # type: ignore
         self.parser.argument_aliases[short_name] = name  # type: ignore
+        # pylint: enable=no-member
         self.argument_alias[name.replace("-", "_")] = ArgumentAlias(argument_names, name)
 
-    @typechecked
+    @lazy_typechecked
     def add_known_version(self, name: str, versions: List[str]):
         """Add known versions for a software, which was added via `add_software_version_parameter`.
             Disable warning for unsupported software versions.
@@ -129,7 +151,7 @@ class Validator:
         """
         self.known_version[name] = [packaging.version.parse(ver) for ver in versions]
 
-    @typechecked
+    @lazy_typechecked
     def add_custom_filter(self, custom_filter: FilterBase):
         """Add custom software filter stage. Is applied after the default filter stages of bashi.
 
@@ -146,9 +168,14 @@ class Validator:
             func (Callable[..., bool]): The function itself. The arguments can be freely chosen. It
                 returns True, if the input parameter passes the filter.
         """
+        self._custom_runtime_infos[name] = func
         self.runtime_infos[name] = func
+        self._runtime_infos_cache.clear()
+        self._runtime_infos_initialized = False
 
-    @typechecked
+    # the private methods are not type-checked, because they run on each start-up of
+    # bashi-validate and the import and instrumentation of typeguard would dominate the start-up
+    # time
     def _print(self, msg: str):
         """Print message only if silent flag is false.
 
@@ -158,7 +185,6 @@ class Validator:
         if not self.silent:
             print(msg)
 
-    @typechecked
     def _check_single_filter(
         self,
         filter_func: FilterBase,
@@ -179,18 +205,17 @@ class Validator:
         # get name of the filter for command line output.
         filter_name: str = filter_func.__class__.__name__
 
-        filter_func.output = io.StringIO()
+        output = get_reason_buffer(filter_func)
 
         if filter_func(row):
             self._print(termcolor.colored(f"{filter_name}() returns True", "green"))
             return True
 
         self._print(termcolor.colored(f"{filter_name}() returns False", "red"))
-        if filter_func.output.getvalue() != "":
-            self._print("  " + filter_func.output.getvalue())
+        if output.getvalue() != "":
+            self._print("  " + output.getvalue())
         return False
 
-    @typechecked
     def _check_filter_chain(self, row: BashiRow) -> bool:
         """Test a row with the bashi default filter chain.
 
@@ -211,28 +236,104 @@ class Validator:
 
         return all_true == len(self.filter_stages)
 
-    def get_row(self) -> BashiRow:
-        """Generate parameter-value-tuple from the application arguments.
+    def set_software_versions(
+        self, software_versions: Mapping[str, Sequence[str | float | int]] | None = None
+    ):
+        """Set the available software versions, which are used to create the runtime infos. The
+        runtime infos are cached for each set of software versions, therefore switching between
+        known sets is cheap.
 
-        Returns:
-            BashiRow: parameter-value-tuple
+        Args:
+            software_versions (Mapping[str, Sequence[str | float | int]] | None, optional):
+                Available versions for each software. Missing software names use the default
+                versions of bashi. Defaults to None.
         """
-        args = self.parser.parse_args(args=self.args)
+        sw_versions: Dict[str, List[str | float | int]] = {}
+        for sw_name in self.software_version_names:
+            if software_versions is not None and sw_name in software_versions:
+                sw_versions[sw_name] = list(software_versions[sw_name])
+            else:
+                sw_versions[sw_name] = [str(ver) for ver in VERSIONS[sw_name]]
+
+        cache_key = tuple(
+            (name, tuple(str(ver) for ver in vers)) for name, vers in sw_versions.items()
+        )
+        if cache_key not in self._runtime_infos_cache:
+            # merge custom runtime info with bashi runtime info functions, self.runtime_infos
+            # contains the bashi runtime infos of the previous software versions
+            self._runtime_infos_cache[cache_key] = self._custom_runtime_infos | get_runtime_infos(
+                get_parameter_value_matrix(software_versions=sw_versions), self.version_relation
+            )
+        self.runtime_infos = self._runtime_infos_cache[cache_key]
+
+        for filter_stage in self.filter_stages:
+            filter_stage.runtime_infos = self.runtime_infos
+        self._runtime_infos_initialized = True
+
+    def _update_runtime_infos(self, args: argparse.Namespace):
+        """Set the runtime infos for the software versions of the arguments.
 
-        sw_versions: Dict[str, list[str | float | int]] = {}
+        Args:
+            args (argparse.Namespace): parsed application arguments
+        """
+        sw_versions: Dict[str, List[str | float | int]] = {}
         # read software versions from CLI arguments
         for sw_name in self.software_version_names:
             # workaround for Python 3.11 (maybe also other Python versions)
             argument_name = "ver_" + sw_name.replace("-", "_")
             sw_versions[sw_name] = getattr(args, argument_name)
+        self.set_software_versions(sw_versions)
 
-        # merge custom runtime info with bashi runtime info functions
-        self.runtime_infos = self.runtime_infos | get_runtime_infos(
-            get_parameter_value_matrix(software_versions=sw_versions), self.version_relation
-        )
+    def check(
+        self, row: BashiRow | Mapping[Parameter, ParameterValue], fail_fast: bool = False
+    ) -> Verdict:
+        """Check a row with all filter stages without printing anything. Does not parse any
+        arguments. If the software versions were not set before via `set_software_versions()`,
+        the default versions are used. The reason buffers of the filter stages are reused.
 
-        for filter_stage in self.filter_stages:
-            filter_stage.runtime_infos = self.runtime_infos
+        Args:
+            row (BashiRow | Mapping[Parameter, ParameterValue]): Row to check. Other mappings than
+                BashiRow are converted to a BashiRow.
+            fail_fast (bool, optional): If True, stop after the first failing filter stage.
+                Defaults to False.
+
+        Returns:
+            Verdict: Result of the check. Is truthy if the row passes all filter stages.
+        """
+        if not self._runtime_infos_initialized:
+            self.set_software_versions()
+        if not isinstance(row, BashiRow):
+            row = BashiRow(row)
+        return check_row(self.filter_stages, row, fail_fast)
+
+    def _parse_args(
+        self, args: List[str], namespace: argparse.Namespace | None = None
+    ) -> argparse.Namespace:
+        """Parse application arguments. Resets the parameter order before parsing.
+
+        Args:
+            args (List[str]): application arguments
+            namespace (argparse.Namespace | None, optional): Values of the namespace are used as
+                default values. The namespace is not modified. Defaults to None.
+
+        Returns:
+            argparse.Namespace: parsed arguments
+        """
+        self.param_order.clear()
+        if namespace is not None:
+            namespace = argparse.Namespace(**vars(namespace))
+        return self.parser.parse_args(args=args, namespace=namespace)
+
+    def _get_row_from_args(self, args: argparse.Namespace) -> BashiRow:
+        """Generate parameter-value-tuple from parsed application arguments.
+
+        Args:
+            args (argparse.Namespace): parsed application arguments
+
+        Returns:
+            BashiRow: parameter-value-tuple
+        """
+        self._update_runtime_infos(args)
 
         row = BashiRow({})
 
@@ -250,34 +351,264 @@ class Validator:
 
         return row
 
-    # pylint: disable=too-many-branches
-    def validate(self) -> bool:
-        """Construct parameter-value-tuple from the application arguments and check if it passes
-        the bashi and custom filter.
+    def get_row(self) -> BashiRow:
+        """Generate parameter-value-tuple from the application arguments.
 
         Returns:
-            bool: Return True if all filter stages are passed
+            BashiRow: parameter-value-tuple
         """
-        row = self.get_row()
+        return self._get_row_from_args(self._parse_args(self.args))
+
+    def _get_unsupported_versions(self, row: BashiRow) -> List[str]:
+        """Returns a warning for each parameter-value of the row, which is not officially supported.
 
+        Args:
+            row (BashiRow): row to check
+
+        Returns:
+            List[str]: warning messages
+        """
+        warnings: List[str] = []
         for val_name, val_version in row.values():
             known_software = (
                 val_name in self.known_version and val_version in self.known_version[val_name]
             )
             if not known_software:
                 try:
-                    known_software = is_supported_version(val_name, val_version)
+                    known_software = _is_supported_version(val_name, val_version)
                 except BashiUnknownVersion:
                     known_software = False
                 except Exception as e:
                     raise e
 
             if not known_software:
-                self._print(
-                    termcolor.colored(
-                        f"WARNING: {val_name} {val_version} is not officially supported.",
-                        "yellow",
-                    )
-                )
+                warnings.append(f"{val_name} {val_version} is not officially supported.")
+        return warnings
+
+    def validate(self) -> bool:
+        """Construct parameter-value-tuple from the application arguments and check if it passes
+        the bashi and custom filter. If the batch mode is enabled, all rows of the batch input are
+        checked.
+
+        Returns:
+            bool: Return True if all filter stages are passed
+        """
+        args = self._parse_args(self.args)
+        self.output_format = args.format
+        if args.combination_list is not None:
+            return self._validate_combination_list_file(args)
+
+        if args.batch is not None:
+            if args.batch == "-":
+                return self.validate_batch(sys.stdin, args.batch_format, args)
+            try:
+                with open(args.batch, "r", encoding="utf-8", newline="") as batch_file:
+                    return self.validate_batch(batch_file, args.batch_format, args)
+            except OSError as e:
+                exit_error(f"Could not open batch file {args.batch}: {e}")
+
+        row = self._get_row_from_args(args)
+
+        if self.output_format == "jsonl":
+            verdict = self.check(row)
+            self._print_record(row, verdict, self._get_unsupported_versions(row))
+            return verdict.passed
+
+        for warning in self._get_unsupported_versions(row):
+            self._print(termcolor.colored(f"WARNING: {warning}", "yellow"))
 
         return self._check_filter_chain(row)
+
+    def _print_record(
+        self,
+        row: Mapping[Parameter, ParameterValue],
+        verdict: Verdict,
+        warnings: List[str],
+        **kwargs: int,
+    ):
+        """Print the result of a row as single line JSON object. Used by the jsonl output format.
+
+        Args:
+            row (Mapping[Parameter, ParameterValue]): checked row
+            verdict (Verdict): result of the filter stages
+            warnings (List[str]): unsupported version warnings
+            kwargs (int): additional entries of the record like the line number or index
+        """
+        failed_filters = dict(verdict.reasons)
+        record = {
+            **kwargs,
+            "passed": verdict.passed,
+            "row": combination_to_json_object(row),
+            "filters": {
+                filter_stage.__class__.__name__: filter_stage.__class__.__name__
+                not in failed_filters
+                for filter_stage in self.filter_stages
+            },
+            "reasons": failed_filters,
+            "warnings": warnings,
+        }
+        self._print(json.dumps(record, separators=(",", ":")))
+
+    def _validate_combination_list_file(self, args: argparse.Namespace) -> bool:
+        """Read the combination-list of the --combination-list argument and check it.
+
+        Args:
+            args (argparse.Namespace): parsed application arguments
+
+        Returns:
+            bool: True if all combinations passes all filter stages
+        """
+        try:
+            if args.combination_list == "-":
+                combination_list = read_combination_list(sys.stdin)
+            else:
+                with open(args.combination_list, "r", encoding="utf-8") as comb_list_file:
+                    combination_list = read_combination_list(comb_list_file)
+        except OSError as e:
+            exit_error(f"Could not open combination-list {args.combination_list}: {e}")
+        except ValueError as e:
+            exit_error(f"Could not parse combination-list {args.combination_list}: {e}")
+
+        self._update_runtime_infos(args)
+        return self.validate_combination_list(combination_list, args.jobs)
+
+    def validate_combination_list(
+        self, combination_list: CombinationList, jobs: int | None = None
+    ) -> bool:
+        """Check all combinations of a combination-list with the filter stages in parallel and
+        print the failing combinations with the reasons.
+
+        Args:
+            combination_list (CombinationList): combination-list
+            jobs (int | None, optional): Number of worker processes. If None, the number of CPUs is
+                used. Defaults to None.
+
+        Returns:
+            bool: True if all combinations passes all filter stages
+        """
+        if not self._runtime_infos_initialized:
+            self.set_software_versions()
+
+        # the combination-list mode needs multiprocessing, which is not loaded for a single row
+        # pylint: disable=import-outside-toplevel
+        from .combination_list import check_combination_list
+
+        failed_combinations = check_combination_list(self.filter_stages, combination_list, jobs)
+
+        if self.output_format == "jsonl":
+            failed_reasons = {
+                failed_comb.index: failed_comb.reasons for failed_comb in failed_combinations
+            }
+            for index, comb in enumerate(combination_list):
+                reasons = failed_reasons.get(index, [])
+                self._print_record(
+                    comb,
+                    Verdict(not reasons, reasons),
+                    self._get_unsupported_versions(BashiRow(comb)),
+                    index=index,
+                )
+            return len(failed_combinations) == 0
+
+        for failed_comb in failed_combinations:
+            row_str = get_str_row_nice(combination_list[failed_comb.index], bashi_validate=True)
+            self._print(termcolor.colored(f"{failed_comb.index}: FAIL {row_str}", "red"))
+            for filter_name, reason in failed_comb.reasons:
+                self._print(f"  {filter_name}: {reason}")
+
+        self._print(
+            f"{len(combination_list) - len(failed_combinations)}/{len(combination_list)} "
+            "combinations passed"
+        )
+        return len(failed_combinations) == 0
+
+    def _print_batch_verdict(self, line: int, row: BashiRow, verdict: Verdict):
+        """Print the verdict of a single row of the batch mode. If the row does not pass, the
+        reasons of the failing filter stages are also printed.
+
+        Args:
+            line (int): line number of the row in the batch input
+            row (BashiRow): checked row
+            verdict (Verdict): result of the filter stages
+        """
+        row_str = get_str_row_nice(row, bashi_validate=True)
+        if verdict:
+            self._print(termcolor.colored(f"{line}: PASS {row_str}", "green"))
+        else:
+            self._print(termcolor.colored(f"{line}: FAIL {row_str}", "red"))
+            for filter_name, reason in verdict.reasons:
+                if reason != "":
+                    self._print(f"  {filter_name}: {reason}")
+        for warning in self._get_unsupported_versions(row):
+            self._print(termcolor.colored(f"  WARNING: {warning}", "yellow"))
+
+    def validate_batch(
+        self,
+        input_file: IO[str],
+        batch_format: str = "args",
+        default_args: argparse.Namespace | None = None,
+    ) -> bool:
+        """Check each row of the batch input and print one verdict per row. The filter stages and
+        the runtime infos are reused for all rows.
+
+        Args:
+            input_file (IO[str]): batch input
+            batch_format (str, optional): Either args, jsonl or csv. Defaults to "args".
+            default_args (argparse.Namespace | None, optional): Parsed arguments, which are used
+                as default values for each row. Defaults to None.
+
+        Returns:
+            bool: True if all rows passes all filter stages
+        """
+        if default_args is None:
+            default_args = self._parse_args([])
+        default_param_order = list(self.param_order)
+
+        number_of_rows = 0
+        number_of_failed_rows = 0
+        try:
+            for batch_row in read_batch_rows(input_file, batch_format):
+                number_of_rows += 1
+                error_output = io.StringIO()
+                try:
+                    # in jsonl mode, the error messages are part of the record
+                    with contextlib.ExitStack() as stack:
+                        if self.output_format == "jsonl":
+                            stack.enter_context(contextlib.redirect_stdout(error_output))
+                            stack.enter_context(contextlib.redirect_stderr(error_output))
+                        args = self._parse_args(batch_row.args, default_args)
+                        self.param_order[:0] = default_param_order
+                        row = self._get_row_from_args(args)
+                except SystemExit:
+                    # argparse and exit_error() terminates the application for invalid arguments
+                    if self.output_format == "jsonl":
+                        record = {
+                            "line": batch_row.line,
+                            "passed": False,
+                            "args": batch_row.args,
+                            "error": error_output.getvalue().strip(),
+                        }
+                        self._print(json.dumps(record, separators=(",", ":")))
+                    else:
+                        self._print(
+                            termcolor.colored(
+                                f"{batch_row.line}: ERROR {shlex.join(batch_row.args)}", "red"
+                            )
+                        )
+                    number_of_failed_rows += 1
+                    continue
+
+                verdict = self.check(row)
+                if self.output_format == "jsonl":
+                    self._print_record(
+                        row, verdict, self._get_unsupported_versions(row), line=batch_row.line
+                    )
+                else:
+                    self._print_batch_verdict(batch_row.line, row, verdict)
+                if not verdict:
+                    number_of_failed_rows += 1
+        except BatchFormatError as e:
+            exit_error(f"Could not parse batch input: {e}")
+
+        if self.output_format != "jsonl":
+            self._print(f"{number_of_rows - number_of_failed_rows}/{number_of_rows} rows passed")
+        return number_of_failed_rows == 0
@@ -0,0 +1,62 @@
+"""Check a row with filter stages without any command line handling."""
+
+import io
+from typing import List, NamedTuple, Sequence, Tuple
+from bashi.filter_base import FilterBase
+from bashi.row import BashiRow
+
+
+class Verdict(NamedTuple):
+    """Result of a check. `reasons` contains the name and the reason of each failing filter stage.
+    The verdict is truthy if the row passed all filter stages.
+    """
+
+    passed: bool
+    reasons: List[Tuple[str, str]]
+
+    def __bool__(self) -> bool:
+        return self.passed
+
+
+def get_reason_buffer(filter_stage: FilterBase) -> io.StringIO:
+    """Returns the empty reason buffer of a filter stage. If the filter stage has already a
+    `io.StringIO` as output, it is cleared and reused. Otherwise, a new buffer is set.
+
+    Args:
+        filter_stage (FilterBase): filter stage
+
+    Returns:
+        io.StringIO: empty reason buffer, which is used as output of the filter stage
+    """
+    output = filter_stage.output
+    if isinstance(output, io.StringIO):
+        output.seek(0)
+        output.truncate(0)
+        return output
+    output = io.StringIO()
+    filter_stage.output = output
+    return output
+
+
+def check_row(
+    filter_stages: Sequence[FilterBase], row: BashiRow, fail_fast: bool = False
+) -> Verdict:
+    """Check a row with all filter stages.
+
+    Args:
+        filter_stages (Sequence[FilterBase]): filter stages with initialized runtime infos
+        row (BashiRow): row to check
+        fail_fast (bool, optional): If True, stop after the first failing filter stage.
+            Defaults to False.
+
+    Returns:
+        Verdict: result of the check
+    """
+    reasons: List[Tuple[str, str]] = []
+    for filter_stage in filter_stages:
+        output = get_reason_buffer(filter_stage)
+        if not filter_stage(row):
+            reasons.append((filter_stage.__class__.__name__, output.getvalue().strip()))
+            if fail_fast:
+                break
+    return Verdict(not reasons, reasons)
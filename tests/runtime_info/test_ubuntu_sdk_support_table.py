@@ -0,0 +1,94 @@
+# pylint: disable=missing-docstring
+import unittest
+import packaging.version as pkv
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValue
+from bashi.version import VERSIONS
+from bashi.version.utils import get_parameter_value_matrix
+from bashi.version.relation import VersionRelation
+from bashi.runtime_info import UbuntuSDKSupportTable
+from bashi.generator import get_runtime_infos
+from bashi.filter_software_dependency import SoftwareDependencyFilter
+from bashi.row import BashiRow
+from utils_test import parse_value_version as pvv
+
+
+class TestUbuntuSDKSupportTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.version_relation = VersionRelation()
+        cls.ubuntus = pvv(["16.04"] + VERSIONS[UBUNTU] + ["26.04"])
+
+    def test_table_matches_version_ranges(self):
+        for version_range, sdks in (
+            (self.version_relation.get_ubuntu_hip_version_range(), pvv(VERSIONS[HIPCC])),
+            (self.version_relation.get_ubuntu_cuda_version_range(), pvv(VERSIONS[NVCC])),
+        ):
+            # only half of the SDK versions are precomputed, the rest is calculated on demand
+            table = UbuntuSDKSupportTable(version_range, self.ubuntus, sdks[::2])
+            for ubuntu in self.ubuntus:
+                for sdk in sdks + pvv([1.0, 99.0]):
+                    # if a Ubuntu version has more than one range, the last one is used
+                    ranges = {ub_range.ubuntu: ub_range.sdk_range for ub_range in version_range}
+                    expected = ubuntu in ranges and sdk in ranges[ubuntu]
+                    expected_other = any(
+                        ub_range.ubuntu != ubuntu and sdk in ub_range.sdk_range
+                        for ub_range in version_range
+                    )
+                    # second access is served from the table
+                    for _ in range(2):
+                        self.assertEqual(table(ubuntu, sdk), expected, f"{ubuntu} {sdk}")
+                        self.assertEqual(
+                            table.is_bound_to_other_ubuntu(ubuntu, sdk),
+                            expected_other,
+                            f"{ubuntu} {sdk}",
+                        )
+
+    def test_empty_range(self):
+        table = UbuntuSDKSupportTable([], self.ubuntus, pvv(VERSIONS[HIPCC]))
+        self.assertFalse(table(pkv.parse("22.04"), pkv.parse("6.1")))
+        self.assertFalse(table.is_bound_to_other_ubuntu(pkv.parse("22.04"), pkv.parse("6.1")))
+
+    def test_runtime_infos_contains_tables(self):
+        runtime_infos = get_runtime_infos(get_parameter_value_matrix(), self.version_relation)
+        self.assertIsInstance(runtime_infos[RT_UBUNTU_HIP_SDK_SUPPORT], UbuntuSDKSupportTable)
+        self.assertIsInstance(runtime_infos[RT_UBUNTU_CUDA_SDK_SUPPORT], UbuntuSDKSupportTable)
+
+    def test_filter_with_and_without_precomputed_table(self):
+        runtime_infos = get_runtime_infos(get_parameter_value_matrix(), self.version_relation)
+        filter_with_table = SoftwareDependencyFilter(self.version_relation, runtime_infos)
+        filter_without_table = SoftwareDependencyFilter(self.version_relation)
+
+        for ubuntu in self.ubuntus:
+            rows = []
+            for hipcc in pvv(VERSIONS[HIPCC]):
+                for compiler_type in (HOST_COMPILER, DEVICE_COMPILER):
+                    rows.append(
+                        BashiRow(
+                            {
+                                compiler_type: ParameterValue(HIPCC, hipcc),
+                                UBUNTU: ParameterValue(UBUNTU, ubuntu),
+                            }
+                        )
+                    )
+            for cuda in pvv(VERSIONS[NVCC]):
+                rows.append(
+                    BashiRow(
+                        {
+                            DEVICE_COMPILER: ParameterValue(NVCC, cuda),
+                            UBUNTU: ParameterValue(UBUNTU, ubuntu),
+                        }
+                    )
+                )
+                rows.append(
+                    BashiRow(
+                        {
+                            UBUNTU: ParameterValue(UBUNTU, ubuntu),
+                            ALPAKA_ACC_GPU_CUDA_ENABLE: ParameterValue(
+                                ALPAKA_ACC_GPU_CUDA_ENABLE, cuda
+                            ),
+                        }
+                    )
+                )
+            for row in rows:
+                self.assertEqual(filter_with_table(row), filter_without_table(row), f"{row}")
@@ -0,0 +1,108 @@
+# pylint: disable=missing-docstring
+import unittest
+from array import array
+from bashi.types import CombinationList
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.columnar import ColumnarCombinationList
+from bashi.value_registry import CompactRow
+from bashi.utils import parse_combination
+from utils_test import parse_param_val
+
+
+class TestColumnarCombinationList(unittest.TestCase):
+    def setUp(self):
+        self.comb_list: CombinationList = [
+            parse_combination(
+                [(HOST_COMPILER, GCC, 10), (UBUNTU, "20.04"), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)]
+            ),
+            parse_combination(
+                [(HOST_COMPILER, CLANG, 16), (UBUNTU, "22.04"), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0)]
+            ),
+            parse_combination(
+                [(HOST_COMPILER, GCC, 11), (UBUNTU, "22.04"), (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.8)]
+            ),
+            parse_combination(
+                [(HOST_COMPILER, GCC, 10), (UBUNTU, "24.04"), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)]
+            ),
+        ]
+
+    def test_list_interface(self):
+        columnar = ColumnarCombinationList(self.comb_list)
+        self.assertEqual(len(columnar), 4)
+        self.assertEqual(columnar.parameters, [HOST_COMPILER, UBUNTU, ALPAKA_ACC_GPU_CUDA_ENABLE])
+        self.assertEqual(columnar[1], self.comb_list[1])
+        self.assertEqual(columnar[-1], self.comb_list[-1])
+        self.assertEqual(list(columnar), self.comb_list)
+        self.assertEqual(columnar[1:3].to_combination_list(), self.comb_list[1:3])
+        self.assertEqual(columnar[::-1].to_combination_list(), self.comb_list[::-1])
+        self.assertIn(self.comb_list[2], columnar)
+        with self.assertRaises(IndexError):
+            _ = columnar[4]
+
+        self.assertIsInstance(columnar.column(UBUNTU), array)
+        self.assertEqual(columnar.column(UBUNTU).typecode, "H")
+
+        row = columnar.view(2)
+        self.assertIsInstance(row, CompactRow)
+        self.assertEqual(row, self.comb_list[2])
+
+    def test_round_trip(self):
+        self.assertEqual(
+            ColumnarCombinationList(self.comb_list).to_combination_list(), self.comb_list
+        )
+        self.assertEqual(ColumnarCombinationList().to_combination_list(), [])
+
+    def test_append(self):
+        columnar = ColumnarCombinationList(parameters=self.comb_list[0].keys())
+        for comb in self.comb_list:
+            columnar.append(comb)
+        self.assertEqual(columnar.to_combination_list(), self.comb_list)
+
+        with self.assertRaises(ValueError):
+            columnar.append(parse_combination([(HOST_COMPILER, GCC, 10), (UBUNTU, "20.04")]))
+        with self.assertRaises(ValueError):
+            columnar.append(
+                parse_combination(
+                    [(HOST_COMPILER, GCC, 10), (UBUNTU, "20.04"), (ALPAKA_ACC_GPU_HIP_ENABLE, OFF)]
+                )
+            )
+        self.assertEqual(len(columnar), 4)
+
+    def test_select(self):
+        columnar = ColumnarCombinationList(self.comb_list)
+        cuda_enabled = columnar.select(
+            ALPAKA_ACC_GPU_CUDA_ENABLE, lambda param_val: param_val.version != OFF_VER
+        )
+        self.assertEqual(cuda_enabled.to_combination_list(), self.comb_list[1:3])
+        self.assertIs(cuda_enabled.registry, columnar.registry)
+
+        self.assertEqual(columnar.select_indices(HOST_COMPILER, parse_param_val((GCC, 10))), [0, 3])
+        self.assertEqual(len(columnar.select(HOST_COMPILER, parse_param_val((GCC, 12)))), 0)
+
+    def test_count_and_group_by(self):
+        columnar = ColumnarCombinationList(self.comb_list)
+        self.assertEqual(
+            columnar.count_by(UBUNTU),
+            {
+                parse_param_val((UBUNTU, "20.04")): 1,
+                parse_param_val((UBUNTU, "22.04")): 2,
+                parse_param_val((UBUNTU, "24.04")): 1,
+            },
+        )
+        groups = columnar.group_by(UBUNTU)
+        self.assertEqual(
+            groups[parse_param_val((UBUNTU, "22.04"))].to_combination_list(), self.comb_list[1:3]
+        )
+        self.assertEqual(sum(len(group) for group in groups.values()), 4)
+
+    def test_project(self):
+        columnar = ColumnarCombinationList(self.comb_list)
+        projected = columnar.project([UBUNTU, HOST_COMPILER])
+        self.assertEqual(projected.parameters, [UBUNTU, HOST_COMPILER])
+        self.assertEqual(
+            projected[0],
+            parse_combination([(UBUNTU, "20.04"), (HOST_COMPILER, GCC, 10)]),
+        )
+        # the projection is independent of the original container
+        projected.append(parse_combination([(UBUNTU, "20.04"), (HOST_COMPILER, GCC, 12)]))
+        self.assertEqual(len(columnar), 4)
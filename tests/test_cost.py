@@ -0,0 +1,189 @@
+# pylint: disable=missing-docstring
+import unittest
+from unittest import mock
+from collections import OrderedDict
+import packaging.version as pkv
+from covertable.exceptions import InvalidCondition  # type: ignore
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import generate_combination_list, get_runtime_infos, make_combination_list
+from bashi.filter_chain import get_default_filter_chain
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import check_parameter_value_pair_in_combination_list, parse_combination
+from bashi.row import BashiRow
+from bashi.cost import (
+    CostBoundFilter,
+    generate_cost_weighted_combination_list,
+    get_combination_list_cost,
+    get_gpu_runner_cost_model,
+    select_cheapest_cover,
+    _get_bounded_parameter_value_matrix,
+)
+
+
+def cmake_cost_model(row):
+    if CMAKE in row and row[CMAKE].version == pkv.parse("3.23"):
+        return 5.0
+    return 1.0
+
+
+class TestCostModel(unittest.TestCase):
+    def test_gpu_runner_cost_model(self):
+        cost_model = get_gpu_runner_cost_model(gpu_weight=8.0, cpu_weight=2.0)
+        self.assertEqual(
+            cost_model(parse_combination([(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, GCC, 12)])),
+            2.0,
+        )
+        self.assertEqual(cost_model(parse_combination([(ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)])), 2.0)
+        self.assertEqual(cost_model(parse_combination([(ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4)])), 8.0)
+        self.assertEqual(cost_model(parse_combination([(ALPAKA_ACC_GPU_HIP_ENABLE, ON)])), 8.0)
+        # incomplete rows
+        self.assertEqual(cost_model(BashiRow({})), 2.0)
+
+    def test_combination_list_cost(self):
+        comb_list = [
+            parse_combination([(CMAKE, 3.22)]),
+            parse_combination([(CMAKE, 3.23)]),
+            parse_combination([(CMAKE, 3.23)]),
+        ]
+        self.assertEqual(get_combination_list_cost(comb_list, cmake_cost_model), 11.0)
+        self.assertEqual(get_combination_list_cost([], cmake_cost_model), 0.0)
+
+
+class TestSelectCheapestCover(unittest.TestCase):
+    def test_remove_redundant_combinations(self):
+        cheap = parse_combination([(CMAKE, 3.22), (BOOST, 1.82)])
+        expensive = parse_combination([(CMAKE, 3.23), (BOOST, 1.82)])
+        # the pairs of the last combination are covered by the first two combinations
+        candidates = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 20.04)]),
+            cheap,
+            expensive,
+        ]
+        self.assertEqual(select_cheapest_cover(candidates, cmake_cost_model), candidates[:2])
+        self.assertEqual(
+            select_cheapest_cover([cheap, expensive], cmake_cost_model), [cheap, expensive]
+        )
+        self.assertEqual(select_cheapest_cover([], cmake_cost_model), [])
+
+    def test_non_positive_weight(self):
+        with self.assertRaises(ValueError):
+            select_cheapest_cover([parse_combination([(CMAKE, 3.22)])], lambda _: 0.0)
+
+
+class TestCostWeightedGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [
+                (NVCC, 11.2),
+                (NVCC, 12.0),
+                (GCC, 10),
+                (GCC, 11),
+                (GCC, 12),
+                (CLANG, 16),
+                (CLANG, 17),
+            ]
+        )
+        cls.param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+
+        cls.version_relation = VersionRelation()
+        cls.runtime_infos = get_runtime_infos(cls.param_matrix, cls.version_relation)
+        cls.expected_param_val_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            cls.param_matrix, cls.version_relation, cls.runtime_infos
+        )
+        cls.regular_comb_list = generate_combination_list(
+            cls.param_matrix, cls.version_relation, cls.runtime_infos
+        )
+
+    def test_bounded_parameter_value_matrix(self):
+        filter_chain = get_default_filter_chain(
+            self.version_relation, runtime_infos=self.runtime_infos
+        )
+        gpu_cost_model = get_gpu_runner_cost_model()
+        bounded_matrix = _get_bounded_parameter_value_matrix(
+            self.param_matrix, CostBoundFilter(filter_chain, gpu_cost_model, 1.0)
+        )
+        assert bounded_matrix is not None
+        # nvcc requires an enabled CUDA backend, therefore it cannot be part of a CPU row
+        self.assertEqual(bounded_matrix[DEVICE_COMPILER], self.param_matrix[DEVICE_COMPILER][2:])
+        self.assertEqual(
+            bounded_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE],
+            self.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE][:1],
+        )
+        self.assertEqual(bounded_matrix[BOOST], self.param_matrix[BOOST])
+
+        self.assertIsNone(
+            _get_bounded_parameter_value_matrix(
+                self.param_matrix, CostBoundFilter(filter_chain, gpu_cost_model, 0.5)
+            )
+        )
+
+    def test_all_pairs_are_covered(self):
+        for cost_model in (get_gpu_runner_cost_model(), cmake_cost_model):
+            comb_list = generate_cost_weighted_combination_list(
+                self.param_matrix, self.version_relation, self.runtime_infos, cost_model
+            )
+            self.assertTrue(
+                check_parameter_value_pair_in_combination_list(
+                    comb_list, self.expected_param_val_pairs
+                )
+            )
+            self.assertLessEqual(
+                get_combination_list_cost(comb_list, cost_model),
+                get_combination_list_cost(self.regular_comb_list, cost_model),
+            )
+
+    def test_expensive_rows_are_minimized(self):
+        comb_list = generate_cost_weighted_combination_list(
+            self.param_matrix, self.version_relation, self.runtime_infos, cmake_cost_model
+        )
+        self.assertLess(
+            get_combination_list_cost(comb_list, cmake_cost_model),
+            get_combination_list_cost(self.regular_comb_list, cmake_cost_model),
+        )
+        # cmake 3.23 needs to be combined with each of the 7 device compilers
+        self.assertEqual(
+            len([comb for comb in comb_list if cmake_cost_model(comb) > 1.0]),
+            len(self.param_matrix[DEVICE_COMPILER]),
+        )
+
+    def test_empty_backward_tier(self):
+        # the cheapest tier is generated first in the forward pass and again in the backward pass
+        matrices = []
+
+        def fail_backward_cheapest_tier(matrix, *args, **kwargs):
+            if matrices and matrix is matrices[0]:
+                raise InvalidCondition()
+            matrices.append(matrix)
+            return make_combination_list(matrix, *args, **kwargs)
+
+        with mock.patch("bashi.cost.make_combination_list", fail_backward_cheapest_tier):
+            comb_list = generate_cost_weighted_combination_list(
+                self.param_matrix,
+                self.version_relation,
+                self.runtime_infos,
+                get_gpu_runner_cost_model(),
+            )
+        self.assertGreater(len(matrices), 1)
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(comb_list, self.expected_param_val_pairs)
+        )
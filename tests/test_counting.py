@@ -0,0 +1,107 @@
+# pylint: disable=missing-docstring
+import unittest
+import itertools
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import get_runtime_infos
+from bashi.filter_chain import get_default_filter_chain
+from bashi.counting import count_valid_combinations
+
+
+def count_brute_force(param_matrix, row_filter):
+    parameters = list(param_matrix.keys())
+    number = 0
+    for param_vals in itertools.product(*param_matrix.values()):
+        if all(
+            row_filter(OrderedDict(zip(parameters[:length], param_vals[:length])))
+            for length in range(1, len(parameters) + 1)
+        ):
+            number += 1
+    return number
+
+
+class TestCountValidCombinations(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23), (CMAKE, 3.24)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        cls.param_matrix[CXX_STANDARD] = parse_param_vals(
+            [(CXX_STANDARD, 17), (CXX_STANDARD, 20), (CXX_STANDARD, 23)]
+        )
+
+    def test_without_filter(self):
+        self.assertEqual(count_valid_combinations(self.param_matrix, lambda _: True, jobs=1), 36)
+
+    def test_rules(self):
+        def row_filter(row):
+            # boost 1.81 is never valid
+            if BOOST in row and row[BOOST].version == pkv.parse("1.81"):
+                return False
+            # cmake 3.22 is not available on Ubuntu 22.04
+            if (
+                CMAKE in row
+                and UBUNTU in row
+                and row[CMAKE].version == pkv.parse("3.22")
+                and row[UBUNTU].version == pkv.parse("22.04")
+            ):
+                return False
+            # C++23 requires Ubuntu 22.04 and cmake 3.24
+            return not (
+                CXX_STANDARD in row
+                and row[CXX_STANDARD].version == pkv.parse("23")
+                and (
+                    row[UBUNTU].version != pkv.parse("22.04")
+                    or row[CMAKE].version != pkv.parse("3.24")
+                )
+            )
+
+        number = count_valid_combinations(self.param_matrix, row_filter, jobs=1)
+        self.assertEqual(number, count_brute_force(self.param_matrix, row_filter))
+        self.assertEqual(number, 11)
+        self.assertEqual(count_valid_combinations(self.param_matrix, row_filter, jobs=2), number)
+
+    def test_empty_parameter_value_matrix(self):
+        self.assertEqual(count_valid_combinations(OrderedDict(), lambda _: True), 0)
+        param_matrix = OrderedDict(self.param_matrix)
+        param_matrix[BOOST] = []
+        self.assertEqual(count_valid_combinations(param_matrix, lambda _: True), 0)
+
+
+class TestCountValidCombinationsFilterChain(unittest.TestCase):
+    def test_filter_chain(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 12), (CLANG, 16), (NVCC, 12.0), (HIPCC, 6.0)]
+        )
+        param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 12), (CLANG, 16), (HIPCC, 6.0)]
+        )
+        param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        param_matrix[ALPAKA_ACC_GPU_HIP_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_GPU_HIP_ENABLE, OFF), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)]
+        )
+        param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        param_matrix[CXX_STANDARD] = parse_param_vals([(CXX_STANDARD, 17), (CXX_STANDARD, 20)])
+        version_relation = VersionRelation()
+        filter_chain = get_default_filter_chain(
+            version_relation, runtime_infos=get_runtime_infos(param_matrix, version_relation)
+        )
+
+        number = count_valid_combinations(param_matrix, filter_chain, jobs=1)
+        self.assertGreater(number, 0)
+        self.assertEqual(number, count_brute_force(param_matrix, filter_chain))
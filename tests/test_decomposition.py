@@ -0,0 +1,169 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import get_runtime_infos
+from bashi.filter_chain import get_default_filter_chain
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import check_parameter_value_pair_in_combination_list
+from bashi.utils import parse_combination
+from bashi.decomposition import (
+    generate_decomposed_combination_list,
+    get_parameter_groups,
+    _merge_group_rows,
+)
+
+
+def cmake_ubuntu_filter(row):
+    # cmake 3.22 is not available on Ubuntu 22.04
+    return not (
+        CMAKE in row
+        and UBUNTU in row
+        and row[CMAKE].version == pkv.parse("3.22")
+        and row[UBUNTU].version == pkv.parse("22.04")
+    )
+
+
+class TestParameterGroups(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        cls.param_matrix[CXX_STANDARD] = parse_param_vals([(CXX_STANDARD, 17), (CXX_STANDARD, 20)])
+
+    def test_independent_parameters(self):
+        self.assertEqual(
+            get_parameter_groups(self.param_matrix, lambda _: True),
+            [[CMAKE], [BOOST], [UBUNTU], [CXX_STANDARD]],
+        )
+
+    def test_coupled_parameters(self):
+        self.assertEqual(
+            get_parameter_groups(self.param_matrix, cmake_ubuntu_filter),
+            [[CMAKE, UBUNTU], [BOOST], [CXX_STANDARD]],
+        )
+
+        def chain_filter(row):
+            # couples cmake with ubuntu and ubuntu with the C++ standard
+            return cmake_ubuntu_filter(row) and not (
+                UBUNTU in row
+                and CXX_STANDARD in row
+                and row[UBUNTU].version == pkv.parse("20.04")
+                and row[CXX_STANDARD].version == pkv.parse("20")
+            )
+
+        self.assertEqual(
+            get_parameter_groups(self.param_matrix, chain_filter),
+            [[CMAKE, UBUNTU, CXX_STANDARD], [BOOST]],
+        )
+
+    def test_single_value_rules_do_not_couple(self):
+        # boost 1.81 is never valid, therefore it does not couple boost with another parameter
+        self.assertEqual(
+            get_parameter_groups(
+                self.param_matrix,
+                lambda row: not (BOOST in row and row[BOOST].version == pkv.parse("1.81")),
+            ),
+            [[CMAKE], [BOOST], [UBUNTU], [CXX_STANDARD]],
+        )
+
+
+class TestDecomposedGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+
+        cls.version_relation = VersionRelation()
+        cls.runtime_infos = get_runtime_infos(cls.param_matrix, cls.version_relation)
+        cls.filter_chain = get_default_filter_chain(
+            cls.version_relation, runtime_infos=cls.runtime_infos
+        )
+
+    def test_parameter_groups_of_filter_chain(self):
+        groups = get_parameter_groups(self.param_matrix, self.filter_chain)
+        self.assertIn([HOST_COMPILER, DEVICE_COMPILER, ALPAKA_ACC_GPU_CUDA_ENABLE], groups)
+        self.assertIn([BOOST], groups)
+
+    def test_generate_decomposed_combination_list(self):
+        dropped_rows = []
+        comb_list = generate_decomposed_combination_list(
+            self.param_matrix, self.version_relation, self.runtime_infos, dropped_rows=dropped_rows
+        )
+        self.assertEqual(dropped_rows, [])
+        for comb in comb_list:
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+            self.assertTrue(self.filter_chain(comb), f"{comb} does not pass the filter chain")
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            self.param_matrix, self.version_relation, self.runtime_infos
+        )
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+
+    def test_single_group(self):
+        param_matrix: ParameterValueMatrix = OrderedDict(
+            (parameter, self.param_matrix[parameter])
+            for parameter in [HOST_COMPILER, DEVICE_COMPILER]
+        )
+        comb_list = generate_decomposed_combination_list(
+            param_matrix, self.version_relation, self.runtime_infos
+        )
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            param_matrix, self.version_relation, self.runtime_infos
+        )
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
+
+
+class TestMergeGroupRows(unittest.TestCase):
+    def test_dropped_rows(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+
+        def row_filter(row):
+            # the rule couples three parameters, cmake 3.23 and Ubuntu 22.04 requires boost 1.82
+            return not (
+                len(row) == 3
+                and row[CMAKE].version == pkv.parse("3.23")
+                and row[UBUNTU].version == pkv.parse("22.04")
+                and row[BOOST].version == pkv.parse("1.81")
+            )
+
+        base_rows = [
+            parse_combination([(CMAKE, 3.22), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.23), (UBUNTU, 22.04)]),
+        ]
+        dropped_rows = []
+        comb_list = _merge_group_rows(
+            param_matrix,
+            row_filter,
+            [[parse_combination([(BOOST, 1.81)])], base_rows],
+            dropped_rows,
+        )
+        self.assertEqual(
+            comb_list, [parse_combination([(CMAKE, 3.22), (UBUNTU, 20.04), (BOOST, 1.81)])]
+        )
+        self.assertEqual(dropped_rows, [base_rows[1]])
@@ -0,0 +1,232 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+import packaging.version as pkv
+from covertable import make  # type: ignore
+from covertable.exceptions import InvalidCondition  # type: ignore
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValue, ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import generate_combination_list, get_runtime_infos
+from bashi.filter_chain import get_default_filter_chain
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import check_parameter_value_pair_in_combination_list, parse_combination
+from bashi.forbidden_pairs import ForbiddenPairFilter, LookaheadFilter
+
+
+class CountingFilter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, row):
+        self.calls += 1
+        # boost 1.81 is never valid and cmake 3.22 does not work with Ubuntu 22.04
+        if BOOST in row and row[BOOST].version == pkv.parse("1.81"):
+            return False
+        return not (
+            CMAKE in row
+            and UBUNTU in row
+            and row[CMAKE].version == pkv.parse("3.22")
+            and row[UBUNTU].version == pkv.parse("22.04")
+        )
+
+
+class TestForbiddenPairFilter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+
+    def test_forbidden_rows(self):
+        forbidden_filter = ForbiddenPairFilter(CountingFilter(), self.param_matrix, jobs=1)
+        for row, forbidden in [
+            ([(CMAKE, 3.22)], False),
+            ([(BOOST, 1.81)], True),
+            ([(CMAKE, 3.22), (UBUNTU, 20.04)], False),
+            ([(CMAKE, 3.22), (UBUNTU, 22.04)], True),
+            ([(UBUNTU, 22.04), (CMAKE, 3.22)], True),
+            ([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 22.04)], True),
+            ([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 22.04)], True),
+            ([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 22.04)], False),
+            # parameter-values, which are not part of the parameter-value-matrix, are ignored
+            ([(CMAKE, 3.24), (UBUNTU, 22.04)], False),
+        ]:
+            self.assertEqual(
+                forbidden_filter.is_forbidden(parse_combination(row)), forbidden, f"{row}"
+            )
+            self.assertEqual(forbidden_filter(parse_combination(row)), not forbidden, f"{row}")
+
+    def test_wrapped_filter_is_not_called_for_forbidden_rows(self):
+        counting_filter = CountingFilter()
+        forbidden_filter = ForbiddenPairFilter(counting_filter, self.param_matrix, jobs=1)
+
+        counting_filter.calls = 0
+        self.assertFalse(
+            forbidden_filter(parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 22.04)]))
+        )
+        self.assertEqual(counting_filter.calls, 0)
+        self.assertTrue(
+            forbidden_filter(parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 20.04)]))
+        )
+        self.assertEqual(counting_filter.calls, 1)
+
+    def test_parallel_table(self):
+        # 3 * 60 * 60 parameter-value-pairs are enough for two worker processes
+        param_matrix: ParameterValueMatrix = OrderedDict(
+            (
+                parameter,
+                [ParameterValue(parameter, pkv.parse(f"1.{minor}")) for minor in range(60)],
+            )
+            for parameter in (CMAKE, BOOST, UBUNTU)
+        )
+
+        def row_filter(row):
+            minors = [param_val.version.minor for param_val in row.values()]
+            return sum(minors) % 7 != 0
+
+        sequential = ForbiddenPairFilter(row_filter, param_matrix, jobs=1)
+        parallel = ForbiddenPairFilter(row_filter, param_matrix, jobs=2)
+        # pylint: disable=protected-access
+        self.assertEqual(sequential._forbidden, parallel._forbidden)
+        self.assertTrue(sequential.is_forbidden(parse_combination([(CMAKE, 1.3), (BOOST, 1.4)])))
+        self.assertFalse(sequential.is_forbidden(parse_combination([(CMAKE, 1.3), (BOOST, 1.5)])))
+
+
+def pair_dead_end_filter(row):
+    # cmake 3.22 requires Ubuntu 20.04 and boost 1.81 requires Ubuntu 22.04, therefore cmake 3.22
+    # and boost 1.81 are a valid pair, which cannot be completed
+    if CMAKE in row and UBUNTU in row and row[CMAKE].version == pkv.parse("3.22"):
+        return row[UBUNTU].version == pkv.parse("20.04")
+    if BOOST in row and UBUNTU in row and row[BOOST].version == pkv.parse("1.81"):
+        return row[UBUNTU].version == pkv.parse("22.04")
+    return True
+
+
+def triple_dead_end_filter(row):
+    # cmake 3.22 and boost 1.81 cannot be combined with any Ubuntu version, but all pairs are valid
+    return not (
+        CMAKE in row
+        and BOOST in row
+        and UBUNTU in row
+        and row[CMAKE].version == pkv.parse("3.22")
+        and row[BOOST].version == pkv.parse("1.81")
+    )
+
+
+class TestLookaheadFilter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+
+    def check_combination_list(self, comb_list, row_filter):
+        for comb in comb_list:
+            self.assertEqual(len(comb), len(self.param_matrix))
+            self.assertTrue(row_filter(comb), f"{comb}")
+
+    def test_dead_end(self):
+        lookahead_filter = LookaheadFilter(pair_dead_end_filter, self.param_matrix, jobs=1)
+        row = parse_combination([(CMAKE, 3.22), (BOOST, 1.81)])
+        self.assertTrue(pair_dead_end_filter(row))
+        self.assertTrue(lookahead_filter.is_dead_end(row))
+        self.assertFalse(lookahead_filter(row))
+        self.assertFalse(
+            lookahead_filter.is_dead_end(parse_combination([(CMAKE, 3.22), (BOOST, 1.82)]))
+        )
+        # rows, which contain all parameters, are no dead ends
+        self.assertFalse(
+            lookahead_filter.is_dead_end(
+                parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 20.04)])
+            )
+        )
+
+    def test_covertable_avoids_pair_dead_end(self):
+        comb_list = make(
+            self.param_matrix,
+            pre_filter=LookaheadFilter(pair_dead_end_filter, self.param_matrix, jobs=1),
+        )
+        self.check_combination_list(comb_list, pair_dead_end_filter)
+
+    def test_covertable_avoids_triple_dead_end(self):
+        with self.assertRaises(InvalidCondition):
+            make(self.param_matrix, pre_filter=triple_dead_end_filter)
+
+        # the forbidden-pair table does not contain the rule of three parameters
+        lookahead_filter = LookaheadFilter(triple_dead_end_filter, self.param_matrix, jobs=1)
+        self.assertFalse(
+            lookahead_filter.is_dead_end(parse_combination([(CMAKE, 3.22), (BOOST, 1.81)]))
+        )
+
+        lookahead_filter = LookaheadFilter(
+            triple_dead_end_filter, self.param_matrix, jobs=1, check_domains=True
+        )
+        self.assertTrue(
+            lookahead_filter.is_dead_end(parse_combination([(CMAKE, 3.22), (BOOST, 1.81)]))
+        )
+        comb_list = make(self.param_matrix, pre_filter=lookahead_filter)
+        self.check_combination_list(comb_list, triple_dead_end_filter)
+
+
+class TestForbiddenPairFilterWithFilterChain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 12), (CLANG, 16), (NVCC, 12.0), (HIPCC, 6.0)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 12), (CLANG, 16), (HIPCC, 6.0)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_HIP_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_GPU_HIP_ENABLE, OFF), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.version_relation = VersionRelation()
+        cls.runtime_infos = get_runtime_infos(cls.param_matrix, cls.version_relation)
+        cls.filter_chain = get_default_filter_chain(
+            cls.version_relation, runtime_infos=cls.runtime_infos
+        )
+
+    def test_same_result_as_filter_chain(self):
+        forbidden_filter = ForbiddenPairFilter(self.filter_chain, self.param_matrix, jobs=1)
+        for row in [
+            [(HOST_COMPILER, NVCC, 12.0)],
+            [(DEVICE_COMPILER, HIPCC, 6.0), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0)],
+            [(DEVICE_COMPILER, HIPCC, 6.0), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)],
+            [(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, GCC, 12), (CMAKE, 3.22)],
+            [(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, NVCC, 12.0)],
+        ]:
+            comb = parse_combination(row)
+            self.assertEqual(forbidden_filter(comb), self.filter_chain(comb), f"{row}")
+
+    def test_lookahead_has_same_result_as_filter_chain(self):
+        lookahead_filter = LookaheadFilter(self.filter_chain, self.param_matrix, jobs=1)
+        for row in [
+            [(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, GCC, 12), (CMAKE, 3.22)],
+            [(DEVICE_COMPILER, HIPCC, 6.0), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0)],
+        ]:
+            comb = parse_combination(row)
+            self.assertEqual(lookahead_filter(comb), self.filter_chain(comb), f"{row}")
+
+    def test_generate_combination_list(self):
+        comb_list = generate_combination_list(
+            self.param_matrix, self.version_relation, self.runtime_infos
+        )
+        for comb in comb_list:
+            self.assertTrue(self.filter_chain(comb), f"{comb} does not pass the filter chain")
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            self.param_matrix, self.version_relation, self.runtime_infos
+        )
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, expected_pairs))
@@ -0,0 +1,102 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+import packaging.version as pkv
+from bashi.types import ParameterValue, ParameterValueMatrix
+from bashi.frozen_matrix import FrozenParameterValueMatrix
+from bashi.version.utils import get_parameter_value_matrix, get_frozen_parameter_value_matrix
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from utils_test import parse_param_vals
+
+
+class TestFrozenParameterValueMatrix(unittest.TestCase):
+    def setUp(self):
+        self.param_matrix: ParameterValueMatrix = OrderedDict()
+        self.param_matrix[HOST_COMPILER] = parse_param_vals([(GCC, 10), (CLANG, 16)])
+        self.param_matrix[DEVICE_COMPILER] = parse_param_vals([(NVCC, 12.0), (GCC, 10)])
+        self.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+
+    def test_mapping_interface(self):
+        frozen = FrozenParameterValueMatrix(self.param_matrix)
+        self.assertEqual(list(frozen.keys()), [HOST_COMPILER, DEVICE_COMPILER, CMAKE])
+        self.assertEqual(len(frozen), 3)
+        self.assertIn(CMAKE, frozen)
+        self.assertNotIn(BOOST, frozen)
+        self.assertEqual(frozen[CMAKE], tuple(self.param_matrix[CMAKE]))
+        self.assertEqual(len(FrozenParameterValueMatrix()), 0)
+
+    def test_content_is_copied(self):
+        frozen = FrozenParameterValueMatrix(self.param_matrix)
+        self.param_matrix[CMAKE].append(ParameterValue(CMAKE, pkv.parse("3.24")))
+        self.assertEqual(len(frozen[CMAKE]), 2)
+
+    def test_hash_and_equality(self):
+        frozen1 = FrozenParameterValueMatrix(self.param_matrix)
+        frozen2 = FrozenParameterValueMatrix(self.param_matrix)
+        self.assertIsNot(frozen1, frozen2)
+        self.assertEqual(frozen1, frozen2)
+        self.assertEqual(hash(frozen1), hash(frozen2))
+        self.assertEqual(len({frozen1: 1, frozen2: 2}), 1)
+
+        # ordering of the parameters is part of the content
+        reordered: ParameterValueMatrix = OrderedDict()
+        for param in reversed(self.param_matrix.keys()):
+            reordered[param] = self.param_matrix[param]
+        self.assertNotEqual(frozen1, FrozenParameterValueMatrix(reordered))
+
+        self.param_matrix[CMAKE].pop()
+        self.assertNotEqual(frozen1, FrozenParameterValueMatrix(self.param_matrix))
+
+    def test_extend(self):
+        frozen = FrozenParameterValueMatrix(self.param_matrix)
+        build_types = [
+            ParameterValue("build_type", pkv.parse("0")),
+            ParameterValue("build_type", pkv.parse("1")),
+        ]
+        extended = frozen.extend("build_type", build_types)
+        self.assertNotIn("build_type", frozen)
+        self.assertEqual(
+            list(extended.keys()), [HOST_COMPILER, DEVICE_COMPILER, CMAKE, "build_type"]
+        )
+        self.assertEqual(extended["build_type"], tuple(build_types))
+
+        # replacing an existing parameter keeps its position
+        replaced = extended.extend(HOST_COMPILER, parse_param_vals([(GCC, 11)]))
+        self.assertEqual(list(replaced.keys()), list(extended.keys()))
+        self.assertEqual(replaced[HOST_COMPILER], tuple(parse_param_vals([(GCC, 11)])))
+
+    def test_to_parameter_value_matrix(self):
+        frozen = FrozenParameterValueMatrix(self.param_matrix)
+        thawed = frozen.to_parameter_value_matrix()
+        self.assertEqual(thawed, self.param_matrix)
+        thawed[CMAKE].append(ParameterValue(CMAKE, pkv.parse("3.24")))
+        thawed[BOOST] = parse_param_vals([(BOOST, 1.83)])
+        self.assertEqual(len(frozen[CMAKE]), 2)
+        self.assertNotIn(BOOST, frozen)
+
+
+class TestMemoisedParameterValueMatrix(unittest.TestCase):
+    def test_same_arguments_same_object(self):
+        self.assertIs(get_frozen_parameter_value_matrix(), get_frozen_parameter_value_matrix())
+        sw_versions = {GCC: [10, 11], UBUNTU: [20.04]}
+        self.assertIs(
+            get_frozen_parameter_value_matrix(sw_versions, [ALPAKA_ACC_GPU_HIP_ENABLE]),
+            get_frozen_parameter_value_matrix(
+                {GCC: ["10", "11"], UBUNTU: ["20.04"]}, [ALPAKA_ACC_GPU_HIP_ENABLE]
+            ),
+        )
+
+    def test_different_arguments(self):
+        self.assertNotEqual(
+            get_frozen_parameter_value_matrix({GCC: [10, 11]}, []),
+            get_frozen_parameter_value_matrix({GCC: [10, 12]}, []),
+        )
+
+    def test_returned_matrix_is_independent(self):
+        matrix1 = get_parameter_value_matrix()
+        matrix1[HOST_COMPILER].clear()
+        matrix1["build_type"] = []
+        matrix2 = get_parameter_value_matrix()
+        self.assertNotEqual(len(matrix2[HOST_COMPILER]), 0)
+        self.assertNotIn("build_type", matrix2)
+        self.assertEqual(FrozenParameterValueMatrix(matrix2), get_frozen_parameter_value_matrix())
@@ -3,13 +3,23 @@ import unittest
 import os
 import io
 import copy
+import itertools
 from collections import OrderedDict
-from typing import Dict, Callable, IO
+from typing import Dict, Callable, IO, List
 import packaging.version as pkv
 from utils_test import parse_param_vals
 from bashi.version.utils import get_parameter_value_matrix
 from bashi.version.relation import VersionRelation
-from bashi.generator import generate_combination_list, get_runtime_infos
+from bashi.generator import (
+    generate_combination_list,
+    get_runtime_infos,
+    get_parameter_rejection_rates,
+    make_combination_list,
+    order_parameters_by_constraint,
+    prune_parameter_value_matrix,
+    SkipCoveredPairsSorter,
+)
+from bashi.forbidden_pairs import ForbiddenPairFilter
 from bashi.utils import (
     get_expected_parameter_value_pairs,
     check_parameter_value_pair_in_combination_list,
@@ -21,6 +31,7 @@ from bashi.types import (
     ParameterValue,
     ParameterValuePair,
     ParameterValueMatrix,
+    ParameterValueSingle,
 )
 from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 from bashi.filter_base import FilterBase
@@ -69,6 +80,19 @@ class TestGeneratorTestData(unittest.TestCase):
             )
         )
 
+    def test_generator_with_parameter_ordering(self):
+        comb_list = generate_combination_list(
+            self.param_matrix, self.version_relation, self.runtime_info, order_parameters=True
+        )
+
+        for comb in comb_list:
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                comb_list, self.generated_parameter_value_pairs
+            )
+        )
+
     def test_generator_with_custom_filter(self):
         class CustomFilter(FilterBase):
             def __init__(
@@ -439,6 +463,200 @@ class TestParameterMatrixFilter(unittest.TestCase):
             )
         )
 
+    def test_report_removed_parameter_values(self):
+        param_matrix = copy.deepcopy(self.param_base_matrix)
+        param_matrix[HOST_COMPILER].append(ParameterValue(NVCC, pkv.parse("12.0")))
+        param_matrix[DEVICE_COMPILER].append(ParameterValue(CLANG_CUDA, pkv.parse("13")))
+        runtime_info = get_runtime_infos(param_matrix, VersionRelation())
+
+        removed_parameter_values: List[ParameterValueSingle] = []
+        comb_list = generate_combination_list(
+            param_matrix,
+            self.version_relation,
+            runtime_info,
+            removed_parameter_values=removed_parameter_values,
+        )
+        self.assertEqual(
+            removed_parameter_values,
+            [
+                ParameterValueSingle(HOST_COMPILER, ParameterValue(NVCC, pkv.parse("12.0"))),
+                ParameterValueSingle(DEVICE_COMPILER, ParameterValue(CLANG_CUDA, pkv.parse("13"))),
+            ],
+        )
+        expected_param_value_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            param_matrix, self.version_relation, runtime_info
+        )
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(comb_list, expected_param_value_pairs)
+        )
+
+
+class TestPruneParameterValueMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+
+    def test_nothing_removed(self):
+        removed: List[ParameterValueSingle] = []
+        self.assertEqual(
+            prune_parameter_value_matrix(self.param_matrix, lambda _: True, removed),
+            self.param_matrix,
+        )
+        self.assertEqual(removed, [])
+
+    def test_single_and_unsupported_parameter_values(self):
+        def row_filter(row):
+            # boost 1.81 is never valid
+            if BOOST in row and row[BOOST].version == pkv.parse("1.81"):
+                return False
+            # cmake 3.22 requires boost 1.81 and Ubuntu 22.04 requires cmake 3.22
+            if CMAKE in row and BOOST in row and row[CMAKE].version == pkv.parse("3.22"):
+                return False
+            if CMAKE in row and UBUNTU in row and row[UBUNTU].version == pkv.parse("22.04"):
+                return row[CMAKE].version == pkv.parse("3.22")
+            return True
+
+        removed: List[ParameterValueSingle] = []
+        param_matrix_before = copy.deepcopy(self.param_matrix)
+        pruned_matrix = prune_parameter_value_matrix(self.param_matrix, row_filter, removed)
+        self.assertEqual(param_matrix_before, self.param_matrix)
+
+        self.assertEqual(list(pruned_matrix.keys()), [CMAKE, BOOST, UBUNTU])
+        self.assertEqual(pruned_matrix[CMAKE], self.param_matrix[CMAKE][1:])
+        self.assertEqual(pruned_matrix[BOOST], self.param_matrix[BOOST][1:])
+        self.assertEqual(pruned_matrix[UBUNTU], self.param_matrix[UBUNTU][:1])
+        self.assertEqual(
+            removed,
+            [
+                ParameterValueSingle(BOOST, self.param_matrix[BOOST][0]),
+                ParameterValueSingle(CMAKE, self.param_matrix[CMAKE][0]),
+                ParameterValueSingle(UBUNTU, self.param_matrix[UBUNTU][1]),
+            ],
+        )
+
+    def test_no_valid_parameter_value(self):
+        pruned_matrix = prune_parameter_value_matrix(
+            self.param_matrix, lambda row: BOOST not in row
+        )
+        self.assertEqual(pruned_matrix[BOOST], [])
+
+
+class TestOrderParametersByConstraint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+
+    @staticmethod
+    def row_filter(row):
+        # cmake 3.22 and cmake 3.23 are not available on Ubuntu 22.04
+        return not (CMAKE in row and UBUNTU in row and row[UBUNTU].version == pkv.parse("22.04"))
+
+    def test_rejection_rates(self):
+        self.assertEqual(
+            get_parameter_rejection_rates(self.param_matrix, self.row_filter),
+            {BOOST: 0.0, CMAKE: 0.25, UBUNTU: 0.25},
+        )
+        # the table of a ForbiddenPairFilter has the same result
+        self.assertEqual(
+            get_parameter_rejection_rates(
+                self.param_matrix, ForbiddenPairFilter(self.row_filter, self.param_matrix, jobs=1)
+            ),
+            {BOOST: 0.0, CMAKE: 0.25, UBUNTU: 0.25},
+        )
+        self.assertEqual(
+            get_parameter_rejection_rates(
+                OrderedDict({BOOST: self.param_matrix[BOOST]}), lambda _: True
+            ),
+            {BOOST: 0.0},
+        )
+
+    def test_most_constrained_first(self):
+        param_matrix_before = copy.deepcopy(self.param_matrix)
+        ordered_matrix = order_parameters_by_constraint(self.param_matrix, self.row_filter)
+        self.assertEqual(param_matrix_before, self.param_matrix)
+        # parameters with the same rejection rate keep their order
+        self.assertEqual(list(ordered_matrix.keys()), [CMAKE, UBUNTU, BOOST])
+        for parameter, parameter_values in self.param_matrix.items():
+            self.assertEqual(ordered_matrix[parameter], parameter_values)
+
+
+class TestSkipCoveredPairsSorter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23), (CMAKE, 3.24)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        cls.all_combinations = [
+            OrderedDict(zip(cls.param_matrix.keys(), param_vals))
+            for param_vals in itertools.product(*cls.param_matrix.values())
+        ]
+
+    @staticmethod
+    def row_filter(row):
+        # cmake 3.24 is not available on Ubuntu 20.04
+        return not (
+            CMAKE in row
+            and UBUNTU in row
+            and row[CMAKE].version == pkv.parse("3.24")
+            and row[UBUNTU].version == pkv.parse("20.04")
+        )
+
+    def test_fully_covered(self):
+        for row_filter in (lambda _: True, self.row_filter):
+            self.assertEqual(
+                make_combination_list(
+                    self.param_matrix,
+                    row_filter,
+                    SkipCoveredPairsSorter(self.param_matrix, self.all_combinations),
+                ),
+                [],
+            )
+
+        # the uncovered parameter-value-pairs are not valid
+        valid_combinations = [comb for comb in self.all_combinations if self.row_filter(comb)]
+        self.assertEqual(
+            make_combination_list(
+                self.param_matrix,
+                self.row_filter,
+                SkipCoveredPairsSorter(self.param_matrix, valid_combinations),
+            ),
+            [],
+        )
+
+    def test_partially_covered(self):
+        covered_combinations = self.all_combinations[:3]
+        comb_list = make_combination_list(
+            self.param_matrix,
+            self.row_filter,
+            SkipCoveredPairsSorter(self.param_matrix, covered_combinations),
+        )
+        self.assertNotEqual(comb_list, [])
+        for comb in comb_list:
+            self.assertTrue(self.row_filter(comb))
+        expected_param_val_pairs = get_expected_parameter_value_pairs(self.param_matrix)
+        remove_parameter_value_pairs(
+            expected_param_val_pairs,
+            [],
+            parameter1=CMAKE,
+            value_name1=CMAKE,
+            value_version1="3.24",
+            parameter2=UBUNTU,
+            value_name2=UBUNTU,
+            value_version2="20.04",
+        )
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(
+                covered_combinations + comb_list, expected_param_val_pairs
+            )
+        )
+
 
 class TestGetParameterValueMatrix(unittest.TestCase):
     def test_get_parameter_value_matrix_empty_input(self: "unittest.TestCase"):
@@ -0,0 +1,149 @@
+# pylint: disable=missing-docstring
+import io
+import time
+import unittest
+from contextlib import redirect_stdout
+from collections import OrderedDict
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import (
+    generate_combination_list,
+    generate_combination_list_with_deadline,
+    get_runtime_infos,
+)
+from bashi.filter_base import FilterBase
+from bashi.filter_chain import get_default_filter_chain
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.row import BashiRow
+from bashi.utils import check_parameter_value_pair_in_combination_list
+
+
+class SlowFilter(FilterBase):
+    # the table of forbidden pairs is built before the deadline is checked, therefore only the
+    # larger rows of covertable are slow
+    def __call__(self, row: BashiRow) -> bool:
+        if len(row) > 2:
+            time.sleep(0.005)
+        return True
+
+
+class TestGenerateCombinationListWithDeadline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+        cls.version_relation = VersionRelation()
+        cls.runtime_infos = get_runtime_infos(cls.param_matrix, cls.version_relation)
+        cls.expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            cls.param_matrix, cls.version_relation, cls.runtime_infos
+        )
+
+    def test_complete_generation(self):
+        result = generate_combination_list_with_deadline(
+            self.param_matrix, self.version_relation, self.runtime_infos, 60.0
+        )
+        self.assertTrue(result.complete)
+        self.assertEqual(result.missing_pairs, [])
+        self.assertEqual(
+            result.combination_list,
+            generate_combination_list(self.param_matrix, self.version_relation, self.runtime_infos),
+        )
+
+    def test_deadline_before_start(self):
+        result = generate_combination_list_with_deadline(
+            self.param_matrix, self.version_relation, self.runtime_infos, 0.0
+        )
+        self.assertFalse(result.complete)
+        self.assertEqual(result.combination_list, [])
+        # the invalid pairs are not reported
+        self.assertEqual(sorted(result.missing_pairs), sorted(self.expected_pairs))
+
+    def test_order_parameters(self):
+        removed_parameter_values = []
+        result = generate_combination_list_with_deadline(
+            self.param_matrix,
+            self.version_relation,
+            self.runtime_infos,
+            60.0,
+            removed_parameter_values=removed_parameter_values,
+            order_parameters=True,
+        )
+        self.assertTrue(result.complete)
+        expected_removed_parameter_values = []
+        self.assertEqual(
+            result.combination_list,
+            generate_combination_list(
+                self.param_matrix,
+                self.version_relation,
+                self.runtime_infos,
+                removed_parameter_values=expected_removed_parameter_values,
+                order_parameters=True,
+            ),
+        )
+        self.assertEqual(removed_parameter_values, expected_removed_parameter_values)
+
+        result = generate_combination_list_with_deadline(
+            self.param_matrix,
+            self.version_relation,
+            self.runtime_infos,
+            0.0,
+            order_parameters=True,
+        )
+        self.assertEqual(sorted(result.missing_pairs), sorted(self.expected_pairs))
+
+    def test_debug_mode(self):
+        # without the table of forbidden pairs, the filter chain checks the uncovered pairs
+        with redirect_stdout(io.StringIO()):
+            result = generate_combination_list_with_deadline(
+                self.param_matrix,
+                self.version_relation,
+                self.runtime_infos,
+                0.0,
+                debug_print=FilterDebugMode.NORMAL,
+            )
+        self.assertEqual(sorted(result.missing_pairs), sorted(self.expected_pairs))
+
+    def test_partial_generation(self):
+        start = time.monotonic()
+        result = generate_combination_list_with_deadline(
+            self.param_matrix,
+            self.version_relation,
+            self.runtime_infos,
+            0.5,
+            custom_filter=SlowFilter(),
+        )
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertFalse(result.complete)
+        self.assertGreater(len(result.combination_list), 0)
+
+        filter_chain = get_default_filter_chain(
+            self.version_relation, runtime_infos=self.runtime_infos
+        )
+        for comb in result.combination_list:
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+            self.assertTrue(filter_chain(comb))
+
+        # each expected pair is either covered or reported as missing
+        missing = set(result.missing_pairs)
+        covered_pairs = [pair for pair in self.expected_pairs if pair not in missing]
+        self.assertGreater(len(covered_pairs), 0)
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(result.combination_list, covered_pairs)
+        )
+        self.assertTrue(all(pair in self.expected_pairs for pair in missing))
@@ -0,0 +1,82 @@
+# pylint: disable=missing-docstring
+import unittest
+import os
+import subprocess
+import sys
+from typing import List
+
+
+def get_imported_modules(statement: str) -> List[str]:
+    """Execute the statement in a new interpreter and returns the names of all loaded modules.
+
+    Args:
+        statement (str): python code to execute
+
+    Returns:
+        List[str]: names of the loaded modules
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    process = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return process.stdout.splitlines()
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_bashi_is_lightweight(self):
+        modules = get_imported_modules("import bashi")
+        self.assertIn("bashi", modules)
+        for heavy_module in (
+            "covertable",
+            "typeguard",
+            "termcolor",
+            "bashi.generator",
+            "bashi.filter_chain",
+            "bashi.results",
+            "bashi.printer",
+        ):
+            self.assertNotIn(heavy_module, modules)
+
+    def test_lazy_exports_are_loaded_on_access(self):
+        modules = get_imported_modules("import bashi; bashi.generate_combination_list")
+        self.assertIn("bashi.generator", modules)
+        self.assertIn("covertable", modules)
+        self.assertNotIn("bashi.results", modules)
+
+    def test_filter_chain_does_not_load_termcolor(self):
+        self.assertNotIn("termcolor", get_imported_modules("import bashi.filter_chain"))
+
+    def test_all_exports_available(self):
+        import bashi  # pylint: disable=import-outside-toplevel
+
+        for name in bashi.__all__:
+            self.assertIsNotNone(getattr(bashi, name), name)
+            self.assertIn(name, dir(bashi))
+
+        with self.assertRaises(AttributeError):
+            _ = bashi.does_not_exist  # type: ignore
+
+    def test_single_row_validator_does_not_load_multiprocessing(self):
+        modules = get_imported_modules("import bashiValidate.validator")
+        self.assertNotIn("bashiValidate.combination_list", modules)
+        self.assertNotIn("bashi.utils", modules)
+        self.assertNotIn("multiprocessing", modules)
+
+    def test_validator_does_not_load_typeguard(self):
+        modules = get_imported_modules(
+            "import bashiValidate\n"
+            "from bashi import VersionRelation\n"
+            "validator = bashiValidate.Validator(\n"
+            "    VersionRelation(), args=['--host-compiler', 'gcc@12', '--ubuntu', '22.04'],\n"
+            "    silent=True\n"
+            ")\n"
+            "assert validator.validate()"
+        )
+        self.assertIn("bashiValidate.validator", modules)
+        self.assertNotIn("typeguard", modules)
+        self.assertNotIn("bashi.generator", modules)
@@ -0,0 +1,135 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+from collections import OrderedDict
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import CombinationList, ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.filter_chain import get_default_filter_chain
+from bashi.utils import (
+    check_parameter_value_pair_in_combination_list,
+    get_expected_parameter_value_pairs,
+    parse_combination,
+)
+from bashi.local_search import optimize_combination_list
+
+
+def make_combination_list(rows) -> CombinationList:
+    versions = {
+        CMAKE: (3.22, 3.23),
+        BOOST: (1.81, 1.82),
+        UBUNTU: (20.04, 22.04),
+        CXX_STANDARD: (17, 20),
+    }
+    return [
+        parse_combination(
+            [(parameter, versions[parameter][bit]) for parameter, bit in zip(versions, row)]
+        )
+        for row in rows
+    ]
+
+
+class TestOptimizeCombinationList(unittest.TestCase):
+    def setUp(self):
+        self.param_matrix: ParameterValueMatrix = OrderedDict()
+        self.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        self.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        self.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        self.param_matrix[CXX_STANDARD] = parse_param_vals([(CXX_STANDARD, 17), (CXX_STANDARD, 20)])
+        self.expected_pairs = get_expected_parameter_value_pairs(self.param_matrix)
+        self.filter_chain = get_default_filter_chain(VersionRelation())
+        # none of the 6 combinations is redundant, but 5 combinations are enough
+        self.comb_list = make_combination_list(
+            [
+                (0, 0, 0, 0),
+                (0, 0, 0, 1),
+                (0, 1, 1, 0),
+                (0, 1, 1, 1),
+                (1, 0, 1, 0),
+                (1, 1, 0, 1),
+            ]
+        )
+
+    def test_rewrite_combinations(self):
+        optimized = optimize_combination_list(
+            self.comb_list, self.expected_pairs, self.filter_chain, time_budget=5.0, jobs=1
+        )
+        self.assertEqual(len(optimized), 5)
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(optimized, self.expected_pairs)
+        )
+        for comb in optimized:
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+
+    def test_parallel_restarts(self):
+        optimized = optimize_combination_list(
+            self.comb_list,
+            self.expected_pairs,
+            self.filter_chain,
+            time_budget=5.0,
+            restarts=2,
+            jobs=2,
+        )
+        self.assertEqual(len(optimized), 5)
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(optimized, self.expected_pairs)
+        )
+
+    def test_filter_is_respected(self):
+        # forbids all changes, except the original combinations
+        allowed = [dict(comb) for comb in self.comb_list]
+        optimized = optimize_combination_list(
+            self.comb_list,
+            self.expected_pairs,
+            lambda row: dict(row) in allowed,
+            time_budget=0.5,
+            jobs=1,
+        )
+        self.assertEqual(optimized, self.comb_list)
+
+    def test_not_covered_expected_pairs(self):
+        # cmake 3.22 is not available on Ubuntu 22.04, therefore the input cannot cover the pair
+        def row_filter(row):
+            return not (
+                row[CMAKE].version == pkv.parse("3.22")
+                and row[UBUNTU].version == pkv.parse("22.04")
+            )
+
+        comb_list = make_combination_list(
+            [(1, 1, 1, 1), (1, 1, 0, 0), (0, 0, 0, 1), (0, 0, 0, 0), (0, 1, 0, 1)]
+        )
+        covered_pairs = [
+            pair
+            for pair in self.expected_pairs
+            if check_parameter_value_pair_in_combination_list(comb_list, [pair], io.StringIO())
+        ]
+        self.assertLess(len(covered_pairs), len(self.expected_pairs))
+
+        optimized = optimize_combination_list(
+            comb_list, self.expected_pairs, row_filter, time_budget=5.0, jobs=1
+        )
+        # the pairs, which are not covered by the input, do not block the removal of combinations
+        self.assertEqual(len(optimized), 4)
+        self.assertTrue(check_parameter_value_pair_in_combination_list(optimized, covered_pairs))
+        for comb in optimized:
+            self.assertTrue(row_filter(comb))
+
+    def test_redundant_combinations_and_errors(self):
+        self.assertEqual(
+            optimize_combination_list(
+                self.comb_list[:1] * 3, self.expected_pairs, self.filter_chain, time_budget=0.1
+            ),
+            self.comb_list[:1],
+        )
+        with self.assertRaises(ValueError):
+            optimize_combination_list(
+                self.comb_list, self.expected_pairs, self.filter_chain, restarts=0
+            )
+        with self.assertRaises(ValueError):
+            optimize_combination_list(
+                self.comb_list[:1] + [parse_combination([(CMAKE, 3.23), (BOOST, 1.82)])],
+                self.expected_pairs,
+                self.filter_chain,
+            )
@@ -0,0 +1,116 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import generate_combination_list, get_runtime_infos
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import (
+    check_parameter_value_pair_in_combination_list,
+    get_expected_parameter_value_pairs,
+    parse_combination,
+)
+from bashi.minimize import (
+    minimize_combination_list,
+    remove_redundant_sets,
+    select_greedy_set_cover,
+)
+
+
+class TestSetCover(unittest.TestCase):
+    def test_remove_redundant_sets(self):
+        pair_sets = [{(0, 1), (0, 2)}, {(0, 1)}, {(0, 2), (1, 2)}, set()]
+        self.assertEqual(remove_redundant_sets(pair_sets, [0, 1, 2, 3]), [1, 2])
+        self.assertEqual(remove_redundant_sets(pair_sets, [3, 2, 1, 0]), [2, 0])
+        self.assertEqual(remove_redundant_sets(pair_sets, [1, 2, 0], [1.0, 1.0, 1.0, 1.0]), [2, 0])
+        # the expensive set is removed first
+        self.assertEqual(remove_redundant_sets(pair_sets, [0, 1, 2], [1.0, 5.0, 1.0, 1.0]), [0, 2])
+
+    def test_select_greedy_set_cover(self):
+        pair_sets = [{(0, 1)}, {(0, 2)}, {(0, 1), (0, 2), (1, 2)}, {(1, 2)}]
+        self.assertEqual(select_greedy_set_cover(pair_sets), [2])
+        # the big set is too expensive
+        self.assertEqual(
+            sorted(select_greedy_set_cover(pair_sets, [1.0, 1.0, 10.0, 1.0])), [0, 1, 3]
+        )
+        self.assertEqual(select_greedy_set_cover([]), [])
+
+
+class TestMinimizeCombinationList(unittest.TestCase):
+    def setUp(self):
+        self.param_matrix: ParameterValueMatrix = OrderedDict()
+        self.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        self.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        self.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        self.expected_pairs = get_expected_parameter_value_pairs(self.param_matrix)
+
+    def test_remove_duplicates_and_useless_rows(self):
+        comb_list = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+        ]
+        minimized = minimize_combination_list(comb_list, self.expected_pairs)
+        self.assertEqual(minimized, [comb_list[0], comb_list[1], comb_list[2], comb_list[4]])
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(minimized, self.expected_pairs)
+        )
+        # the input is not modified
+        self.assertEqual(len(comb_list), 6)
+
+    def test_set_cover_is_better_than_removing(self):
+        # removing from the end keeps the first four rows, the set cover needs only the last four
+        comb_list = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81)]),
+            parse_combination([(CMAKE, 3.22), (UBUNTU, 20.04)]),
+            parse_combination([(BOOST, 1.81), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+        ]
+        minimized = minimize_combination_list(comb_list, self.expected_pairs)
+        self.assertEqual(minimized, comb_list[3:])
+
+    def test_not_covered_expected_pairs_are_ignored(self):
+        comb_list = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+        ]
+        self.assertEqual(minimize_combination_list(comb_list, self.expected_pairs), comb_list[:1])
+        self.assertEqual(minimize_combination_list([], self.expected_pairs), [])
+        self.assertEqual(minimize_combination_list(comb_list, []), [])
+
+    def test_generated_combination_list(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+        version_relation = VersionRelation()
+        runtime_infos = get_runtime_infos(param_matrix, version_relation)
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            param_matrix, version_relation, runtime_infos
+        )
+        comb_list = generate_combination_list(param_matrix, version_relation, runtime_infos)
+
+        minimized = minimize_combination_list(comb_list + comb_list, expected_pairs)
+        self.assertLessEqual(len(minimized), len(comb_list))
+        self.assertTrue(check_parameter_value_pair_in_combination_list(minimized, expected_pairs))
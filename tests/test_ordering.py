@@ -0,0 +1,48 @@
+# pylint: disable=missing-docstring
+import unittest
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.utils import parse_combination
+from bashi.ordering import get_locality_switches, order_combination_list
+
+
+class TestOrderCombinationList(unittest.TestCase):
+    def test_group_by_locality_keys(self):
+        comb_list = [
+            parse_combination([(UBUNTU, 22.04), (HOST_COMPILER, GCC, 12), (CMAKE, 3.22)]),
+            parse_combination([(UBUNTU, 20.04), (HOST_COMPILER, GCC, 11), (CMAKE, 3.23)]),
+            parse_combination([(UBUNTU, 22.04), (HOST_COMPILER, GCC, 11), (CMAKE, 3.24)]),
+            parse_combination([(UBUNTU, 20.04), (HOST_COMPILER, GCC, 12), (CMAKE, 3.25)]),
+            parse_combination([(UBUNTU, 22.04), (HOST_COMPILER, GCC, 12), (CMAKE, 3.26)]),
+        ]
+        original = list(comb_list)
+        self.assertEqual(
+            get_locality_switches(comb_list, [UBUNTU, HOST_COMPILER]),
+            {UBUNTU: 4, HOST_COMPILER: 2},
+        )
+
+        ordered = order_combination_list(comb_list, [UBUNTU, HOST_COMPILER])
+        # the GCC 12 group of Ubuntu 22.04 follows the GCC 12 row of Ubuntu 20.04 and the GCC 12
+        # rows keep their relative order
+        self.assertEqual(
+            ordered, [comb_list[1], comb_list[3], comb_list[0], comb_list[4], comb_list[2]]
+        )
+        self.assertEqual(
+            get_locality_switches(ordered, [UBUNTU, HOST_COMPILER]),
+            {UBUNTU: 1, HOST_COMPILER: 2},
+        )
+        # the input is not modified
+        self.assertEqual(comb_list, original)
+
+    def test_missing_parameter_and_default_keys(self):
+        comb_list = [
+            parse_combination([(CMAKE, 3.22)]),
+            parse_combination([(UBUNTU, 22.04), (CMAKE, 3.23)]),
+            parse_combination([(UBUNTU, 20.04), (CMAKE, 3.24)]),
+            parse_combination([(UBUNTU, 22.04), (CMAKE, 3.25)]),
+        ]
+        ordered = order_combination_list(comb_list)
+        self.assertEqual(ordered, [comb_list[2], comb_list[1], comb_list[3], comb_list[0]])
+        self.assertEqual(get_locality_switches(ordered)[UBUNTU], 2)
+        self.assertEqual(order_combination_list([]), [])
+        self.assertEqual(get_locality_switches([], [UBUNTU]), {UBUNTU: 0})
+        self.assertEqual(order_combination_list(comb_list, []), comb_list)
@@ -0,0 +1,156 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix, ParameterValuePair
+from bashi.version.relation import VersionRelation
+from bashi.generator import generate_combination_list, get_runtime_infos
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import (
+    create_parameter_value_pair,
+    get_expected_parameter_value_pairs,
+    parse_combination,
+)
+from bashi.priority import (
+    generate_priority_ordered_combination_list,
+    get_coverage_curve,
+    get_newest_version_weights,
+    get_pair_priority,
+    order_by_priority,
+)
+
+
+class TestPairPriority(unittest.TestCase):
+    def test_get_pair_priority(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 12), (GCC, 11), (CLANG, 16), (CLANG, 17)]
+        )
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        weights = get_newest_version_weights(param_matrix, [HOST_COMPILER, CMAKE], weight=3.0)
+        self.assertEqual(
+            weights,
+            {
+                (HOST_COMPILER, param_matrix[HOST_COMPILER][1]): 3.0,
+                (HOST_COMPILER, param_matrix[HOST_COMPILER][4]): 3.0,
+                (CMAKE, param_matrix[CMAKE][1]): 3.0,
+            },
+        )
+
+        priority = get_pair_priority({(CMAKE, HOST_COMPILER): 2.0}, weights)
+        self.assertEqual(
+            priority(create_parameter_value_pair(HOST_COMPILER, GCC, 12, CMAKE, CMAKE, 3.23)),
+            18.0,
+        )
+        self.assertEqual(
+            priority(create_parameter_value_pair(HOST_COMPILER, GCC, 10, CMAKE, CMAKE, 3.22)), 2.0
+        )
+        self.assertEqual(
+            priority(create_parameter_value_pair(HOST_COMPILER, GCC, 10, BOOST, BOOST, 1.82)), 1.0
+        )
+        self.assertEqual(
+            get_pair_priority()(
+                create_parameter_value_pair(HOST_COMPILER, GCC, 12, CMAKE, CMAKE, 3.23)
+            ),
+            1.0,
+        )
+
+
+class TestOrderByPriority(unittest.TestCase):
+    def setUp(self):
+        self.param_matrix: ParameterValueMatrix = OrderedDict()
+        self.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        self.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        self.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        self.expected_pairs = get_expected_parameter_value_pairs(self.param_matrix)
+        self.comb_list = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 20.04)]),
+        ]
+
+    def test_order_by_priority(self):
+        priority = get_pair_priority(
+            parameter_value_weights={(UBUNTU, self.param_matrix[UBUNTU][1]): 10.0}
+        )
+        ordered = order_by_priority(self.comb_list, self.expected_pairs, priority)
+        # the Ubuntu 22.04 combinations first, the duplicate does not cover a new pair
+        self.assertEqual(
+            ordered,
+            [
+                self.comb_list[1],
+                self.comb_list[2],
+                self.comb_list[0],
+                self.comb_list[3],
+                self.comb_list[4],
+            ],
+        )
+
+        original_curve = get_coverage_curve(self.comb_list, self.expected_pairs, priority)
+        ordered_curve = get_coverage_curve(ordered, self.expected_pairs, priority)
+        self.assertEqual(len(ordered_curve), 5)
+        self.assertEqual(ordered_curve[-1], 1.0)
+        for original, optimized in zip(original_curve, ordered_curve):
+            self.assertLessEqual(original, optimized)
+        self.assertLess(original_curve[0], ordered_curve[0])
+
+    def test_coverage_curve(self):
+        self.assertEqual(
+            get_coverage_curve(self.comb_list, self.expected_pairs),
+            [3 / 12, 6 / 12, 9 / 12, 1.0, 1.0],
+        )
+        # pairs with parameter-values, which do not exist in the combination-list
+        self.assertEqual(get_coverage_curve(self.comb_list[:1], self.expected_pairs), [3 / 12])
+        self.assertEqual(get_coverage_curve([], self.expected_pairs), [])
+
+    def test_coverage_curve_with_duplicated_pairs(self):
+        swapped_pairs = [
+            ParameterValuePair(param_val_pair.second, param_val_pair.first)
+            for param_val_pair in self.expected_pairs
+        ]
+        self.assertEqual(
+            get_coverage_curve(
+                self.comb_list, self.expected_pairs + self.expected_pairs + swapped_pairs
+            ),
+            [3 / 12, 6 / 12, 9 / 12, 1.0, 1.0],
+        )
+
+
+class TestPriorityOrderedGeneration(unittest.TestCase):
+    def test_generate(self):
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        version_relation = VersionRelation()
+        runtime_infos = get_runtime_infos(param_matrix, version_relation)
+        expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            param_matrix, version_relation, runtime_infos
+        )
+        priority = get_pair_priority(
+            parameter_value_weights=get_newest_version_weights(param_matrix)
+        )
+
+        regular = generate_combination_list(param_matrix, version_relation, runtime_infos)
+        ordered = generate_priority_ordered_combination_list(
+            param_matrix, version_relation, runtime_infos, priority
+        )
+        self.assertEqual(len(ordered), len(regular))
+        regular_curve = get_coverage_curve(regular, expected_pairs, priority)
+        ordered_curve = get_coverage_curve(ordered, expected_pairs, priority)
+        self.assertEqual(ordered_curve[-1], 1.0)
+        self.assertGreaterEqual(sum(ordered_curve), sum(regular_curve))
@@ -0,0 +1,145 @@
+# pylint: disable=missing-docstring
+import io
+import unittest
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.utils import parse_combination
+from bashi.scheduler import (
+    CPU_RUNNER,
+    NVIDIA_GPU_RUNNER,
+    AMD_GPU_RUNNER,
+    INTEL_GPU_RUNNER,
+    AdditiveDurationModel,
+    RunnerPool,
+    get_makespan,
+    get_runner_tags,
+    learn_duration_model,
+    schedule_combination_list,
+)
+
+
+def cmake_duration_model(row):
+    # the minor version of CMake is used as duration
+    return float(row[CMAKE].version.minor)
+
+
+class TestRunnerTags(unittest.TestCase):
+    def test_get_runner_tags(self):
+        self.assertEqual(get_runner_tags(parse_combination([(CMAKE, 3.22)])), [CPU_RUNNER])
+        self.assertEqual(
+            get_runner_tags(parse_combination([(ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)])), [CPU_RUNNER]
+        )
+        self.assertEqual(
+            get_runner_tags(parse_combination([(ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4)])),
+            [NVIDIA_GPU_RUNNER],
+        )
+        self.assertEqual(
+            get_runner_tags(parse_combination([(ALPAKA_ACC_GPU_HIP_ENABLE, ON)])), [AMD_GPU_RUNNER]
+        )
+        self.assertEqual(
+            get_runner_tags(parse_combination([(ALPAKA_ACC_ONEAPI_GPU_ENABLE, ON)])),
+            [INTEL_GPU_RUNNER],
+        )
+
+
+class TestScheduleCombinationList(unittest.TestCase):
+    def test_balance_runners(self):
+        comb_list = [
+            parse_combination([(CMAKE, "3.3")]),
+            parse_combination([(CMAKE, "3.2")]),
+            parse_combination([(CMAKE, "3.3")]),
+            parse_combination([(CMAKE, "3.2")]),
+            parse_combination([(CMAKE, "3.2")]),
+        ]
+        pools = [RunnerPool(CPU_RUNNER, 2, 1.0)]
+        schedule = schedule_combination_list(comb_list, pools, cmake_duration_model)
+        # the longest processing time first rule results in 3+2+2 and 3+2, the local search finds
+        # the optimal schedule 3+3 and 2+2+2
+        self.assertEqual(len(schedule[CPU_RUNNER]), 2)
+        self.assertEqual(get_makespan(schedule, pools, cmake_duration_model), 6.0)
+        self.assertEqual(
+            sorted(len(batch) for batch in schedule[CPU_RUNNER]),
+            [2, 3],
+        )
+
+    def test_pools_and_speed(self):
+        comb_list = [
+            parse_combination([(CMAKE, "3.4"), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4)]),
+            parse_combination([(CMAKE, "3.4"), (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4)]),
+            parse_combination([(CMAKE, "3.2"), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)]),
+            parse_combination([(CMAKE, "3.2"), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)]),
+        ]
+        pools = [RunnerPool(CPU_RUNNER, 1, 1.0), RunnerPool(NVIDIA_GPU_RUNNER, 2, 2.0)]
+        schedule = schedule_combination_list(comb_list, pools, cmake_duration_model)
+        self.assertEqual(schedule[CPU_RUNNER], [comb_list[2:]])
+        self.assertEqual(schedule[NVIDIA_GPU_RUNNER], [comb_list[:1], comb_list[1:2]])
+        self.assertEqual(get_makespan(schedule, pools, cmake_duration_model), 4.0)
+
+        # CPU jobs can also run on the GPU runners
+        schedule = schedule_combination_list(
+            comb_list,
+            pools,
+            cmake_duration_model,
+            get_tags=lambda comb: get_runner_tags(comb) + [NVIDIA_GPU_RUNNER],
+        )
+        self.assertEqual(get_makespan(schedule, pools, cmake_duration_model), 3.0)
+
+    def test_errors(self):
+        comb_list = [parse_combination([(CMAKE, "3.2"), (ALPAKA_ACC_GPU_HIP_ENABLE, ON)])]
+        with self.assertRaises(ValueError):
+            schedule_combination_list(
+                comb_list, [RunnerPool(CPU_RUNNER, 1, 1.0)], cmake_duration_model
+            )
+        with self.assertRaises(ValueError):
+            schedule_combination_list(
+                comb_list, [RunnerPool(AMD_GPU_RUNNER, 0, 1.0)], cmake_duration_model
+            )
+        self.assertEqual(
+            schedule_combination_list([], [RunnerPool(CPU_RUNNER, 2, 1.0)], cmake_duration_model),
+            {CPU_RUNNER: [[], []]},
+        )
+
+
+class TestLearnDurationModel(unittest.TestCase):
+    def test_learn_additive_effects(self):
+        csv_file = io.StringIO(
+            "host_compiler,alpaka_ACC_GPU_CUDA_ENABLE,cmake,duration\n"
+            "gcc@12,OFF,3.22,100\n"
+            "gcc@12,12.4,3.22,400\n"
+            "clang@17,OFF,3.22,150\n"
+            "clang@17,12.4,,450\n"
+        )
+        model = learn_duration_model(csv_file)
+        self.assertAlmostEqual(
+            model(parse_combination([(HOST_COMPILER, GCC, 12), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)])),
+            100.0,
+            places=3,
+        )
+        self.assertAlmostEqual(
+            model(
+                parse_combination(
+                    [(HOST_COMPILER, CLANG, 17), (ALPAKA_ACC_GPU_CUDA_ENABLE, "12.4")]
+                )
+            ),
+            450.0,
+            places=3,
+        )
+        # unknown parameter-values have no effect
+        self.assertAlmostEqual(
+            model(parse_combination([(HOST_COMPILER, GCC, 13), (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)])),
+            model(parse_combination([(ALPAKA_ACC_GPU_CUDA_ENABLE, OFF)])),
+        )
+
+    def test_errors_and_empty_input(self):
+        with self.assertRaises(ValueError):
+            learn_duration_model(io.StringIO("host_compiler,time\ngcc@12,100\n"))
+        with self.assertRaises(ValueError):
+            learn_duration_model(io.StringIO("cmake,duration\n3.22,long\n"))
+        with self.assertRaises(ValueError):
+            learn_duration_model(io.StringIO("cmake,duration\nnew,100\n"))
+        self.assertEqual(
+            learn_duration_model(io.StringIO("cmake,duration\n"))(
+                parse_combination([(CMAKE, 3.22)])
+            ),
+            0.0,
+        )
+        self.assertEqual(AdditiveDurationModel(-5.0)(parse_combination([(CMAKE, 3.22)])), 0.0)
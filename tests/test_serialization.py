@@ -0,0 +1,69 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+from bashi.types import CombinationList
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.utils import parse_combination
+from bashi.serialization import (
+    write_combination_list,
+    read_combination_list,
+    combination_to_json_object,
+    json_object_to_combination,
+)
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self.comb_list: CombinationList = [
+            parse_combination(
+                [
+                    (HOST_COMPILER, GCC, 10),
+                    (DEVICE_COMPILER, NVCC, 12.4),
+                    (UBUNTU, "20.04"),
+                    (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4),
+                    (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON),
+                ]
+            ),
+            parse_combination(
+                [
+                    (UBUNTU, "22.04"),
+                    (HOST_COMPILER, CLANG, 16),
+                    (DEVICE_COMPILER, CLANG, 16),
+                    (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                    (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF),
+                ]
+            ),
+        ]
+
+    def test_json_object(self):
+        json_object = combination_to_json_object(self.comb_list[0])
+        self.assertEqual(json_object[HOST_COMPILER], [GCC, "10"])
+        self.assertEqual(
+            json_object[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE], [ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON]
+        )
+        self.assertEqual(json_object_to_combination(json_object), self.comb_list[0])
+
+        for invalid in ([], {UBUNTU: "20.04"}, {UBUNTU: [UBUNTU]}, {UBUNTU: [UBUNTU, "a.b"]}):
+            with self.assertRaises(ValueError):
+                json_object_to_combination(invalid)  # type: ignore
+
+    def test_round_trip(self):
+        for json_lines in (False, True):
+            output = io.StringIO()
+            write_combination_list(self.comb_list, output, json_lines)
+            output.seek(0)
+            read_list = read_combination_list(output)
+            self.assertEqual(read_list, self.comb_list)
+            for read_comb, comb in zip(read_list, self.comb_list):
+                self.assertEqual(list(read_comb.keys()), list(comb.keys()))
+
+    def test_empty_list(self):
+        output = io.StringIO()
+        write_combination_list([], output)
+        output.seek(0)
+        self.assertEqual(read_combination_list(output), [])
+        self.assertEqual(read_combination_list(io.StringIO("")), [])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            read_combination_list(io.StringIO("[{]"))
@@ -0,0 +1,272 @@
+# pylint: disable=missing-docstring
+import unittest
+from collections import OrderedDict
+from typing import Callable, Dict, IO
+import packaging.version as pkv
+from utils_test import parse_param_vals
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.types import ParameterValueMatrix
+from bashi.version.utils import get_parameter_value_matrix
+from bashi.version.relation import VersionRelation
+from bashi.generator import generate_combination_list, get_runtime_infos
+from bashi.filter_chain import get_default_filter_chain
+from bashi.results import get_expected_bashi_parameter_value_pairs
+from bashi.utils import check_parameter_value_pair_in_combination_list, parse_combination
+from bashi.filter_base import FilterBase
+from bashi.row import BashiRow
+from bashi.strength import (
+    generate_mixed_strength_combination_list,
+    get_missing_parameter_value_tuples,
+)
+
+
+class TestMissingParameterValueTuples(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        cls.param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+
+    def test_complete_combination_list(self):
+        comb_list = [
+            parse_combination([(CMAKE, cmake), (BOOST, boost), (UBUNTU, ubuntu)])
+            for cmake in (3.22, 3.23)
+            for boost in (1.81, 1.82)
+            for ubuntu in (20.04, 22.04)
+        ]
+        self.assertEqual(
+            get_missing_parameter_value_tuples(comb_list, self.param_matrix, lambda _: True), []
+        )
+
+    def test_missing_triples(self):
+        comb_list = [
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)]),
+            parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 22.04)]),
+            parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 20.04)]),
+        ]
+        # the combination-list covers all pairs, but only the half of the triples
+        self.assertEqual(
+            get_missing_parameter_value_tuples(
+                comb_list, self.param_matrix, lambda _: True, strength=2
+            ),
+            [],
+        )
+        self.assertEqual(
+            get_missing_parameter_value_tuples(comb_list, self.param_matrix, lambda _: True),
+            [
+                parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 22.04)]),
+                parse_combination([(CMAKE, 3.22), (BOOST, 1.82), (UBUNTU, 20.04)]),
+                parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 20.04)]),
+                parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            ],
+        )
+
+        # invalid tuples are not missing
+        self.assertEqual(
+            get_missing_parameter_value_tuples(
+                comb_list,
+                self.param_matrix,
+                lambda row: not (CMAKE in row and row[CMAKE] == comb_list[0][CMAKE]),
+            ),
+            [
+                parse_combination([(CMAKE, 3.23), (BOOST, 1.81), (UBUNTU, 20.04)]),
+                parse_combination([(CMAKE, 3.23), (BOOST, 1.82), (UBUNTU, 22.04)]),
+            ],
+        )
+
+    def test_parameters(self):
+        comb_list = [parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)])]
+        missing = get_missing_parameter_value_tuples(
+            comb_list, self.param_matrix, lambda _: True, strength=2, parameters=[UBUNTU, CMAKE]
+        )
+        self.assertEqual(len(missing), 3)
+        for partial_comb in missing:
+            self.assertEqual(list(partial_comb.keys()), [CMAKE, UBUNTU])
+
+    def test_invalid_arguments(self):
+        for strength, parameters in [
+            (1, None),
+            (4, None),
+            (3, [CMAKE, BOOST]),
+            (2, [CXX_STANDARD]),
+        ]:
+            with self.assertRaises(ValueError):
+                get_missing_parameter_value_tuples(
+                    [], self.param_matrix, lambda _: True, strength, parameters
+                )
+
+
+class TestMixedStrengthGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.param_matrix: ParameterValueMatrix = OrderedDict()
+        cls.param_matrix[HOST_COMPILER] = parse_param_vals(
+            [(GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[DEVICE_COMPILER] = parse_param_vals(
+            [(NVCC, 11.2), (NVCC, 12.0), (GCC, 10), (GCC, 11), (GCC, 12), (CLANG, 16), (CLANG, 17)]
+        )
+        cls.param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        cls.param_matrix[ALPAKA_ACC_GPU_CUDA_ENABLE] = parse_param_vals(
+            [
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 11.2),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.0),
+            ]
+        )
+        cls.param_matrix[CXX_STANDARD] = parse_param_vals([(CXX_STANDARD, 17), (CXX_STANDARD, 20)])
+        cls.param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        cls.param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82), (BOOST, 1.83)])
+
+        cls.version_relation = VersionRelation()
+        cls.runtime_infos = get_runtime_infos(cls.param_matrix, cls.version_relation)
+        cls.filter_chain = get_default_filter_chain(
+            cls.version_relation, runtime_infos=cls.runtime_infos
+        )
+        cls.expected_pairs, _ = get_expected_bashi_parameter_value_pairs(
+            cls.param_matrix, cls.version_relation, cls.runtime_infos
+        )
+        cls.strength_parameters = [
+            HOST_COMPILER,
+            DEVICE_COMPILER,
+            ALPAKA_ACC_GPU_CUDA_ENABLE,
+            CXX_STANDARD,
+        ]
+
+    def check_combination_list(self, comb_list, strength_parameters):
+        for comb in comb_list:
+            self.assertEqual(list(comb.keys()), list(self.param_matrix.keys()))
+            self.assertTrue(self.filter_chain(comb), f"{comb} does not pass the filter chain")
+        self.assertTrue(
+            check_parameter_value_pair_in_combination_list(comb_list, self.expected_pairs)
+        )
+        self.assertEqual(
+            get_missing_parameter_value_tuples(
+                comb_list, self.param_matrix, self.filter_chain, 3, strength_parameters
+            ),
+            [],
+        )
+
+    def test_mixed_strength(self):
+        comb_list = generate_mixed_strength_combination_list(
+            self.param_matrix,
+            self.version_relation,
+            self.runtime_infos,
+            strength_parameters=self.strength_parameters,
+        )
+        self.check_combination_list(comb_list, self.strength_parameters)
+
+        # the pairwise combination-list misses triples of the strength parameters
+        pairwise = generate_combination_list(
+            self.param_matrix, self.version_relation, self.runtime_infos
+        )
+        self.assertNotEqual(
+            get_missing_parameter_value_tuples(
+                pairwise, self.param_matrix, self.filter_chain, 3, self.strength_parameters
+            ),
+            [],
+        )
+        self.assertGreater(len(comb_list), len(pairwise))
+
+    def test_full_strength(self):
+        param_matrix: ParameterValueMatrix = OrderedDict(
+            (parameter, self.param_matrix[parameter])
+            for parameter in [HOST_COMPILER, DEVICE_COMPILER, CXX_STANDARD, CMAKE]
+        )
+        comb_list = generate_mixed_strength_combination_list(
+            param_matrix, self.version_relation, self.runtime_infos
+        )
+        for comb in comb_list:
+            self.assertTrue(self.filter_chain(comb))
+        self.assertEqual(
+            get_missing_parameter_value_tuples(comb_list, param_matrix, self.filter_chain), []
+        )
+
+    def test_invalid_strength_parameters(self):
+        for strength, strength_parameters in [
+            (1, None),
+            (3, [HOST_COMPILER, DEVICE_COMPILER]),
+            (2, [HOST_COMPILER, UBUNTU]),
+        ]:
+            with self.assertRaises(ValueError):
+                generate_mixed_strength_combination_list(
+                    self.param_matrix,
+                    self.version_relation,
+                    self.runtime_infos,
+                    strength,
+                    strength_parameters,
+                )
+
+    def test_full_strength_too_many_tuples(self):
+        param_matrix = get_parameter_value_matrix()
+        with self.assertRaisesRegex(ValueError, "choose a subset of strength parameters"):
+            generate_mixed_strength_combination_list(
+                param_matrix,
+                self.version_relation,
+                get_runtime_infos(param_matrix, self.version_relation),
+            )
+
+
+class NotCompletableFilter(FilterBase):
+    def __init__(
+        self,
+        runtime_infos: Dict[str, Callable[..., bool]] | None = None,
+        output: IO[str] | None = None,
+    ):
+        super().__init__(runtime_infos, VersionRelation(), output)
+
+    def __call__(self, row: BashiRow) -> bool:
+        if ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE not in row:
+            return True
+        versions = tuple(
+            str(row[parameter].version) for parameter in (CMAKE, BOOST, UBUNTU, CXX_STANDARD)
+        )
+        # the triple cannot be completed
+        if versions[:3] == ("3.22", "1.81", "20.4"):
+            return False
+        # the 4-tuple cannot be completed, but each of its triples
+        return versions != ("3.23", "1.82", "22.4", "20")
+
+
+class TestNotCompletableTuples(unittest.TestCase):
+    def test_dropped_combinations(self):
+        # covertable completes the rows in the order of the parameters, if the backend comes last,
+        # the pairwise pass runs into a dead end
+        param_matrix: ParameterValueMatrix = OrderedDict()
+        param_matrix[ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE] = parse_param_vals(
+            [(ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, OFF), (ALPAKA_ACC_CPU_B_SEQ_T_SEQ_ENABLE, ON)]
+        )
+        param_matrix[CMAKE] = parse_param_vals([(CMAKE, 3.22), (CMAKE, 3.23)])
+        param_matrix[BOOST] = parse_param_vals([(BOOST, 1.81), (BOOST, 1.82)])
+        param_matrix[UBUNTU] = parse_param_vals([(UBUNTU, 20.04), (UBUNTU, 22.04)])
+        param_matrix[CXX_STANDARD] = parse_param_vals([(CXX_STANDARD, 17), (CXX_STANDARD, 20)])
+        strength_parameters = [CMAKE, BOOST, UBUNTU, CXX_STANDARD]
+        version_relation = VersionRelation()
+        runtime_infos = get_runtime_infos(param_matrix, version_relation)
+        filter_chain = get_default_filter_chain(
+            version_relation, runtime_infos=runtime_infos, custom_filter=NotCompletableFilter()
+        )
+
+        uncovered_tuples = []
+        comb_list = generate_mixed_strength_combination_list(
+            param_matrix,
+            version_relation,
+            runtime_infos,
+            strength_parameters=strength_parameters,
+            custom_filter=NotCompletableFilter(),
+            uncovered_tuples=uncovered_tuples,
+        )
+        for comb in comb_list:
+            self.assertTrue(filter_chain(comb), f"{comb} does not pass the filter chain")
+        not_completable = parse_combination([(CMAKE, 3.22), (BOOST, 1.81), (UBUNTU, 20.04)])
+        self.assertEqual(uncovered_tuples, [not_completable])
+        self.assertEqual(
+            get_missing_parameter_value_tuples(
+                comb_list, param_matrix, filter_chain, 3, strength_parameters
+            ),
+            [not_completable],
+        )
@@ -0,0 +1,40 @@
+# pylint: disable=missing-docstring
+import unittest
+from typing import List
+from typeguard import TypeCheckError
+from bashi.typechecking import lazy_typechecked
+from bashi.version.utils import is_supported_version
+
+
+@lazy_typechecked
+def get_length(values: List[int]) -> int:
+    return len(values)
+
+
+class Counter:
+    def __init__(self):
+        self.number = 0
+
+    @lazy_typechecked
+    def add(self, number: int) -> int:
+        self.number += number
+        return self.number
+
+
+class TestLazyTypechecked(unittest.TestCase):
+    def test_function(self):
+        self.assertEqual(get_length([1, 2]), 2)
+        self.assertEqual(get_length.__name__, "get_length")
+        with self.assertRaises(TypeCheckError):
+            get_length((1, 2))  # type: ignore
+
+    def test_method(self):
+        counter = Counter()
+        self.assertEqual(counter.add(2), 2)
+        self.assertEqual(counter.add(3), 5)
+        with self.assertRaises(TypeCheckError):
+            counter.add("1")  # type: ignore
+
+    def test_bashi_function(self):
+        with self.assertRaises(TypeCheckError):
+            is_supported_version("gcc", "12")  # type: ignore
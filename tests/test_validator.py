@@ -1,9 +1,22 @@
 # pylint: disable=missing-docstring
 import sys
 import os
+import io
+import json
+import contextlib
+import shlex
+import tempfile
 import unittest
 from bashi import VersionRelation
 import bashiValidate
+from bashiValidate.batch import read_batch_rows, BatchRow, BatchFormatError
+from bashiValidate.combination_list import check_combination_list
+from bashiValidate.verdict import Verdict
+from bashiValidate.arguments import get_builtin_argument_aliases, get_default_software_versions
+from bashi.row import BashiRow
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.utils import parse_combination
+from bashi.serialization import write_combination_list
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "example"))
 from example.validate import main as validator_main
@@ -61,3 +74,393 @@ class TestExampleValidator(unittest.TestCase):
                 True,
             )
         )
+
+
+class TestReadBatchRows(unittest.TestCase):
+    def test_args_format(self):
+        batch_input = io.StringIO(
+            "# comment\n--host-compiler gcc@11 --ubuntu 22.04\n\n--cxx 17 # trailing comment\n"
+        )
+        self.assertEqual(
+            list(read_batch_rows(batch_input, "args")),
+            [
+                BatchRow(2, ["--host-compiler", "gcc@11", "--ubuntu", "22.04"]),
+                BatchRow(4, ["--cxx", "17"]),
+            ],
+        )
+
+    def test_jsonl_format(self):
+        batch_input = io.StringIO(
+            '{"host-compiler": "gcc@11", "--ubuntu": 22.04}\n'
+            "\n"
+            '{"alpaka_ACC_CPU_B_OMP2_T_SEQ_ENABLE": true, "cmake": null}\n'
+        )
+        self.assertEqual(
+            list(read_batch_rows(batch_input, "jsonl")),
+            [
+                BatchRow(1, ["--host-compiler", "gcc@11", "--ubuntu", "22.04"]),
+                BatchRow(3, ["--alpaka_ACC_CPU_B_OMP2_T_SEQ_ENABLE", "ON"]),
+            ],
+        )
+
+        with self.assertRaises(BatchFormatError):
+            list(read_batch_rows(io.StringIO("[1, 2]\n"), "jsonl"))
+        with self.assertRaises(BatchFormatError):
+            list(read_batch_rows(io.StringIO("{\n"), "jsonl"))
+
+    def test_csv_format(self):
+        batch_input = io.StringIO("host-compiler, ubuntu\ngcc@11, 22.04\nclang@16,\n")
+        self.assertEqual(
+            list(read_batch_rows(batch_input, "csv")),
+            [
+                BatchRow(2, ["--host-compiler", "gcc@11", "--ubuntu", "22.04"]),
+                BatchRow(3, ["--host-compiler", "clang@16"]),
+            ],
+        )
+
+        with self.assertRaises(BatchFormatError):
+            list(read_batch_rows(io.StringIO("ubuntu\n22.04,gcc@11\n"), "csv"))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            read_batch_rows(io.StringIO(""), "yaml")
+
+
+class TestBashiValidateBatch(unittest.TestCase):
+    def setUp(self):
+        self.version_relation = VersionRelation()
+        self.valid_row = (
+            "--host-compiler gcc@11 --device-compiler nvcc@12.4 "
+            "--alpaka_ACC_GPU_CUDA_ENABLE 12.4 --alpaka_ACC_CPU_B_OMP2_T_SEQ_ENABLE ON\n"
+        )
+        self.invalid_row = "--host-compiler gcc@12 --device-compiler gcc@11\n"
+
+    def test_validate_batch(self):
+        validator = bashiValidate.Validator(self.version_relation, silent=True)
+        self.assertTrue(validator.validate_batch(io.StringIO(self.valid_row * 3)))
+        self.assertFalse(validator.validate_batch(io.StringIO(self.valid_row + self.invalid_row)))
+        self.assertTrue(validator.validate_batch(io.StringIO("")))
+
+    def test_invalid_row_does_not_stop_batch(self):
+        validator = bashiValidate.Validator(self.version_relation, silent=True)
+        output = io.StringIO()
+        sys.stdout, stdout = output, sys.stdout
+        try:
+            self.assertFalse(
+                validator.validate_batch(
+                    io.StringIO("--host-compiler gcc11\n" + self.valid_row + self.invalid_row)
+                )
+            )
+        finally:
+            sys.stdout = stdout
+
+    def test_batch_argument(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            batch_path = os.path.join(tmp_dir, "rows.txt")
+            with open(batch_path, "w", encoding="utf-8") as batch_file:
+                batch_file.write(self.valid_row * 2)
+
+            validator = bashiValidate.Validator(
+                self.version_relation, args=["--batch", batch_path], silent=True
+            )
+            self.assertTrue(validator.validate())
+
+            with open(batch_path, "a", encoding="utf-8") as batch_file:
+                batch_file.write(self.invalid_row)
+            self.assertFalse(validator.validate())
+
+    def test_default_arguments_for_rows(self):
+        # the C++ standard is set for all rows, nvcc 12.4 does not support C++ 23
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            batch_path = os.path.join(tmp_dir, "rows.jsonl")
+            with open(batch_path, "w", encoding="utf-8") as batch_file:
+                batch_file.write('{"device-compiler": "nvcc@12.4"}\n')
+
+            for cxx, expected in (("17", True), ("23", False)):
+                validator = bashiValidate.Validator(
+                    self.version_relation,
+                    args=["--batch", batch_path, "--batch-format", "jsonl", "--cxx", cxx],
+                    silent=True,
+                )
+                self.assertEqual(validator.validate(), expected, cxx)
+
+    def test_software_versions_per_row(self):
+        rows = [
+            "--host-compiler gcc@12 --ubuntu 20.04 --ver-ubuntu 20.04",
+            # without nvcc versions there is no runtime info for the CUDA SDK Ubuntu versions,
+            # the runtime info of the previous row must not be used
+            "--host-compiler clang-cuda@17 --device-compiler clang-cuda@17 --ubuntu 24.04 "
+            "--ver-nvcc",
+            "--host-compiler gcc@12 --ubuntu 24.04 --ver-ubuntu 20.04",
+            "--host-compiler clang-cuda@17 --device-compiler clang-cuda@17 --ubuntu 24.04",
+        ]
+        validator = bashiValidate.Validator(self.version_relation, silent=True)
+        for row in rows:
+            with contextlib.redirect_stdout(io.StringIO()):
+                batch_result = validator.validate_batch(io.StringIO(row + "\n"))
+                fresh_result = bashiValidate.Validator(
+                    self.version_relation, args=shlex.split(row), silent=True
+                ).validate()
+            self.assertEqual(batch_result, fresh_result, row)
+
+    def test_row_order_is_reset(self):
+        validator = bashiValidate.Validator(self.version_relation, silent=True)
+        validator.validate_batch(io.StringIO(self.valid_row + "--ubuntu 22.04\n"))
+        self.assertEqual(validator.param_order, ["--ubuntu"])
+
+
+class TestBashiValidateCombinationList(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.version_relation = VersionRelation()
+        valid_comb = parse_combination(
+            [
+                (HOST_COMPILER, GCC, 11),
+                (DEVICE_COMPILER, NVCC, 12.4),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4),
+                (UBUNTU, "24.04"),
+            ]
+        )
+        invalid_comb = parse_combination(
+            [
+                (HOST_COMPILER, GCC, 12),
+                (DEVICE_COMPILER, GCC, 11),
+                (ALPAKA_ACC_GPU_CUDA_ENABLE, OFF),
+                (UBUNTU, "24.04"),
+            ]
+        )
+        cls.comb_list = [valid_comb] * 20 + [invalid_comb] + [valid_comb] * 20 + [invalid_comb]
+
+    def test_check_combination_list(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        # runtime infos are created by validate_combination_list()
+        self.assertFalse(validator.validate_combination_list(self.comb_list, jobs=1))
+
+        for jobs in (1, 2, 8):
+            failed = check_combination_list(validator.filter_stages, self.comb_list, jobs)
+            self.assertEqual([failed_comb.index for failed_comb in failed], [20, 41], jobs)
+            self.assertEqual(len(failed[0].reasons), 1)
+            self.assertEqual(failed[0].reasons[0][0], "CompilerFilter")
+            self.assertIn(
+                "host and device compiler version must be the same", failed[0].reasons[0][1]
+            )
+
+        self.assertEqual(check_combination_list(validator.filter_stages, [], 4), [])
+
+    def test_combination_list_argument(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            comb_list_path = os.path.join(tmp_dir, "combination-list.json")
+            for comb_list, expected in ((self.comb_list[:20], True), (self.comb_list, False)):
+                with open(comb_list_path, "w", encoding="utf-8") as comb_list_file:
+                    write_combination_list(comb_list, comb_list_file)
+                validator = bashiValidate.Validator(
+                    self.version_relation,
+                    args=["--combination-list", comb_list_path, "--jobs", "2"],
+                    silent=True,
+                )
+                self.assertEqual(validator.validate(), expected)
+
+
+class TestValidatorCheck(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.version_relation = VersionRelation()
+        cls.valid_row = BashiRow(
+            parse_combination(
+                [
+                    (HOST_COMPILER, GCC, 11),
+                    (DEVICE_COMPILER, NVCC, 12.4),
+                    (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4),
+                ]
+            )
+        )
+        cls.invalid_row = BashiRow(
+            parse_combination(
+                [(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, GCC, 11), (UBUNTU, "16.04")]
+            )
+        )
+
+    def test_check(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        verdict = validator.check(self.valid_row)
+        self.assertIsInstance(verdict, Verdict)
+        self.assertTrue(verdict)
+        self.assertEqual(verdict.reasons, [])
+
+        verdict = validator.check(self.invalid_row)
+        self.assertFalse(verdict)
+        self.assertFalse(verdict.passed)
+        self.assertEqual(verdict.reasons[0][0], "CompilerFilter")
+        self.assertIn("host and device compiler version must be the same", verdict.reasons[0][1])
+
+        # plain combinations are converted to BashiRow
+        self.assertTrue(validator.check(parse_combination([(HOST_COMPILER, GCC, 11)])))
+
+    def test_fail_fast(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        cuda_row = BashiRow(
+            parse_combination(
+                [
+                    (HOST_COMPILER, GCC, 12),
+                    (DEVICE_COMPILER, GCC, 11),
+                    (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4),
+                    (ALPAKA_ACC_GPU_HIP_ENABLE, ON),
+                ]
+            )
+        )
+        self.assertGreater(len(validator.check(cuda_row).reasons), 1)
+        self.assertEqual(len(validator.check(cuda_row, fail_fast=True).reasons), 1)
+
+    def test_reason_buffers_are_reused(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        validator.check(self.invalid_row)
+        buffers = [filter_stage.output for filter_stage in validator.filter_stages]
+        first_reasons = validator.check(self.invalid_row).reasons
+        self.assertEqual(validator.check(self.invalid_row).reasons, first_reasons)
+        self.assertEqual([filter_stage.output for filter_stage in validator.filter_stages], buffers)
+        for buffer, filter_stage in zip(buffers, validator.filter_stages):
+            self.assertIs(filter_stage.output, buffer)
+
+        # old reasons do not leak into the next check
+        self.assertEqual(validator.check(self.valid_row).reasons, [])
+
+    def test_runtime_infos_are_cached(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        validator.set_software_versions()
+        default_runtime_infos = validator.runtime_infos
+
+        validator.set_software_versions({"nvcc": ["12.4"], "ubuntu": ["24.04"]})
+        self.assertIsNot(validator.runtime_infos, default_runtime_infos)
+        for filter_stage in validator.filter_stages:
+            self.assertIs(filter_stage.runtime_infos, validator.runtime_infos)
+
+        validator.set_software_versions()
+        self.assertIs(validator.runtime_infos, default_runtime_infos)
+
+        # get_row() uses the same cache for the default software versions
+        validator.args = ["--ubuntu", "20.04"]
+        validator.get_row()
+        self.assertIs(validator.runtime_infos, default_runtime_infos)
+
+    def test_custom_runtime_info(self):
+        validator = bashiValidate.Validator(self.version_relation, args=[], silent=True)
+        validator.check(self.valid_row)
+
+        def custom_info() -> bool:
+            return True
+
+        validator.add_custom_runtime_info_function("custom_info", custom_info)
+        validator.check(self.valid_row)
+        self.assertIs(validator.filter_stages[0].runtime_infos["custom_info"], custom_info)
+
+
+class TestBashiValidateJsonLines(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.version_relation = VersionRelation()
+        cls.valid_args = [
+            "--host-compiler",
+            "gcc@11",
+            "--device-compiler",
+            "nvcc@12.4",
+            "--alpaka_ACC_GPU_CUDA_ENABLE",
+            "12.4",
+        ]
+        cls.invalid_args = ["--host-compiler", "gcc@12", "--device-compiler", "gcc@11"]
+
+    def validate(self, args, stdin=""):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            sys.stdin, old_stdin = io.StringIO(stdin), sys.stdin
+            try:
+                validator = bashiValidate.Validator(
+                    self.version_relation, args=args + ["--format", "jsonl"]
+                )
+                result = validator.validate()
+            finally:
+                sys.stdin = old_stdin
+        return result, [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_single_row(self):
+        result, records = self.validate(self.valid_args)
+        self.assertTrue(result)
+        self.assertEqual(len(records), 1)
+        self.assertTrue(records[0]["passed"])
+        self.assertEqual(records[0]["row"][HOST_COMPILER], [GCC, "11"])
+        self.assertEqual(
+            records[0]["filters"],
+            {"CompilerFilter": True, "BackendFilter": True, "SoftwareDependencyFilter": True},
+        )
+        self.assertEqual(records[0]["reasons"], {})
+
+        result, records = self.validate(self.invalid_args + ["--ubuntu", "16.04"])
+        self.assertFalse(result)
+        self.assertEqual(len(records), 1)
+        self.assertFalse(records[0]["passed"])
+        self.assertFalse(records[0]["filters"]["CompilerFilter"])
+        self.assertIn(
+            "host and device compiler version must be the same",
+            records[0]["reasons"]["CompilerFilter"],
+        )
+        self.assertEqual(records[0]["warnings"], ["ubuntu 16.4 is not officially supported."])
+
+    def test_no_color_codes(self):
+        _, records = self.validate(self.invalid_args)
+        self.assertNotIn("\x1b[", json.dumps(records))
+
+    def test_batch(self):
+        batch_input = (
+            " ".join(self.valid_args)
+            + "\n--host-compiler gcc11\n"
+            + " ".join(self.invalid_args)
+            + "\n"
+        )
+        result, records = self.validate(["--batch", "-"], batch_input)
+        self.assertFalse(result)
+        # no summary line
+        self.assertEqual([record["line"] for record in records], [1, 2, 3])
+        self.assertEqual([record["passed"] for record in records], [True, False, False])
+        self.assertEqual(records[1]["args"], ["--host-compiler", "gcc11"])
+        self.assertIn("@ is missing", records[1]["error"])
+        self.assertIn("CompilerFilter", records[2]["reasons"])
+
+    def test_combination_list(self):
+        comb_list = [
+            parse_combination(
+                [
+                    (HOST_COMPILER, GCC, 11),
+                    (DEVICE_COMPILER, NVCC, 12.4),
+                    (ALPAKA_ACC_GPU_CUDA_ENABLE, 12.4),
+                    (UBUNTU, "24.04"),
+                ]
+            ),
+            parse_combination([(HOST_COMPILER, GCC, 12), (DEVICE_COMPILER, GCC, 11)]),
+        ]
+        comb_list_file = io.StringIO()
+        write_combination_list(comb_list, comb_list_file)
+        result, records = self.validate(
+            ["--combination-list", "-", "--jobs", "1"], comb_list_file.getvalue()
+        )
+        self.assertFalse(result)
+        self.assertEqual([record["index"] for record in records], [0, 1])
+        self.assertEqual([record["passed"] for record in records], [True, False])
+        self.assertEqual(list(records[1]["reasons"].keys()), ["CompilerFilter"])
+
+
+class TestCachedArgumentTables(unittest.TestCase):
+    def test_builtin_aliases_are_not_modified(self):
+        builtin_aliases = get_builtin_argument_aliases()
+        self.assertIs(builtin_aliases, get_builtin_argument_aliases())
+        self.assertEqual(builtin_aliases["host_compiler"].parameter, HOST_COMPILER)
+        self.assertEqual(builtin_aliases["cxx"].parameter, CXX_STANDARD)
+
+        validator = bashiValidate.Validator(VersionRelation(), silent=True)
+        validator.add_software_version_parameter("mdspan", "mdspan version")
+        self.assertIn("mdspan", validator.argument_alias)
+        self.assertNotIn("mdspan", get_builtin_argument_aliases())
+        self.assertNotIn("mdspan", bashiValidate.Validator(VersionRelation()).argument_alias)
+
+    def test_default_software_versions_are_copied(self):
+        args = bashiValidate.Validator(VersionRelation(), silent=True)._parse_args([])
+        args.ver_gcc.clear()
+        self.assertNotEqual(get_default_software_versions()[GCC], [])
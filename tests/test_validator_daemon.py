@@ -0,0 +1,184 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+import os
+import socket
+import stat
+import tempfile
+import threading
+import contextlib
+from bashi import VersionRelation
+import bashiValidate
+from bashiValidate.daemon import ValidatorDaemon, request_daemon
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class TestValidatorDaemon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.version_relation = VersionRelation()
+        cls.valid_args = [
+            "--host-compiler",
+            "gcc@11",
+            "--device-compiler",
+            "nvcc@12.4",
+            "--alpaka_ACC_GPU_CUDA_ENABLE",
+            "12.4",
+        ]
+        cls.invalid_args = ["--host-compiler", "gcc@12", "--device-compiler", "gcc@11"]
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp_dir.name, "bashi-validate.sock")
+        self.daemon = ValidatorDaemon(
+            self.socket_path, bashiValidate.Validator(self.version_relation, args=[])
+        )
+        self.thread = threading.Thread(target=self.daemon.serve_until_shutdown)
+        self.thread.start()
+
+    def tearDown(self):
+        if not self.daemon.stop_requested:
+            request_daemon({"command": "shutdown"}, self.socket_path)
+        self.thread.join()
+        self.daemon.server_close()
+        self.tmp_dir.cleanup()
+
+    def validate_in_process(self, args):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            validator = bashiValidate.Validator(self.version_relation, args=args)
+            exit_code = int(not validator.validate())
+        return exit_code, stdout.getvalue()
+
+    def test_ping(self):
+        self.assertEqual(request_daemon({"command": "ping"}, self.socket_path), {"exit_code": 0})
+
+    def test_socket_access_rights(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+        # the umask of the process is restored
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertNotEqual(umask, 0o177)
+
+    def test_same_result_as_cli(self):
+        for args in (self.valid_args, self.invalid_args):
+            response = request_daemon({"command": "validate", "args": args}, self.socket_path)
+            assert response is not None
+            exit_code, stdout = self.validate_in_process(args)
+            self.assertEqual(response["exit_code"], exit_code, args)
+            self.assertEqual(response["stdout"], stdout, args)
+
+        self.assertEqual(
+            request_daemon({"args": self.invalid_args}, self.socket_path)["exit_code"],  # type: ignore
+            1,
+        )
+
+    def test_different_software_versions(self):
+        for args in (
+            ["--host-compiler", "gcc@12", "--ubuntu", "20.04", "--ver-ubuntu", "20.04"],
+            # the runtime infos of the previous request must not be used
+            [
+                "--host-compiler",
+                "clang-cuda@17",
+                "--device-compiler",
+                "clang-cuda@17",
+                "--ubuntu",
+                "24.04",
+                "--ver-nvcc",
+            ],
+        ):
+            response = request_daemon({"command": "validate", "args": args}, self.socket_path)
+            assert response is not None
+            exit_code, stdout = self.validate_in_process(args)
+            self.assertEqual(response["exit_code"], exit_code, args)
+            self.assertEqual(response["stdout"], stdout, args)
+
+    def test_invalid_arguments(self):
+        response = request_daemon({"args": ["--host-compiler", "gcc11"]}, self.socket_path)
+        assert response is not None
+        self.assertEqual(response["exit_code"], 1)
+        self.assertIn("@ is missing", response["stdout"])
+
+        response = request_daemon({"args": ["--unknown-argument"]}, self.socket_path)
+        assert response is not None
+        self.assertEqual(response["exit_code"], 2)
+        self.assertIn("unrecognized arguments", response["stderr"])
+
+        # the daemon is still alive
+        self.assertEqual(request_daemon({"command": "ping"}, self.socket_path), {"exit_code": 0})
+
+    def test_invalid_request(self):
+        for request in ({"command": "unknown"}, {"args": "--ubuntu 20.04"}):
+            response = request_daemon(request, self.socket_path)
+            assert response is not None
+            self.assertEqual(response["exit_code"], 1)
+            self.assertIn("invalid request", response["stderr"])
+
+    def test_batch_from_stdin_and_file(self):
+        batch_input = " ".join(self.valid_args) + "\n" + " ".join(self.invalid_args) + "\n"
+        response = request_daemon(
+            {"args": ["--batch", "-"], "stdin": batch_input}, self.socket_path
+        )
+        assert response is not None
+        self.assertEqual(response["exit_code"], 1)
+        self.assertIn("1/2 rows passed", response["stdout"])
+
+        # relative paths are resolved with the working directory of the client
+        with open(os.path.join(self.tmp_dir.name, "rows.txt"), "w", encoding="utf-8") as rows:
+            rows.write(" ".join(self.valid_args) + "\n")
+        response = request_daemon(
+            {"args": ["--batch", "rows.txt"], "cwd": self.tmp_dir.name}, self.socket_path
+        )
+        assert response is not None
+        self.assertEqual(response["exit_code"], 0)
+        self.assertIn("1/1 rows passed", response["stdout"])
+
+    def test_shutdown(self):
+        self.assertEqual(
+            request_daemon({"command": "shutdown"}, self.socket_path), {"exit_code": 0}
+        )
+        self.thread.join()
+        self.assertTrue(self.daemon.stop_requested)
+
+    def test_second_daemon_on_same_socket(self):
+        with self.assertRaises(RuntimeError):
+            ValidatorDaemon(self.socket_path, bashiValidate.Validator(self.version_relation))
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class TestNoValidatorDaemon(unittest.TestCase):
+    def test_no_daemon_running(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "bashi-validate.sock")
+            self.assertIsNone(request_daemon({"command": "ping"}, socket_path))
+
+            # stale socket file of a daemon, which is not running anymore
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+                stale_socket.bind(socket_path)
+            self.assertIsNone(request_daemon({"command": "ping"}, socket_path))
+            daemon = ValidatorDaemon(
+                socket_path, bashiValidate.Validator(VersionRelation(), args=[])
+            )
+            daemon.server_close()
+
+    def test_path_is_not_a_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "file")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write("content")
+            with self.assertRaises(RuntimeError):
+                ValidatorDaemon(file_path, bashiValidate.Validator(VersionRelation(), args=[]))
+            # the file is not removed
+            with open(file_path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), "content")
+
+    def test_socket_not_usable(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "file")
+            with open(file_path, "w", encoding="utf-8"):
+                pass
+            # NotADirectoryError
+            self.assertIsNone(request_daemon({"command": "ping"}, os.path.join(file_path, "s")))
+            # the path is too long for a Unix domain socket
+            self.assertIsNone(request_daemon({"command": "ping"}, os.path.join(tmp_dir, "s" * 200)))
@@ -0,0 +1,120 @@
+# pylint: disable=missing-docstring
+import unittest
+import io
+from array import array
+from collections import OrderedDict
+from bashi.types import ParameterValue, ParameterValueSingle, CombinationList
+from bashi.globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from bashi.value_registry import ParameterValueRegistry, CompactRow, get_covered_id_pairs
+from bashi.version.utils import get_parameter_value_matrix
+from bashi.utils import (
+    parse_combination,
+    check_parameter_value_pair_in_combination_list,
+    check_unexpected_parameter_value_pair_in_combination_list,
+)
+from utils_test import parse_param_val, parse_expected_val_pairs
+
+
+class TestParameterValueRegistry(unittest.TestCase):
+    def setUp(self):
+        self.comb = parse_combination(
+            [
+                (HOST_COMPILER, GCC, 10),
+                (DEVICE_COMPILER, NVCC, 12.0),
+                (UBUNTU, "20.04"),
+                (CMAKE, 3.22),
+            ]
+        )
+
+    def test_dense_ids(self):
+        registry = ParameterValueRegistry()
+        self.assertEqual(len(registry), 0)
+        self.assertEqual(registry.register(HOST_COMPILER, parse_param_val((GCC, 10))), 0)
+        self.assertEqual(registry.register(DEVICE_COMPILER, parse_param_val((GCC, 10))), 1)
+        self.assertEqual(registry.register(HOST_COMPILER, parse_param_val((GCC, 10))), 0)
+        self.assertEqual(registry.register(HOST_COMPILER, parse_param_val((CLANG, 16))), 2)
+        self.assertEqual(len(registry), 3)
+        self.assertEqual(registry.parameters, [HOST_COMPILER, DEVICE_COMPILER])
+        self.assertEqual(registry.get_parameter_index(2), 0)
+        self.assertEqual(
+            registry.get_value(1), ParameterValueSingle(DEVICE_COMPILER, parse_param_val((GCC, 10)))
+        )
+        self.assertIn((HOST_COMPILER, parse_param_val((CLANG, 16))), registry)
+
+        with self.assertRaises(KeyError):
+            registry.get_id(UBUNTU, parse_param_val((UBUNTU, 20.04)))
+
+    def test_register_parameter_value_matrix(self):
+        param_matrix = get_parameter_value_matrix()
+        registry = ParameterValueRegistry(param_matrix)
+        self.assertEqual(len(registry), sum(len(vals) for vals in param_matrix.values()))
+        self.assertEqual(registry.parameters, list(param_matrix.keys()))
+        self.assertEqual(registry.typecode, "H")
+
+    def test_round_trip(self):
+        registry = ParameterValueRegistry()
+        encoded = registry.encode_combination(self.comb)
+        self.assertIsInstance(encoded, array)
+        self.assertEqual(list(encoded), [0, 1, 2, 3])
+        decoded = registry.decode_combination(encoded)
+        self.assertEqual(decoded, self.comb)
+        self.assertEqual(list(decoded.keys()), list(self.comb.keys()))
+        self.assertEqual(registry.decode_combination(tuple(encoded)), self.comb)
+
+        comb_list: CombinationList = [self.comb, OrderedDict(reversed(self.comb.items()))]
+        self.assertEqual(
+            registry.decode_combination_list(registry.encode_combination_list(comb_list)),
+            comb_list,
+        )
+
+    def test_encode_without_register(self):
+        registry = ParameterValueRegistry()
+        with self.assertRaises(KeyError):
+            registry.encode_combination(self.comb, register=False)
+        self.assertEqual(len(registry), 0)
+
+    def test_compact_row(self):
+        registry = ParameterValueRegistry()
+        row = registry.view(registry.encode_combination(self.comb))
+        self.assertIsInstance(row, CompactRow)
+        self.assertEqual(len(row), 4)
+        self.assertEqual(list(row), list(self.comb.keys()))
+        self.assertEqual(
+            row[DEVICE_COMPILER], ParameterValue(NVCC, parse_param_val((NVCC, 12)).version)
+        )
+        self.assertIn(UBUNTU, row)
+        self.assertNotIn(BOOST, row)
+        self.assertEqual(row, self.comb)
+        self.assertEqual(row.to_combination(), self.comb)
+        with self.assertRaises(KeyError):
+            _ = row[BOOST]
+        with self.assertRaises(AttributeError):
+            row.new_attribute = 1  # type: ignore
+
+    def test_covered_id_pairs(self):
+        self.assertEqual(get_covered_id_pairs([(2, 0, 1)]), {(0, 1), (0, 2), (1, 2)})
+        self.assertEqual(get_covered_id_pairs([]), set())
+
+
+class TestCheckPairsWithRegistry(unittest.TestCase):
+    def test_unknown_parameter_value(self):
+        comb_list: CombinationList = [
+            parse_combination([(HOST_COMPILER, GCC, 10), (UBUNTU, "20.04")]),
+            parse_combination([(HOST_COMPILER, CLANG, 16), (UBUNTU, "22.04")]),
+        ]
+        pairs = parse_expected_val_pairs(
+            [
+                ((HOST_COMPILER, GCC, 10), (UBUNTU, "20.04")),
+                ((UBUNTU, "22.04"), (HOST_COMPILER, CLANG, 16)),
+            ]
+        )
+        missing = parse_expected_val_pairs([((HOST_COMPILER, GCC, 10), (UBUNTU, "24.04"))])
+        output = io.StringIO()
+        self.assertTrue(check_parameter_value_pair_in_combination_list(comb_list, pairs, output))
+        self.assertFalse(check_parameter_value_pair_in_combination_list(comb_list, missing, output))
+        self.assertTrue(
+            check_unexpected_parameter_value_pair_in_combination_list(comb_list, missing, output)
+        )
+        self.assertFalse(
+            check_unexpected_parameter_value_pair_in_combination_list(comb_list, pairs, output)
+        )